@@ -7,6 +7,7 @@ import { useCartStore } from '@/stores/cart';
 import BillingForm, { BillingData } from '@/components/checkout/BillingForm';
 import PaymentMethods from '@/components/checkout/PaymentMethods';
 import OrderSummary from '@/components/cart/OrderSummary';
+import { useIdempotencyKey } from '@/hooks/useIdempotencyKey';
 
 export const dynamic = 'force-dynamic';
 
@@ -19,6 +20,7 @@ export default function CheckoutPage() {
   const [billingData, setBillingData] = useState<BillingData | null>(null);
   const [paymentMethod, setPaymentMethod] = useState('eximbay');
   const [isProcessing, setIsProcessing] = useState(false);
+  const getIdempotencyKey = useIdempotencyKey();
 
   // Redirect if cart is empty
   if (items.length === 0) {
@@ -40,20 +42,22 @@ export default function CheckoutPage() {
     setIsProcessing(true);
 
     try {
-      // Step 1: Create order in WooCommerce
+      // Step 1: Create order in WooCommerce (resubmits reuse the same order)
+      const orderBody = JSON.stringify({
+        items: items.map(item => ({
+          id: item.productId,
+          quantity: item.quantity
+        })),
+        billing: billingData,
+        paymentMethod: paymentMethod
+      });
       const orderResponse = await fetch('/api/orders', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Idempotency-Key': getIdempotencyKey(orderBody),
         },
-        body: JSON.stringify({
-          items: items.map(item => ({
-            id: item.productId,
-            quantity: item.quantity
-          })),
-          billing: billingData,
-          paymentMethod: paymentMethod
-        }),
+        body: orderBody,
       });
 
       const orderData = await orderResponse.json();
@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { getJwtToken } from '@/lib/wordpress-auth';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -12,7 +13,7 @@ export const dynamic = 'force-dynamic';
  * Request body: { username: string, password: string }
  * Response: { success: true, token: string, user: { id, email, displayName } }
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming('auth/token', async function POST(request: Request) {
   try {
     const body = await request.json();
     const { username, password } = body;
@@ -66,4 +67,4 @@ export async function POST(request: Request) {
     console.error('[auth/token] JWT generation error:', error);
     return handleApiError(error, 'auth/token');
   }
-}
+});
@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { addCartItem } from '@/lib/cart-session';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -12,7 +13,7 @@ export const dynamic = 'force-dynamic';
  * Request body: { productId: number, quantity: number, variationId?: number }
  * Response: { success: true, cart: Cart }
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming('cart/add-item', async function POST(request: Request) {
   try {
     const body = await request.json();
     const { productId, quantity, variationId } = body;
@@ -74,4 +75,4 @@ export async function POST(request: Request) {
     console.error('[cart/add-item] Add item error:', error);
     return handleApiError(error, 'cart/add-item');
   }
-}
+});
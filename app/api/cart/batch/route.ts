@@ -0,0 +1,120 @@
+import { NextResponse } from 'next/server';
+import { applyCartMutations, type CartMutation } from '@/lib/cart-batch';
+import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic';
+
+// Upper bound on mutations accepted in one request
+const MAX_MUTATIONS = 100;
+
+/**
+ * Validate and normalize one mutation from the request body
+ */
+function parseMutation(raw: any): CartMutation | null {
+  if (raw?.op === 'clear') {
+    return { op: 'clear' };
+  }
+  if (
+    raw?.op === 'set' &&
+    Number.isInteger(raw.productId) &&
+    Number.isInteger(raw.quantity) &&
+    raw.quantity >= 0
+  ) {
+    return {
+      op: 'set',
+      productId: raw.productId,
+      quantity: raw.quantity,
+      variationId: Number.isInteger(raw.variationId) ? raw.variationId : undefined,
+    };
+  }
+  return null;
+}
+
+/**
+ * POST /api/cart/batch
+ * Apply several cart mutations in one request
+ *
+ * Mutations are coalesced (last quantity per product wins, clear discards
+ * earlier mutations) and applied to CoCart sequentially under a per-cart lock.
+ *
+ * Request body: { mutations: Array<{ op: 'set', productId: number, quantity: number, variationId?: number } | { op: 'clear' }> }
+ * Response: { success: true, cart: Cart, received: number, applied: number, failed: CartMutation[], upstreamCalls: number }
+ *
+ * If any mutation was not applied the response is 502 with `success: false`,
+ * the cart as it now stands and the `failed` mutations, so the client can retry them.
+ */
+export const POST = withServerTiming('cart/batch', async function POST(request: Request) {
+  try {
+    const body = await request.json();
+    const rawMutations = Array.isArray(body?.mutations) ? body.mutations : null;
+    const mutations = rawMutations?.map(parseMutation);
+
+    if (!mutations || mutations.length === 0 || mutations.length > MAX_MUTATIONS || mutations.includes(null)) {
+      return NextResponse.json(
+        {
+          success: false,
+          error: 'Validation failed',
+          message: `mutations must be a non-empty array (max ${MAX_MUTATIONS}) of set/clear operations`,
+          code: 'INVALID_INPUT'
+        },
+        { status: 400 }
+      );
+    }
+
+    // Extract cart key from cookies
+    const cartKey = request.headers.get('cookie')
+      ?.split('; ')
+      .find(row => row.startsWith('cart-key='))
+      ?.split('=')[1];
+
+    const result = await applyCartMutations(mutations as CartMutation[], cartKey);
+
+    if (!result.cart) {
+      return NextResponse.json(
+        {
+          success: false,
+          error: 'Failed to apply cart mutations',
+          message: 'CoCart API request failed',
+          code: 'CART_API_ERROR',
+          failed: result.failed
+        },
+        { status: 500 }
+      );
+    }
+
+    const partial = result.failed.length > 0;
+    const response = NextResponse.json(
+      {
+        success: !partial,
+        ...(partial && {
+          error: 'Some cart mutations were not applied',
+          code: 'CART_API_ERROR'
+        }),
+        cart: result.cart,
+        received: result.received,
+        applied: result.applied,
+        failed: result.failed,
+        upstreamCalls: result.upstreamCalls
+      },
+      { status: partial ? 502 : 200 }
+    );
+
+    // Persist a newly created cart key (same as /api/cart/add-item)
+    if (result.cart.cart_key && result.cart.cart_key !== cartKey) {
+      response.cookies.set('cart-key', result.cart.cart_key, {
+        httpOnly: false, // Client needs access to cart key
+        secure: process.env.NODE_ENV === 'production',
+        sameSite: 'lax',
+        maxAge: 60 * 60 * 24 * 30, // 30 days
+        path: '/'
+      });
+    }
+
+    return response;
+  } catch (error: any) {
+    console.error('[cart/batch] Batch mutation error:', error);
+    return handleApiError(error, 'cart/batch');
+  }
+});
@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { clearCart } from '@/lib/cart-session';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -11,7 +12,7 @@ export const dynamic = 'force-dynamic';
  *
  * Response: { success: true, cart: Cart }
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming('cart/clear', async function POST(request: Request) {
   try {
     // Extract cart key from cookies
     const cartKey = request.headers.get('cookie')
@@ -42,4 +43,4 @@ export async function POST(request: Request) {
     console.error('[cart/clear] Clear cart error:', error);
     return handleApiError(error, 'cart/clear');
   }
-}
+});
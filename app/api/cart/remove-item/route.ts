@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { removeCartItem } from '@/lib/cart-session';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -12,7 +13,7 @@ export const dynamic = 'force-dynamic';
  * Request body: { itemKey: string }
  * Response: { success: true, cart: Cart }
  */
-export async function DELETE(request: Request) {
+export const DELETE = withServerTiming('cart/remove-item', async function DELETE(request: Request) {
   try {
     const body = await request.json();
     const { itemKey } = body;
@@ -59,4 +60,4 @@ export async function DELETE(request: Request) {
     console.error('[cart/remove-item] Remove item error:', error);
     return handleApiError(error, 'cart/remove-item');
   }
-}
+});
@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { getCart } from '@/lib/cart-session';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -11,7 +12,7 @@ export const dynamic = 'force-dynamic';
  *
  * Response: { success: true, cart: Cart }
  */
-export async function GET(request: Request) {
+export const GET = withServerTiming('cart', async function GET(request: Request) {
   try {
     // Extract cart key from cookies
     const cartKey = request.headers.get('cookie')
@@ -50,4 +51,4 @@ export async function GET(request: Request) {
     console.error('[cart] Get cart error:', error);
     return handleApiError(error, 'cart');
   }
-}
+});
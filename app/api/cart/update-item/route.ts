@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
 import { updateCartItem } from '@/lib/cart-session';
 import { handleApiError } from '@/lib/api-error';
+import { withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -12,7 +13,7 @@ export const dynamic = 'force-dynamic';
  * Request body: { itemKey: string, quantity: number }
  * Response: { success: true, cart: Cart }
  */
-export async function PUT(request: Request) {
+export const PUT = withServerTiming('cart/update-item', async function PUT(request: Request) {
   try {
     const body = await request.json();
     const { itemKey, quantity } = body;
@@ -59,4 +60,4 @@ export async function PUT(request: Request) {
     console.error('[cart/update-item] Update item error:', error);
     return handleApiError(error, 'cart/update-item');
   }
-}
+});
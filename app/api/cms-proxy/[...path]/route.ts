@@ -1,5 +1,10 @@
 import { NextRequest, NextResponse } from 'next/server';
 import * as http from 'http';
+import { Readable } from 'stream';
+import type { ReadableStream as NodeReadableStream } from 'stream/web';
+import { getWordPressAgent, trackPooledRequest } from '@/lib/upstream-pool';
+import { createReplaceStream } from '@/lib/stream-rewrite';
+import { timeSpan, withServerTiming } from '@/lib/server-timing';
 
 const GABIA_IP = '182.162.142.102';
 const GABIA_PORT = 80;
@@ -35,18 +40,14 @@ async function proxyToWordPress(request: NextRequest) {
     reqHeaders['Referer'] = referer.replace(/\/api\/cms-proxy/g, '');
   }
 
-  let bodyBuf: ArrayBuffer | undefined;
-  if (request.method !== 'GET' && request.method !== 'HEAD') {
-    bodyBuf = await request.arrayBuffer();
-    reqHeaders['Content-Length'] = String(bodyBuf.byteLength);
-  }
+  // Stream request bodies (uploads, form posts) straight through to WordPress
+  const hasBody = request.method !== 'GET' && request.method !== 'HEAD' && request.body !== null;
+  const contentLength = request.headers.get('content-length');
+  if (hasBody && contentLength) reqHeaders['Content-Length'] = contentLength;
 
   try {
-    const result = await new Promise<{
-      status: number;
-      headers: http.IncomingHttpHeaders;
-      body: Buffer;
-    }>((resolve, reject) => {
+    // Resolve as soon as upstream headers arrive; the body is streamed below
+    const res = await timeSpan('upstream', () => new Promise<http.IncomingMessage>((resolve, reject) => {
       const req = http.request(
         {
           hostname: GABIA_IP,
@@ -54,32 +55,34 @@ async function proxyToWordPress(request: NextRequest) {
           path: fullPath,
           method: request.method,
           headers: reqHeaders,
+          agent: getWordPressAgent('http:'),
         },
-        (res) => {
-          const chunks: Buffer[] = [];
-          res.on('data', (chunk: Buffer) => chunks.push(chunk));
-          res.on('end', () => {
-            resolve({
-              status: res.statusCode || 500,
-              headers: res.headers,
-              body: Buffer.concat(chunks),
-            });
-          });
-        }
+        resolve
       );
+      trackPooledRequest(req);
       req.on('error', reject);
       req.setTimeout(30000, () => {
         req.destroy(new Error('Timeout'));
       });
-      if (bodyBuf) req.write(Buffer.from(bodyBuf));
-      req.end();
-    });
+      if (hasBody) {
+        Readable.fromWeb(request.body as unknown as NodeReadableStream)
+          .on('error', (err) => req.destroy(err))
+          .pipe(req);
+      } else {
+        req.end();
+      }
+    }));
+
+    const ct = res.headers['content-type'] || '';
+    const isHtml = typeof ct === 'string' && ct.includes('text/html');
 
     const outHeaders = new Headers();
-    for (const [key, value] of Object.entries(result.headers)) {
+    for (const [key, value] of Object.entries(res.headers)) {
       if (!value) continue;
       const lower = key.toLowerCase();
       if (['transfer-encoding', 'connection', 'keep-alive'].includes(lower)) continue;
+      // Rewritten HTML changes length; let the runtime chunk it
+      if (isHtml && lower === 'content-length') continue;
 
       const values = Array.isArray(value) ? value : [value];
       for (const v of values) {
@@ -95,19 +98,23 @@ async function proxyToWordPress(request: NextRequest) {
       }
     }
 
-    const ct = result.headers['content-type'] || '';
-    if (typeof ct === 'string' && ct.includes('text/html')) {
+    const status = res.statusCode || 500;
+    if (request.method === 'HEAD' || [204, 304].includes(status)) {
+      res.resume();
+      return new NextResponse(null, { status, headers: outHeaders });
+    }
+
+    const upstreamBody = Readable.toWeb(res) as unknown as ReadableStream<Uint8Array>;
+
+    if (isHtml) {
       // Rewrite http:// to https:// in HTML to prevent mixed content / insecure form warnings
-      const html = result.body
-        .toString('utf-8')
-        .replace(/http:\/\/82mobile\.com/g, 'https://82mobile.com');
-      return new NextResponse(html, { status: result.status, headers: outHeaders });
+      return new NextResponse(
+        upstreamBody.pipeThrough(createReplaceStream('http://82mobile.com', 'https://82mobile.com')),
+        { status, headers: outHeaders }
+      );
     }
 
-    return new NextResponse(result.body as unknown as BodyInit, {
-      status: result.status,
-      headers: outHeaders,
-    });
+    return new NextResponse(upstreamBody, { status, headers: outHeaders });
   } catch (error: unknown) {
     const msg = error instanceof Error ? error.message : 'Unknown error';
     console.error('[cms-proxy] Error:', msg);
@@ -115,11 +122,14 @@ async function proxyToWordPress(request: NextRequest) {
   }
 }
 
-export const GET = proxyToWordPress;
-export const POST = proxyToWordPress;
-export const PUT = proxyToWordPress;
-export const DELETE = proxyToWordPress;
-export const PATCH = proxyToWordPress;
+// Server-Timing: upstream = time to WordPress response headers (body is streamed)
+const handler = withServerTiming('cms-proxy', proxyToWordPress);
+
+export const GET = handler;
+export const POST = handler;
+export const PUT = handler;
+export const DELETE = handler;
+export const PATCH = handler;
 
 export const runtime = 'nodejs';
 export const dynamic = 'force-dynamic';
@@ -1,4 +1,5 @@
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/server-timing';
 
 export const dynamic = 'force-dynamic';
 
@@ -111,11 +112,11 @@ async function loginAndFix() {
   return log;
 }
 
-export async function GET() {
+export const GET = withServerTiming('fix-wc', async function GET() {
   try {
     const logs = await loginAndFix();
     return NextResponse.json({ success: true, logs });
   } catch (e: any) {
     return NextResponse.json({ success: false, error: e.toString() }, { status: 500 });
   }
-}
+});
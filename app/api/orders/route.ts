@@ -1,14 +1,37 @@
 import { NextResponse } from 'next/server';
-import { createOrder, getOrder } from '@/lib/woocommerce';
+import { getOrder } from '@/lib/woocommerce';
+import { createOrderIdempotent, isValidIdempotencyKey } from '@/lib/order-pipeline';
+import { withServerTiming } from '@/lib/server-timing';
+
+// Function time limit (seconds): covers the order pipeline's overall deadline
+// (ORDER_DEADLINE_MS, 25 s by default), which exceeds the platform default
+export const maxDuration = 30;
 
 /**
  * POST /api/orders
  * Create a new order in WooCommerce
+ *
+ * Send an `Idempotency-Key` header (e.g. a UUID per checkout attempt) so that
+ * resubmits return the same order instead of creating duplicates. Upstream
+ * calls have deadlines and are retried (see lib/order-pipeline.ts).
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming('orders', async function POST(request: Request) {
   try {
     const body = await request.json();
     const { items, billing, paymentMethod } = body;
+    const idempotencyKey = request.headers.get('idempotency-key') || body.idempotencyKey || null;
+
+    if (idempotencyKey && !isValidIdempotencyKey(idempotencyKey)) {
+      return NextResponse.json(
+        {
+          success: false,
+          error: 'Invalid idempotency key',
+          message: 'Idempotency-Key must be 8-128 characters of A-Z, a-z, 0-9, _ or -',
+          code: 'INVALID_IDEMPOTENCY_KEY'
+        },
+        { status: 400 }
+      );
+    }
 
     // Validate request
     if (!items || items.length === 0) {
@@ -69,25 +92,31 @@ export async function POST(request: Request) {
       ]
     };
 
-    const order = await createOrder(orderData);
+    const result = await createOrderIdempotent(orderData, idempotencyKey);
 
-    if (!order) {
+    if (!result.ok) {
       return NextResponse.json(
         {
           success: false,
-          error: 'Failed to create order'
+          error: 'Failed to create order',
+          message: result.message,
+          code: result.code
         },
-        { status: 500 }
+        { status: result.status }
       );
     }
 
+    const { order } = result;
     return NextResponse.json({
       success: true,
       orderId: order.id,
       orderNumber: order.number,
       total: order.total,
       currency: order.currency,
-      status: order.status
+      status: order.status,
+      replayed: result.replayed
+    }, {
+      headers: result.replayed ? { 'Idempotent-Replayed': 'true' } : undefined
     });
   } catch (error: any) {
     console.error('Error creating order:', error);
@@ -100,13 +129,13 @@ export async function POST(request: Request) {
       { status: 500 }
     );
   }
-}
+});
 
 /**
  * GET /api/orders?id={orderId}
  * Fetch order details from WooCommerce
  */
-export async function GET(request: Request) {
+export const GET = withServerTiming('orders', async function GET(request: Request) {
   try {
     const { searchParams } = new URL(request.url);
     const orderId = searchParams.get('id');
@@ -173,4 +202,4 @@ export async function GET(request: Request) {
       { status: 500 }
     );
   }
-}
+});
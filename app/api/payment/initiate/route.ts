@@ -1,5 +1,6 @@
 import { NextResponse } from 'next/server';
 import crypto from 'crypto';
+import { withServerTiming } from '@/lib/server-timing';
 
 /**
  * POST /api/payment/initiate
@@ -7,7 +8,7 @@ import crypto from 'crypto';
  *
  * Eximbay Documentation: https://www.eximbay.com/
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming('payment/initiate', async function POST(request: Request) {
   try {
     const body = await request.json();
     const { orderId, amount, currency, customerEmail, customerName } = body;
@@ -79,4 +80,4 @@ export async function POST(request: Request) {
       { status: 500 }
     );
   }
-}
+});
@@ -1,16 +1,32 @@
 import { NextResponse } from 'next/server';
 import type { NextRequest } from 'next/server';
 import crypto from 'crypto';
-import { updateOrderStatus } from '@/lib/woocommerce';
+import {
+  applyPaymentEvent,
+  enqueuePaymentEvent,
+  paymentEventId,
+} from '@/lib/payment-events';
+import { withServerTiming } from '@/lib/server-timing';
 
 /**
  * POST /api/payment/webhook
  * Handle payment callbacks from PortOne or Eximbay
  *
- * This endpoint receives payment results after transaction completion
- * and updates WooCommerce order status accordingly
+ * This endpoint receives payment results after transaction completion.
+ * The WooCommerce order status change is recorded (lib/payment-events.ts) and
+ * applied within a bounded deadline before the gateway is acknowledged. If it
+ * cannot be applied in time, the webhook answers 503 so the gateway retries.
+ * Repeated callbacks for an applied transaction are acknowledged as
+ * duplicates and not applied again.
  */
-export async function POST(request: NextRequest) {
+function statusNotApplied(orderId: number) {
+  return NextResponse.json(
+    { success: false, error: `Order ${orderId} status could not be updated, retry later` },
+    { status: 503 }
+  );
+}
+
+export const POST = withServerTiming('payment/webhook', async function POST(request: NextRequest) {
   try {
     const body = await request.json();
 
@@ -18,11 +34,6 @@ export async function POST(request: NextRequest) {
     const isPortOne = body.imp_uid !== undefined || body.merchant_uid !== undefined;
     const isEximbay = body.ref !== undefined && body.rescode !== undefined;
 
-    console.log('[Payment Webhook] Received callback:', {
-      provider: isPortOne ? 'PortOne' : isEximbay ? 'Eximbay' : 'Unknown',
-      body: JSON.stringify(body, null, 2)
-    });
-
     // Handle PortOne callback
     if (isPortOne) {
       const { imp_uid, merchant_uid, status } = body;
@@ -52,18 +63,22 @@ export async function POST(request: NextRequest) {
         newStatus = 'failed'; // Payment failed
       }
 
-      // Update order status in WooCommerce
-      try {
-        await updateOrderStatus(orderId, newStatus);
-        console.log(`[Payment Webhook] Updated order ${orderId} to ${newStatus}`);
-      } catch (updateError: any) {
-        console.error('[Payment Webhook] Failed to update order:', updateError);
+      // Record the status change and apply it before acknowledging
+      const { event, duplicate } = enqueuePaymentEvent({
+        id: paymentEventId('portone', imp_uid || merchant_uid, status || 'unknown'),
+        provider: 'portone',
+        orderId,
+        status: newStatus,
+      });
+      if (!duplicate && !(await applyPaymentEvent(event))) {
+        return statusNotApplied(orderId);
       }
 
       return NextResponse.json({
         success: true,
         orderId,
-        status: newStatus
+        status: newStatus,
+        duplicate
       });
     }
 
@@ -113,6 +128,21 @@ export async function POST(request: NextRequest) {
       const orderIdMatch = ref?.match(/order_(\d+)/);
       const orderId = orderIdMatch ? parseInt(orderIdMatch[1]) : null;
 
+      // Record and apply the status change if we have order ID
+      let duplicate = false;
+      if (orderId) {
+        const recorded = enqueuePaymentEvent({
+          id: paymentEventId('eximbay', ref, rescode),
+          provider: 'eximbay',
+          orderId,
+          status: isSuccess ? 'processing' : 'failed',
+        });
+        duplicate = recorded.duplicate;
+        if (!duplicate && !(await applyPaymentEvent(recorded.event))) {
+          return statusNotApplied(orderId);
+        }
+      }
+
       if (isSuccess) {
         console.log('[Payment Webhook] Eximbay payment successful:', {
           transactionId: ref,
@@ -121,21 +151,12 @@ export async function POST(request: NextRequest) {
           amount: amt
         });
 
-        // Update order status if we have order ID
-        if (orderId) {
-          try {
-            await updateOrderStatus(orderId, 'processing');
-            console.log(`[Payment Webhook] Updated order ${orderId} to processing`);
-          } catch (updateError: any) {
-            console.error('[Payment Webhook] Failed to update order:', updateError);
-          }
-        }
-
         return NextResponse.json({
           success: true,
           message: 'Payment processed successfully',
           transactionId: ref,
-          status: 'completed'
+          status: 'completed',
+          duplicate
         });
       } else {
         console.error('[Payment Webhook] Eximbay payment failed:', {
@@ -144,27 +165,18 @@ export async function POST(request: NextRequest) {
           errorMessage: resmsg
         });
 
-        // Update order status to failed if we have order ID
-        if (orderId) {
-          try {
-            await updateOrderStatus(orderId, 'failed');
-            console.log(`[Payment Webhook] Updated order ${orderId} to failed`);
-          } catch (updateError: any) {
-            console.error('[Payment Webhook] Failed to update order:', updateError);
-          }
-        }
-
         return NextResponse.json({
           success: false,
           message: resmsg || 'Payment failed',
           errorCode: rescode,
-          transactionId: ref
+          transactionId: ref,
+          duplicate
         });
       }
     }
 
     // Unknown payment provider
-    console.error('[Payment Webhook] Unknown payment provider format:', body);
+    console.error('[Payment Webhook] Unknown payment provider format:', Object.keys(body));
     return NextResponse.json(
       { error: 'Unknown payment provider' },
       { status: 400 }
@@ -181,13 +193,13 @@ export async function POST(request: NextRequest) {
       { status: 500 }
     );
   }
-}
+});
 
 /**
  * GET /api/payment/webhook
  * Handle Eximbay redirect callback (for browser redirects)
  */
-export async function GET(request: Request) {
+export const GET = withServerTiming('payment/webhook', async function GET(request: Request) {
   try {
     const { searchParams } = new URL(request.url);
     const rescode = searchParams.get('rescode');
@@ -204,4 +216,4 @@ export async function GET(request: Request) {
     console.error('Error handling payment redirect:', error);
     return NextResponse.redirect(new URL('/checkout?error=unknown', request.url));
   }
-}
+});
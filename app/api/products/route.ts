@@ -1,80 +1,100 @@
 import { NextResponse } from 'next/server';
-import { getProducts } from '@/lib/woocommerce';
+import { getCatalog } from '@/lib/woocommerce';
+import { queryCatalog, type CatalogSort } from '@/lib/catalog-index';
+import { jsonWithEtag } from '@/lib/http-cache';
+import type { ImageSize } from '@/lib/product-images';
+import { toProductListItem } from '@/lib/product-list';
+import { timeSpan, withServerTiming } from '@/lib/server-timing';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
 
+const SORT_MODES: CatalogSort[] = ['newest', 'price-asc', 'price-desc'];
+
+// Browsers always revalidate (ETag -> 304); Vercel's edge serves for 60s and
+// may serve stale for 10 minutes while revalidating, matching the catalog cache.
+const CACHE_CONTROL = 'public, max-age=0, s-maxage=60, stale-while-revalidate=600';
+
+// Last-good catalog served while WooCommerce is failing, or the persisted
+// snapshot served by a cold instance: keep edge reuse short so the refreshed
+// catalog shows up quickly
+const FALLBACK_CACHE_CONTROL = 'public, max-age=0, s-maxage=10';
+
+/**
+ * Read a multi-value query parameter (repeated and/or comma-separated)
+ */
+function getListParam(searchParams: URLSearchParams, key: string): string[] | undefined {
+  const values = searchParams
+    .getAll(key)
+    .flatMap((value) => value.split(','))
+    .map((value) => value.trim())
+    .filter(Boolean);
+  return values.length > 0 ? values : undefined;
+}
+
 /**
  * GET /api/products
- * Fetch all products from WooCommerce
+ * Fetch products from WooCommerce, filtered, sorted and paginated server-side
+ *
+ * Query params:
+ * - category, duration, dataAmount, type: filters (comma-separated or repeated)
+ * - sort: newest | price-asc | price-desc (default: newest)
+ * - page / perPage, or cursor (from a previous nextCursor)
+ * - limit: legacy alias for perPage (default: 100)
+ * - imageSize: thumbnail | shop_catalog | full
  */
-export async function GET(request: Request) {
+export const GET = withServerTiming('products', async function GET(request: Request) {
   try {
     const { searchParams } = new URL(request.url);
-    const category = searchParams.get('category');
     const limit = searchParams.get('limit') ? parseInt(searchParams.get('limit')!) : 100;
-    const imageSize = searchParams.get('imageSize') || 'shop_catalog';
-
-    // Fetch products from WooCommerce
-    const products = await getProducts();
-
-    // Filter by category if specified
-    let filteredProducts = products;
-    if (category) {
-      filteredProducts = products.filter((product: any) =>
-        product.categories.some((cat: any) => cat.slug === category)
-      );
-    }
+    const perPage = searchParams.get('perPage') ? parseInt(searchParams.get('perPage')!) : limit;
+    const page = searchParams.get('page') ? parseInt(searchParams.get('page')!) : 1;
+    const sortParam = searchParams.get('sort') as CatalogSort | null;
+    const sort = sortParam && SORT_MODES.includes(sortParam) ? sortParam : 'newest';
+    const imageSizeParam = searchParams.get('imageSize');
+    const imageSize: ImageSize = imageSizeParam === 'thumbnail' || imageSizeParam === 'full'
+      ? imageSizeParam
+      : 'shop_catalog';
 
-    // Limit results
-    const limitedProducts = filteredProducts.slice(0, limit);
+    // Fetch products through the in-process catalog cache
+    const { products, index, status: cacheStatus, ageMs } = await getCatalog();
 
-    // Map WordPress image filenames to local /images/products/ directory
-    // Images have been downloaded from gabia to avoid HTTP proxy issues
-    const toLocalImage = (url: string): string => {
-      if (!url || url === '/images/products/placeholder.jpg') return url;
-      const filename = url.split('/').pop() || '';
-      return `/images/products/${filename}`;
-    };
+    // Filter, sort and paginate against the precomputed catalog index
+    const result = await timeSpan('query', () => queryCatalog(index, {
+      category: getListParam(searchParams, 'category'),
+      duration: getListParam(searchParams, 'duration'),
+      dataAmount: getListParam(searchParams, 'dataAmount'),
+      type: getListParam(searchParams, 'type'),
+      sort,
+      page: Number.isFinite(page) ? page : 1,
+      perPage: Number.isFinite(perPage) ? perPage : 100,
+      cursor: searchParams.get('cursor') || undefined,
+    }));
 
-    // Transform WooCommerce data to our format
-    const transformedProducts = limitedProducts.map((product: any) => {
-      const rawUrl = product.images[0]?.src || '/images/products/placeholder.jpg';
-      const fullFilename = rawUrl.split('/').pop() || '';
+    // Transform WooCommerce data to our format (shared with server-rendered lists)
+    const transformedProducts = await timeSpan('transform', () =>
+      result.products.map((product) => toProductListItem(product, imageSize))
+    );
 
-      let imageUrl: string;
-      if (imageSize === 'thumbnail') {
-        imageUrl = toLocalImage(rawUrl.replace(/\.(jpg|jpeg|png|webp)$/i, '-150x150.$1'));
-      } else if (imageSize === 'shop_catalog') {
-        imageUrl = toLocalImage(rawUrl.replace(/\.(jpg|jpeg|png|webp)$/i, '-300x300.$1'));
-      } else {
-        imageUrl = toLocalImage(rawUrl);
+    return jsonWithEtag(
+      request,
+      {
+        success: true,
+        products: transformedProducts,
+        total: result.total,
+        page: result.page,
+        perPage: result.perPage,
+        totalPages: result.totalPages,
+        nextCursor: result.nextCursor,
+        catalogTotal: products.length
+      },
+      // An empty catalog means the upstream fetch failed; don't cache it at the edge
+      products.length === 0 ? 'no-store' : cacheStatus === 'FALLBACK' || cacheStatus === 'SNAPSHOT' ? FALLBACK_CACHE_CONTROL : CACHE_CONTROL,
+      {
+        'X-Catalog-Cache': cacheStatus,
+        'X-Catalog-Age': String(Math.round(ageMs / 1000)),
       }
-      const imageFull = toLocalImage(rawUrl);
-
-      return {
-        id: product.id,
-        slug: product.slug,
-        name: product.name,
-        price: product.price,
-        regularPrice: product.regular_price,
-        image: imageUrl, // Optimized image
-        imageFull: imageFull, // Full resolution image
-        category: product.categories[0]?.name || 'Uncategorized',
-        description: product.short_description || product.description,
-        // Extract custom attributes (duration, data amount)
-        duration: product.attributes.find((attr: any) => attr.name === 'Duration')?.options[0],
-        dataAmount: product.attributes.find((attr: any) => attr.name === 'Data')?.options[0],
-        // Variations for plan selector
-        variations: product.variations || []
-      };
-    });
-
-    return NextResponse.json({
-      success: true,
-      products: transformedProducts,
-      total: transformedProducts.length
-    });
+    );
   } catch (error: any) {
     console.error('Error fetching products:', error);
     return NextResponse.json(
@@ -86,4 +106,4 @@ export async function GET(request: Request) {
       { status: 500 }
     );
   }
-}
+});
@@ -0,0 +1,77 @@
+import { NextResponse } from 'next/server';
+import { revalidatePath } from 'next/cache';
+import crypto from 'crypto';
+import { invalidateCatalogCache, warmCatalogCache } from '@/lib/woocommerce';
+import { createErrorResponse } from '@/lib/api-error';
+import { locales } from '@/i18n';
+import { withServerTiming } from '@/lib/server-timing';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+/**
+ * Verify a WooCommerce-style webhook signature
+ * (base64 HMAC-SHA256 of the raw request body)
+ */
+function verifySignature(rawBody: string, signature: string | null, secret: string): boolean {
+  if (!signature) return false;
+
+  const expected = crypto.createHmac('sha256', secret).update(rawBody).digest('base64');
+  const expectedBuf = Buffer.from(expected);
+  const signatureBuf = Buffer.from(signature);
+
+  return expectedBuf.length === signatureBuf.length && crypto.timingSafeEqual(expectedBuf, signatureBuf);
+}
+
+/**
+ * POST /api/revalidate
+ * On-demand revalidation of statically generated product pages
+ *
+ * Called by the WooCommerce product-save hook (wordpress-setup/revalidate-hook.php)
+ * or a WooCommerce webhook (topic: product.updated / product.created / product.deleted)
+ * whose secret is REVALIDATE_SECRET.
+ *
+ * Headers: X-WC-Webhook-Signature: base64(HMAC-SHA256(body, REVALIDATE_SECRET))
+ * Request body: WooCommerce product JSON (at least { slug })
+ * Response: { success: true, revalidated: string[] }
+ */
+export const POST = withServerTiming('revalidate', async function POST(request: Request) {
+  const secret = process.env.REVALIDATE_SECRET;
+  if (!secret) {
+    return createErrorResponse('not_configured', 'REVALIDATE_SECRET is not configured', 500);
+  }
+
+  const rawBody = await request.text();
+
+  // WooCommerce sends an unsigned form-encoded ping when a webhook is created
+  if (!request.headers.get('x-wc-webhook-signature') && rawBody.startsWith('webhook_id=')) {
+    return NextResponse.json({ success: true, revalidated: [] });
+  }
+
+  if (!verifySignature(rawBody, request.headers.get('x-wc-webhook-signature'), secret)) {
+    return createErrorResponse('invalid_signature', 'Webhook signature verification failed', 401);
+  }
+
+  let slug: string | undefined;
+  try {
+    slug = JSON.parse(rawBody).slug;
+  } catch {
+    return createErrorResponse('invalid_body', 'Request body must be JSON', 400);
+  }
+
+  // Rebuild the catalog and its slug/filter indexes now; the refresh also
+  // rewrites the persisted snapshot used by cold instances
+  invalidateCatalogCache();
+  warmCatalogCache();
+
+  const paths: string[] = [];
+  for (const locale of locales) {
+    paths.push(`/${locale}/shop`);
+    if (slug) paths.push(`/${locale}/shop/${slug}`);
+  }
+  paths.forEach((path) => revalidatePath(path));
+
+  console.log('[revalidate] Revalidated:', paths);
+
+  return NextResponse.json({ success: true, revalidated: paths });
+});
@@ -1,11 +1,18 @@
 import { NextResponse } from 'next/server';
-import { getProducts } from '@/lib/woocommerce';
+import { getProducts, getCatalogCacheStats } from '@/lib/woocommerce';
+import { getUpstreamPoolStats } from '@/lib/upstream-pool';
+import { getCartCacheStats } from '@/lib/cart-session';
+import { getPaymentEventQueueStats } from '@/lib/payment-events';
+import { getOrderPipelineStats } from '@/lib/order-pipeline';
+import { getCircuitBreakerStats } from '@/lib/circuit-breaker';
+import { getCatalogSnapshotStats } from '@/lib/catalog-snapshot';
+import { withServerTiming } from '@/lib/server-timing';
 
 /**
  * Test endpoint to verify WooCommerce API integration
  * Access at: http://localhost:3000/api/test
  */
-export async function GET() {
+export const GET = withServerTiming('test', async function GET() {
   try {
     console.log('🧪 Testing WooCommerce API connection...');
 
@@ -18,6 +25,13 @@ export async function GET() {
       success: true,
       message: 'WooCommerce API integration working!',
       count: products.length,
+      catalogCache: getCatalogCacheStats(),
+      catalogSnapshot: getCatalogSnapshotStats(),
+      upstreamPool: getUpstreamPoolStats(),
+      cartCache: getCartCacheStats(),
+      paymentEvents: getPaymentEventQueueStats(),
+      orderPipeline: getOrderPipelineStats(),
+      circuitBreakers: getCircuitBreakerStats(),
       products: products.map(p => ({
         id: p.id,
         name: p.name,
@@ -34,4 +48,4 @@ export async function GET() {
       message: 'Failed to connect to WooCommerce API. Check your credentials in .env.local'
     }, { status: 500 });
   }
-}
+});
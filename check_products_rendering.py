@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
 """Deep diagnostic of why products aren't rendering"""
 
-from playwright.sync_api import sync_playwright
+from e2e_browser import browser_page, pause_for_inspection
 import json
 
 URL = "https://82mobile-next.vercel.app"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
+with browser_page() as page:
 
     console_logs = []
     def handle_console(msg):
@@ -89,9 +87,7 @@ with sync_playwright() as p:
         json.dump(console_logs, f, indent=2)
     print(f"📁 Console logs saved: products_rendering_console.json")
 
-    print(f"\n⏸️  Browser open for 30s inspection...")
-    page.wait_for_timeout(30000)
-    browser.close()
+    pause_for_inspection()
 
 print("\n" + "=" * 60)
 print("DIAGNOSTIC COMPLETE")
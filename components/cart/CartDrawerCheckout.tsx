@@ -8,6 +8,7 @@ import { useCartStore } from '@/stores/cart';
 import { useUIStore } from '@/stores/ui';
 import { initiatePortOnePayment } from '@/lib/payment/portone';
 import { trackBeginCheckout } from '@/lib/analytics';
+import { useIdempotencyKey } from '@/hooks/useIdempotencyKey';
 
 export default function CartDrawerCheckout() {
   const items = useCartStore((state) => state.items);
@@ -15,6 +16,7 @@ export default function CartDrawerCheckout() {
   const closeCart = useUIStore((state) => state.closeCart);
   const [orderError, setOrderError] = useState<string | null>(null);
   const hasTrackedCheckout = useRef(false);
+  const getIdempotencyKey = useIdempotencyKey();
 
   const total = items.reduce((sum, item) => sum + item.price * item.quantity, 0);
   const tax = Math.round(total * 0.1); // 10% VAT
@@ -53,28 +55,31 @@ export default function CartDrawerCheckout() {
     try {
       // Step 1: Create WooCommerce order
       console.log('[Checkout] Creating order...');
+      const orderBody = JSON.stringify({
+        billing: {
+          email: data.email,
+          firstName: data.firstName,
+          lastName: data.lastName,
+          phone: data.phone,
+          address1: data.address1 || '',
+          city: data.city || '',
+          postcode: data.postcode || '',
+          country: data.country || 'KR'
+        },
+        items: items.map(item => ({
+          id: item.productId,
+          quantity: item.quantity
+        })),
+        paymentMethod: 'portone'
+      });
       const orderResponse = await fetch('/api/orders', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          // Resubmits of the same checkout reuse the same order
+          'Idempotency-Key': getIdempotencyKey(orderBody),
         },
-        body: JSON.stringify({
-          billing: {
-            email: data.email,
-            firstName: data.firstName,
-            lastName: data.lastName,
-            phone: data.phone,
-            address1: data.address1 || '',
-            city: data.city || '',
-            postcode: data.postcode || '',
-            country: data.country || 'KR'
-          },
-          items: items.map(item => ({
-            id: item.productId,
-            quantity: item.quantity
-          })),
-          paymentMethod: 'portone'
-        })
+        body: orderBody
       });
 
       if (!orderResponse.ok) {
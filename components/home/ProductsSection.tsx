@@ -12,7 +12,6 @@ import type { Product } from '@/hooks/useProducts';
 export default function ProductsSection() {
   const t = useTranslations();
   const locale = useLocale();
-  const { data, isLoading, error } = useProducts();
   const [filters, setFilters] = useState({
     duration: [] as string[],
     dataAmount: [] as string[],
@@ -21,47 +20,18 @@ export default function ProductsSection() {
   });
   const [selectedProduct, setSelectedProduct] = useState<Product | null>(null);
 
+  // Filtering and sorting run server-side against the precomputed catalog index
+  const { data, isLoading, error } = useProducts(filters);
+
   const filteredProducts = useMemo(() => {
     if (!data?.products) return [];
-    let filtered = [...data.products];
-
-    // Type filter
-    if (filters.type.length > 0) {
-      filtered = filtered.filter((product) => {
-        const isEsim = product.name.toLowerCase().includes('esim');
-        if (filters.type.includes('eSIM') && isEsim) return true;
-        if (filters.type.includes('Physical') && !isEsim) return true;
-        return false;
-      });
-    }
-
-    // Duration filter
-    if (filters.duration.length > 0) {
-      filtered = filtered.filter((product) =>
-        product.duration && filters.duration.includes(product.duration)
-      );
-    }
-
-    // Data amount filter
-    if (filters.dataAmount.length > 0) {
-      filtered = filtered.filter((product) =>
-        product.dataAmount && filters.dataAmount.includes(product.dataAmount)
-      );
-    }
-
-    // Sorting
-    if (filters.sortBy === 'price-asc') {
-      filtered.sort((a, b) => parseFloat(a.price.replace(/,/g, '')) - parseFloat(b.price.replace(/,/g, '')));
-    } else if (filters.sortBy === 'price-desc') {
-      filtered.sort((a, b) => parseFloat(b.price.replace(/,/g, '')) - parseFloat(a.price.replace(/,/g, '')));
-    }
 
     // Translate product names for current locale
-    return filtered.map((p) => ({
+    return data.products.map((p) => ({
       ...p,
       name: translateProductName(p.name, locale),
     }));
-  }, [data?.products, filters, locale]);
+  }, [data?.products, locale]);
 
   return (
     <section
@@ -82,7 +52,7 @@ export default function ProductsSection() {
         <ProductFilter
           onFilterChange={setFilters}
           productsCount={filteredProducts.length}
-          totalCount={data?.products.length || 0}
+          totalCount={data?.catalogTotal || 0}
         />
 
         {/* Loading State */}
@@ -124,7 +94,7 @@ export default function ProductsSection() {
         {/* Results Count */}
         {!isLoading && !error && (
           <div className="text-center mt-8 text-gray-600">
-            Showing {filteredProducts.length} of {data?.products.length || 0} products
+            Showing {filteredProducts.length} of {data?.catalogTotal || 0} products
           </div>
         )}
       </div>
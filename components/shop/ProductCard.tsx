@@ -6,6 +6,7 @@ import Image from 'next/image';
 import { useCartStore } from '@/stores/cart';
 import { useUIStore } from '@/stores/ui';
 import { useToast } from '@/hooks/useToast';
+import { usePrefetchProductDetail } from '@/hooks/useProducts';
 import { useState, useRef, useEffect } from 'react';
 import { createPortal } from 'react-dom';
 import { trackProductView } from '@/lib/analytics';
@@ -46,6 +47,7 @@ export default function ProductCard({
   const addItem = useCartStore((state) => state.addItem);
   const openCart = useUIStore((state) => state.openCart);
   const toast = useToast();
+  const prefetchDetail = usePrefetchProductDetail();
   const [isFlipped, setIsFlipped] = useState(false);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [isAdding, setIsAdding] = useState(false);
@@ -85,7 +87,13 @@ export default function ProductCard({
     }, 500);
   };
 
+  const detailHref = `/${locale}/shop/${slug}`;
+
   const handleMouseEnter = () => {
+    // Hover intent: load the detail page before the click (shop page only)
+    if (!onSelect) {
+      prefetchDetail(detailHref);
+    }
     if (!isTouchDevice) {
       setIsFlipped(true);
     }
@@ -113,6 +121,8 @@ export default function ProductCard({
       e.preventDefault();
       e.stopPropagation();
       setIsModalOpen(true);
+      // The modal offers "View details"; load it while the shopper reads
+      prefetchDetail(detailHref);
       if (!hasTrackedView.current) {
         hasTrackedView.current = true;
         trackProductView({
@@ -279,7 +289,7 @@ export default function ProductCard({
             </button>
 
             <Link
-              href={`/${locale}/shop/${slug}`}
+              href={detailHref}
               className="block w-full py-4 px-4 bg-white/10 hover:bg-white/20 text-white font-bold rounded-lg transition-all text-center"
               onClick={handleCloseModal}
             >
@@ -322,7 +332,7 @@ export default function ProductCard({
             </div>
           ) : (
             <Link
-              href={`/${locale}/shop/${slug}`}
+              href={detailHref}
               className="block backface-hidden"
               onClick={handleCardClick}
             >
@@ -3,8 +3,8 @@ Comprehensive Phase 2 Testing - Desktop & Mobile
 Tests all Phase 2 features on production: https://82mobile.com
 """
 import json
-import time
 from playwright.sync_api import sync_playwright, expect
+from e2e_waits import RequestTracker, print_wait_summary, wait_for_animations, wait_for_scroll_settled
 from datetime import datetime
 
 PRODUCTION_URL = "https://82mobile-next.vercel.app"
@@ -48,7 +48,7 @@ def test_desktop(page):
     print("2. Scrolling to products section...")
     try:
         page.evaluate("window.lenis?.scrollTo('#products', { offset: 0, duration: 1 })")
-        time.sleep(2)
+        wait_for_scroll_settled(page)
         page.screenshot(path="test_desktop_products_section.png")
         RESULTS["desktop"]["products_section_visible"] = True
     except Exception as e:
@@ -92,8 +92,10 @@ def test_desktop(page):
             RESULTS["desktop"]["type_filter_exists"] = True
 
             # Try clicking a filter
+            products_api = RequestTracker(page, r"/api/products")
             type_filters[0].click()
-            time.sleep(1)
+            products_api.wait_quiet()
+            wait_for_animations(page)
 
             # Check if results updated
             results_text = page.text_content('body')
@@ -103,7 +105,9 @@ def test_desktop(page):
 
             # Reset filter
             type_filters[0].click()
-            time.sleep(1)
+            products_api.wait_quiet()
+            products_api.detach()
+            wait_for_animations(page)
         else:
             log_issue("major", "Filters", "No filter controls found")
             RESULTS["desktop"]["type_filter_exists"] = False
@@ -119,7 +123,7 @@ def test_desktop(page):
         product_cards = page.query_selector_all('.product-card, [class*="product"][class*="card"]')
         if product_cards and len(product_cards) > 0:
             product_cards[0].click()
-            time.sleep(1)
+            wait_for_animations(page)
 
             # Check if modal opened
             modal = page.query_selector('[role="dialog"], .modal, [class*="modal"]')
@@ -136,7 +140,7 @@ def test_desktop(page):
 
                 # Try closing with Escape
                 page.keyboard.press("Escape")
-                time.sleep(0.5)
+                wait_for_animations(page)
 
                 # Check if modal closed
                 modal_after = page.query_selector('[role="dialog"], .modal, [class*="modal"]')
@@ -163,13 +167,13 @@ def test_desktop(page):
         product_cards = page.query_selector_all('.product-card, [class*="product"][class*="card"]')
         if product_cards and len(product_cards) > 0:
             product_cards[0].click()
-            time.sleep(0.5)
+            wait_for_animations(page)
 
             # Find and click Add to Cart button
             add_to_cart = page.query_selector('button:has-text("Add to Cart"), button:has-text("장바구니")')
             if add_to_cart:
                 add_to_cart.click()
-                time.sleep(1)
+                wait_for_animations(page)
 
                 # Check for toast notification
                 toast = page.query_selector('[class*="toast"], [role="alert"], [class*="notification"]')
@@ -199,7 +203,7 @@ def test_desktop(page):
     try:
         # Scroll back to top
         page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(1)
+        wait_for_scroll_settled(page)
 
         # Count images
         images = page.query_selector_all('img')
@@ -280,7 +284,7 @@ def test_mobile(page):
     try:
         # Scroll to products
         page.evaluate("window.lenis?.scrollTo('#products', { offset: 0, duration: 1 })")
-        time.sleep(2)
+        wait_for_scroll_settled(page)
 
         # Check if products are in single column
         product_cards = page.query_selector_all('.product-card, [class*="product"][class*="card"]')
@@ -309,7 +313,7 @@ def test_mobile(page):
         product_cards = page.query_selector_all('.product-card, [class*="product"][class*="card"]')
         if product_cards and len(product_cards) > 0:
             product_cards[0].click()
-            time.sleep(1)
+            wait_for_animations(page)
 
             # Check if modal opened
             modal = page.query_selector('[role="dialog"], .modal, [class*="modal"]')
@@ -331,7 +335,7 @@ def test_mobile(page):
 
                 # Tap backdrop to close
                 page.click('body', position={"x": 10, "y": 100})
-                time.sleep(0.5)
+                wait_for_animations(page)
 
                 modal_after = page.query_selector('[role="dialog"], .modal, [class*="modal"]')
                 if not modal_after or not modal_after.is_visible():
@@ -392,31 +396,41 @@ def test_mobile(page):
     print("✓ Mobile testing complete")
 
 
-def run_tests():
-    """Run all tests"""
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("  COMPREHENSIVE PHASE 2 TESTING")
-    print("  URL:", PRODUCTION_URL)
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+# Independent scenarios for run_e2e_shards.py; each sets its own viewport and
+# navigates first, so they can run in separate browser contexts
+SHARDS = {
+    "desktop": (test_desktop, {}),
+    "mobile": (test_mobile, {}),
+}
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
 
-        try:
-            # Run desktop tests
-            test_desktop(page)
+def collect_results():
+    """Results recorded in this process (one shard when run by run_e2e_shards.py)"""
+    return {
+        "desktop": RESULTS["desktop"],
+        "mobile": RESULTS["mobile"],
+        "issues": RESULTS["issues"],
+    }
 
-            # Run mobile tests
-            test_mobile(page)
 
-        except Exception as e:
-            log_issue("critical", "Test Suite", f"Test suite crashed: {str(e)}")
+def merge_results(parts):
+    """
+    Combine per-shard results (in SHARDS order), then save and summarize
+
+    Args:
+        parts: [{"shard", "results": collect_results(), "error"}] from run_e2e_shards.py
+    """
+    for part in parts:
+        RESULTS["desktop"].update(part["results"]["desktop"])
+        RESULTS["mobile"].update(part["results"]["mobile"])
+        RESULTS["issues"].extend(part["results"]["issues"])
+        if part["error"]:
+            log_issue("critical", "Test Suite", f"Test suite crashed: {part['error']}")
+    return save_results()
 
-        finally:
-            browser.close()
 
+def save_results():
+    """Save RESULTS to test_results_phase2.json and print the summary"""
     # Save results
     with open("test_results_phase2.json", "w") as f:
         json.dump(RESULTS, f, indent=2)
@@ -438,7 +452,37 @@ def run_tests():
 
     print(f"\nFull results saved to: test_results_phase2.json")
     print("Screenshots saved to current directory")
+    print_wait_summary()
+
+    return not RESULTS["issues"]
+
+
+def run_tests():
+    """Run all tests"""
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("  COMPREHENSIVE PHASE 2 TESTING")
+    print("  URL:", PRODUCTION_URL)
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=False)
+        context = browser.new_context()
+        page = context.new_page()
+
+        try:
+            # Run desktop tests
+            test_desktop(page)
+
+            # Run mobile tests
+            test_mobile(page)
+
+        except Exception as e:
+            log_issue("critical", "Test Suite", f"Test suite crashed: {str(e)}")
+
+        finally:
+            browser.close()
 
+    save_results()
     return RESULTS
 
 
@@ -2,10 +2,18 @@
 """Comprehensive Phase 2 Verification - Desktop & Mobile Testing"""
 
 from playwright.sync_api import sync_playwright
+from e2e_probe import probe
+from e2e_waits import (
+    RequestTracker, print_wait_summary, wait_for_animations,
+    flip_state_within, wait_for_products, wait_for_scroll_settled,
+)
 import json
+import sys
 from datetime import datetime
 
 URL = "https://82mobile-next.vercel.app"
+RESULTS_TEXT = '#products .text-center.mt-8'
+MODAL = '[class*="fixed"][class*="inset-0"]'
 
 def test_desktop(page):
     """Desktop verification (1920x1080)"""
@@ -15,20 +23,29 @@ def test_desktop(page):
 
     page.set_viewport_size({"width": 1920, "height": 1080})
     page.goto(URL, wait_until='networkidle')
-    page.wait_for_timeout(3000)
+    wait_for_products(page)
 
     results = {}
+    snap = probe(
+        page,
+        sections=['products'],
+        counts={
+            'grid': '#products .grid',
+            'grid_children': '#products .grid > div',
+            'checkboxes': 'input[type="checkbox"]',
+            'selects': 'select',
+        },
+        text_of={'results': RESULTS_TEXT},
+    )
 
     # 1. Products Load from WooCommerce API
     print("\n1. Products Loading...")
-    products_section = page.query_selector('#products')
-    results['products_section_exists'] = products_section is not None
+    results['products_section_exists'] = snap['sections']['products']
 
-    if products_section:
+    if snap['sections']['products']:
         # Check for results text
-        results_text = page.query_selector('#products .text-center.mt-8')
-        if results_text:
-            text_content = results_text.inner_text()
+        text_content = snap['text_of']['results']
+        if text_content is not None:
             results['products_loaded'] = 'Showing' in text_content and 'of' in text_content
             results['products_count'] = text_content
             print(f"   ✅ {text_content}")
@@ -38,37 +55,38 @@ def test_desktop(page):
 
     # 2. Product Grid Display
     print("\n2. Product Grid Display...")
-    grid = page.query_selector('#products .grid')
-    if grid:
+    if snap['counts']['grid']:
         # Get all divs that contain product links
-        product_elements = page.query_selector_all('#products .grid > div')
+        grid_children = snap['counts']['grid_children']
         results['grid_exists'] = True
-        results['grid_children_count'] = len(product_elements)
-        print(f"   ✅ Grid exists with {len(product_elements)} children")
+        results['grid_children_count'] = grid_children
+        print(f"   ✅ Grid exists with {grid_children} children")
     else:
         results['grid_exists'] = False
         print(f"   ❌ Grid not found")
 
     # 3. Filters Functionality
     print("\n3. Filters...")
-    filters = {
-        'type': page.query_selector_all('input[type="checkbox"]'),
-        'sort': page.query_selector('select'),
-    }
-    results['filters_found'] = len(filters['type']) > 0 or filters['sort'] is not None
-    print(f"   ✅ {len(filters['type'])} checkboxes, Sort dropdown: {filters['sort'] is not None}")
+    checkboxes = snap['counts']['checkboxes']
+    has_sort = snap['counts']['selects'] > 0
+    results['filters_found'] = checkboxes > 0 or has_sort
+    print(f"   ✅ {checkboxes} checkboxes, Sort dropdown: {has_sort}")
 
     # Test filter interaction
-    if len(filters['type']) > 0:
-        first_checkbox = filters['type'][0]
-        initial_count_text = page.query_selector('#products .text-center.mt-8').inner_text()
+    if checkboxes > 0:
+        first_checkbox = page.query_selector('input[type="checkbox"]')
+        initial_count_text = snap['text_of']['results']
+        products_api = RequestTracker(page, r"/api/products")
         first_checkbox.click()
-        page.wait_for_timeout(1000)
-        filtered_count_text = page.query_selector('#products .text-center.mt-8').inner_text()
+        products_api.wait_quiet()
+        wait_for_animations(page)
+        filtered_count_text = probe(page, text_of={'results': RESULTS_TEXT})['text_of']['results']
         results['filter_works'] = initial_count_text != filtered_count_text
         print(f"   Filter interaction: {initial_count_text} → {filtered_count_text}")
         first_checkbox.click()  # Reset
-        page.wait_for_timeout(1000)
+        products_api.wait_quiet()
+        products_api.detach()
+        wait_for_animations(page)
 
     # 4. Product Modal
     print("\n4. Product Modal Expansion...")
@@ -80,13 +98,13 @@ def test_desktop(page):
         parent_div = page.query_selector('#products .cursor-pointer')
         if parent_div:
             parent_div.click()
-            page.wait_for_timeout(1000)
+            wait_for_animations(page)
 
             # Check if modal opened (ProductExpanded component)
-            modal = page.query_selector('[class*="fixed"][class*="inset-0"]')
-            results['modal_opens'] = modal is not None
+            modal_open = probe(page, counts={'modal': MODAL})['counts']['modal'] > 0
+            results['modal_opens'] = modal_open
 
-            if modal:
+            if modal_open:
                 print(f"   ✅ Modal opened")
                 # Close modal
                 close_button = page.query_selector('button[class*="close"], button[aria-label="Close"]')
@@ -94,7 +112,7 @@ def test_desktop(page):
                     close_button.click()
                 else:
                     page.keyboard.press('Escape')
-                page.wait_for_timeout(500)
+                wait_for_animations(page)
             else:
                 print(f"   ❌ Modal did not open")
         else:
@@ -111,19 +129,19 @@ def test_desktop(page):
     if product_card:
         # Trigger hover to flip card
         product_card.hover()
-        page.wait_for_timeout(1000)
+        flip_state_within(product_card.query_selector('.transform-style-3d'), True)
 
         # Click "Add to Cart" button on back of card
         add_to_cart = page.query_selector('button:has-text("Add to Cart")')
         if add_to_cart:
             add_to_cart.click()
-            page.wait_for_timeout(1500)
+            wait_for_animations(page)
 
             # Check for toast notification
-            toast = page.query_selector('[class*="toast"], [role="alert"]')
-            results['toast_shows'] = toast is not None
+            toast_shown = probe(page, counts={'toast': '[class*="toast"], [role="alert"]'})['counts']['toast'] > 0
+            results['toast_shows'] = toast_shown
 
-            if toast:
+            if toast_shown:
                 print(f"   ✅ Toast notification appeared")
             else:
                 print(f"   ⚠️  Toast not detected (may have auto-closed)")
@@ -136,26 +154,31 @@ def test_desktop(page):
 
     # 6. Image Lazy Loading
     print("\n6. Image Lazy Loading...")
-    images = page.query_selector_all('#products img')
-    lazy_images = [img for img in images if img.get_attribute('loading') == 'lazy']
-    eager_images = [img for img in images if img.get_attribute('loading') == 'eager']
-    results['total_images'] = len(images)
-    results['lazy_images'] = len(lazy_images)
-    results['eager_images'] = len(eager_images)
-    print(f"   Total: {len(images)} images")
-    print(f"   Lazy: {len(lazy_images)} images")
-    print(f"   Eager: {len(eager_images)} images (above fold)")
+    snap = probe(page, counts={
+        'images': '#products img',
+        'lazy': '#products img[loading="lazy"]',
+        'eager': '#products img[loading="eager"]',
+        'progress_bar': '.fixed.top-0.left-0.w-full.h-1',
+        'nav_dots': 'nav.fixed.right-8',
+    })
+    counts = snap['counts']
+    results['total_images'] = counts['images']
+    results['lazy_images'] = counts['lazy']
+    results['eager_images'] = counts['eager']
+    print(f"   Total: {counts['images']} images")
+    print(f"   Lazy: {counts['lazy']} images")
+    print(f"   Eager: {counts['eager']} images (above fold)")
 
     # 7. Scroll Interactions
     print("\n7. Scroll Interactions...")
     # Check for scroll progress bar
-    scroll_progress = page.query_selector('.fixed.top-0.left-0.w-full.h-1')
-    results['scroll_progress_bar'] = scroll_progress is not None
+    scroll_progress = counts['progress_bar'] > 0
+    results['scroll_progress_bar'] = scroll_progress
     print(f"   Scroll progress bar: {'✅' if scroll_progress else '❌'}")
 
     # Check for navigation dots
-    nav_dots = page.query_selector('nav.fixed.right-8')
-    results['nav_dots'] = nav_dots is not None
+    nav_dots = counts['nav_dots'] > 0
+    results['nav_dots'] = nav_dots
     print(f"   Navigation dots: {'✅' if nav_dots else '❌'}")
 
     # Take screenshot
@@ -172,18 +195,17 @@ def test_mobile(page):
 
     page.set_viewport_size({"width": 390, "height": 844})
     page.goto(URL, wait_until='networkidle')
-    page.wait_for_timeout(3000)
+    wait_for_products(page)
 
     results = {}
 
     # 1. Responsive Layout
     print("\n1. Responsive Layout...")
-    products_section = page.query_selector('#products')
-    if products_section:
+    snap = probe(page, sections=['products'], attrs={'grid_classes': ('#products .grid', 'class')})
+    if snap['sections']['products']:
         # Check grid layout (should be 1 column on mobile)
-        grid = page.query_selector('#products .grid')
-        if grid:
-            grid_classes = grid.get_attribute('class')
+        grid_classes = snap['attrs']['grid_classes']
+        if grid_classes is not None:
             results['mobile_single_column'] = 'md:grid-cols-2' in grid_classes or 'lg:grid-cols-3' in grid_classes
             print(f"   ✅ Responsive grid classes: {grid_classes}")
 
@@ -198,17 +220,17 @@ def test_mobile(page):
 
         # Tap product
         product_div.tap()
-        page.wait_for_timeout(1000)
+        wait_for_animations(page)
 
         # Check if modal opened
-        modal = page.query_selector('[class*="fixed"][class*="inset-0"]')
-        results['mobile_modal_works'] = modal is not None
+        modal_open = probe(page, counts={'modal': MODAL})['counts']['modal'] > 0
+        results['mobile_modal_works'] = modal_open
 
-        if modal:
+        if modal_open:
             print(f"   ✅ Touch tap opens modal")
             # Close modal
             page.keyboard.press('Escape')
-            page.wait_for_timeout(500)
+            wait_for_animations(page)
         else:
             print(f"   ❌ Touch tap did not open modal")
 
@@ -216,22 +238,20 @@ def test_mobile(page):
     print("\n3. Scrolling...")
     # Scroll down
     page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    page.wait_for_timeout(1000)
+    wait_for_scroll_settled(page)
 
     # Check if all content loaded
-    bottom_text = page.query_selector('#contact')
-    results['scroll_to_bottom'] = bottom_text is not None
+    results['scroll_to_bottom'] = probe(page, sections=['contact'])['sections']['contact']
     print(f"   ✅ Scrolled to bottom, contact section visible")
 
     # Scroll back to products
     page.evaluate("document.querySelector('#products').scrollIntoView()")
-    page.wait_for_timeout(1000)
+    wait_for_scroll_settled(page)
 
     # 4. Mobile Navigation
     print("\n4. Mobile Navigation...")
     # Check if floating nav dots are hidden on mobile
-    nav_dots = page.query_selector('nav.fixed.right-8')
-    is_hidden = page.evaluate("(el) => window.getComputedStyle(el).display === 'none'", nav_dots) if nav_dots else True
+    is_hidden = not probe(page, visible={'nav_dots': 'nav.fixed.right-8'})['visible']['nav_dots']
     results['nav_dots_hidden_mobile'] = is_hidden
     print(f"   Navigation dots hidden on mobile: {'✅' if is_hidden else '⚠️ visible'}")
 
@@ -302,8 +322,10 @@ def run_all_tests():
             for err in all_results['console_errors'][:3]:
                 print(f"  - {err[:100]}")
 
-        print(f"\n⏸️  Browser open for 20s review...")
-        page.wait_for_timeout(20000)
+        print_wait_summary()
+
+        if sys.stdin.isatty():
+            input("\n⏸️  Browser open for review, press Enter to close...")
         browser.close()
 
 if __name__ == '__main__':
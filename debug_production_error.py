@@ -3,7 +3,7 @@
 Debug production client-side error by capturing browser console logs.
 """
 
-from playwright.sync_api import sync_playwright
+from e2e_browser import browser_page, pause_for_inspection
 import json
 from datetime import datetime
 
@@ -43,19 +43,11 @@ def main():
     print("DEBUGGING PRODUCTION CLIENT-SIDE ERROR")
     print("=" * 80)
 
-    with sync_playwright() as p:
-        # Launch browser with devtools open
-        browser = p.chromium.launch(
-            headless=False,
-            args=['--auto-open-devtools-for-tabs']
-        )
-
-        context = browser.new_context(
-            viewport={'width': 1920, 'height': 1080}
-        )
-
-        page = context.new_page()
-
+    # Devtools open on cold launch (for a server: e2e_browser.py start --headed --devtools)
+    with browser_page(
+        viewport={'width': 1920, 'height': 1080},
+        launch_args=['--auto-open-devtools-for-tabs'],
+    ) as page:
         # Set up console and error capturing
         console_logs, errors = capture_console_errors(page)
 
@@ -110,15 +102,11 @@ def main():
             print("📸 Screenshot: production_error_screenshot.png")
 
             # Keep browser open for manual inspection
-            print("\n⏸️  Browser will stay open for 60 seconds for manual inspection...")
-            page.wait_for_timeout(60000)
+            pause_for_inspection()
 
         except Exception as e:
             print(f"\n❌ Error during debugging: {e}")
             page.screenshot(path='production_error_exception.png', full_page=True)
 
-        finally:
-            browser.close()
-
 if __name__ == "__main__":
     main()
@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
 """Diagnose why products aren't displaying"""
 
-from playwright.sync_api import sync_playwright
+from e2e_browser import browser_page, pause_for_inspection
 import json
 
 URL = "https://82mobile-next.vercel.app"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
+with browser_page() as page:
 
     console_logs = []
     def handle_console(msg):
@@ -88,6 +86,4 @@ with sync_playwright() as p:
 
     print(f"\n📁 Console logs saved to: console_logs.json")
 
-    print(f"\n⏸️  Pausing for 20s...")
-    page.wait_for_timeout(20000)
-    browser.close()
+    pause_for_inspection()
@@ -0,0 +1,131 @@
+"""
+Async E2E Harness
+
+Runs independent Playwright scenarios concurrently in one process: a single
+Chromium, one fresh browser context per scenario, and asyncio.gather under a
+concurrency limit. Desktop, mobile and locale scenarios overlap instead of
+waiting on each other's network and rendering.
+
+    from e2e_async import run_scenarios
+
+    SCENARIOS = {
+        "desktop-home": (scenario_desktop_home, {"viewport": {"width": 1920, "height": 1080}}),
+        "iphone": (scenario_mobile, {"device": "iPhone 12 Pro"}),
+    }
+    outcomes = asyncio.run(run_scenarios(SCENARIOS, concurrency=4))
+
+Scenarios are `async def scenario(page)`. current_scenario() names the
+scenario the calling task belongs to, so a suite's record()/log_issue() can
+keep per-scenario results and merge them in a stable order. Async versions of
+the e2e_waits helpers are included and share its WAIT_TIMINGS.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from e2e_waits import (
+    APP_READY_JS,
+    DEFAULT_TIMEOUT_MS,
+    PAGE_ANIMATIONS_DONE_JS,
+    PRODUCTS_RENDERED_JS,
+    SCROLL_SETTLED_JS,
+    TEXT_PRESENT_JS,
+    timed_wait,
+)
+
+_scenario = ContextVar("scenario", default=None)
+
+
+def current_scenario():
+    """Name of the scenario running in the current task (None outside run_scenarios)"""
+    return _scenario.get()
+
+
+async def run_scenarios(scenarios, concurrency=4, headless=True, page_timeout_ms=None):
+    """
+    Run scenarios concurrently, each in its own browser context
+
+    Args:
+        scenarios: {name: (async scenario(page), context_options)}; a "device"
+                   entry in context_options selects a Playwright device descriptor
+        concurrency: Maximum scenarios (contexts) open at once
+
+    Returns:
+        dict: name -> {"error", "seconds"}, in scenarios order
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(name, scenario, context_options):
+            async with limit:
+                _scenario.set(name)
+                options = dict(context_options)
+                device = options.pop("device", None)
+                if device:
+                    options = {**p.devices[device], **options}
+
+                error = None
+                start = time.perf_counter()
+                context = await browser.new_context(**options)
+                try:
+                    page = await context.new_page()
+                    if page_timeout_ms:
+                        page.set_default_timeout(page_timeout_ms)
+                    await scenario(page)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    print(f"  [ERROR] {name}: {error}")
+                finally:
+                    await context.close()
+                return name, {"error": error, "seconds": time.perf_counter() - start}
+
+        try:
+            # gather runs each scenario in its own task (and contextvars copy)
+            outcomes = await asyncio.gather(
+                *(run_one(name, scenario, options) for name, (scenario, options) in scenarios.items())
+            )
+        finally:
+            await browser.close()
+    return dict(outcomes)
+
+
+# Async counterparts of the e2e_waits helpers
+
+async def wait_for_animations(page, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until the page has no finite CSS transitions/animations running"""
+    with timed_wait("animations"):
+        await page.wait_for_function(PAGE_ANIMATIONS_DONE_JS, timeout=timeout)
+
+
+async def wait_for_app_ready(page, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until the client app has hydrated (window.lenis is set)"""
+    with timed_wait("hydration"):
+        await page.wait_for_function(APP_READY_JS, timeout=timeout)
+
+
+async def wait_for_products(page, min_count=1, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until the #products grid has rendered; returns the child count"""
+    with timed_wait("products"):
+        handle = await page.wait_for_function(PRODUCTS_RENDERED_JS, arg=min_count, timeout=timeout)
+        return await handle.json_value()
+
+
+async def wait_for_scroll_settled(page, quiet_frames=5, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until Lenis/native scrolling has stopped for quiet_frames frames"""
+    with timed_wait("scroll"):
+        await page.wait_for_function(SCROLL_SETTLED_JS, arg=quiet_frames, timeout=timeout)
+
+
+async def text_within(page, text, selector="body", timeout=5000):
+    """Whether selector's text contains text within timeout"""
+    try:
+        with timed_wait("text"):
+            await page.wait_for_function(TEXT_PRESENT_JS, arg=[selector, text], timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+E2E Browser Server
+
+Keeps one Chromium running in the background so the diagnostic scripts
+connect to it over CDP instead of cold-launching a browser every run.
+
+    python3 e2e_browser.py start             # headless server
+    python3 e2e_browser.py start --headed    # visible windows (manual inspection)
+    python3 e2e_browser.py status
+    python3 e2e_browser.py stop
+
+Scripts open pages through browser_page():
+
+    from e2e_browser import browser_page, pause_for_inspection
+
+    with browser_page(viewport={"width": 1920, "height": 1080}) as page:
+        page.goto(URL)
+        pause_for_inspection()
+
+Every call gets a fresh, isolated browser context (no cookies, storage or
+HTTP cache carried over). With cache=True (or E2E_BROWSER_CACHE=1) the page
+opens in the server's persistent profile instead: cookies are cleared but
+the HTTP cache in .e2e-browser/profile survives across runs, to measure
+warm-cache loads. Without a running server, browser_page() falls back to a
+regular launch, so every script still works standalone.
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from playwright.sync_api import sync_playwright
+
+PORT = int(os.environ.get("E2E_BROWSER_PORT", "9323"))
+STATE_DIR = os.environ.get(
+    "E2E_BROWSER_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".e2e-browser")
+)
+PROFILE_DIR = os.path.join(STATE_DIR, "profile")
+PID_FILE = os.path.join(STATE_DIR, "server.pid")
+
+
+def server_info(port=PORT):
+    """CDP /json/version of the running server, or None"""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=0.5) as resp:
+            return json.load(resp)
+    except (OSError, ValueError):
+        return None
+
+
+def start_server(headed=False, devtools=False, port=PORT, timeout=15):
+    """Launch Chromium detached with remote debugging; returns its pid"""
+    if server_info(port):
+        print(f"Browser server already running on port {port}")
+        return None
+
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    args = [
+        executable,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={PROFILE_DIR}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if not headed:
+        args.append("--headless=new")
+    if devtools:
+        args.append("--auto-open-devtools-for-tabs")
+    args.append("about:blank")
+
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,  # outlive this shell
+    )
+    deadline = time.time() + timeout
+    while not server_info(port):
+        if process.poll() is not None or time.time() > deadline:
+            process.kill()
+            raise RuntimeError(f"Browser server failed to start on port {port}")
+        time.sleep(0.1)
+
+    with open(PID_FILE, "w") as f:
+        f.write(str(process.pid))
+    print(f"Browser server started (pid {process.pid}, port {port}, {'headed' if headed else 'headless'})")
+    return process.pid
+
+
+def stop_server():
+    if not os.path.exists(PID_FILE):
+        print("No browser server pid file")
+        return False
+    with open(PID_FILE) as f:
+        pid = int(f.read().strip())
+    try:
+        os.kill(pid, signal.SIGTERM)
+        print(f"Browser server stopped (pid {pid})")
+    except ProcessLookupError:
+        print(f"Browser server (pid {pid}) was not running")
+    os.remove(PID_FILE)
+    return True
+
+
+@contextmanager
+def browser_page(cache=None, viewport=None, headless=False, launch_args=None, **context_options):
+    """
+    Open a page on the browser server (or a freshly launched browser)
+
+    Args:
+        cache: Use the server's persistent HTTP cache profile
+               (default: E2E_BROWSER_CACHE env var)
+        viewport: Viewport size dict
+        headless, launch_args: Only used when no server is running
+        context_options: Extra new_context() options (fresh contexts only)
+
+    Yields:
+        Page
+    """
+    if cache is None:
+        cache = os.environ.get("E2E_BROWSER_CACHE") == "1"
+
+    playwright = sync_playwright().start()
+    browser = None
+    try:
+        start = time.perf_counter()
+        info = server_info()
+        if info:
+            browser = playwright.chromium.connect_over_cdp(info["webSocketDebuggerUrl"])
+            source = f"server :{PORT}"
+        else:
+            browser = playwright.chromium.launch(headless=headless, args=launch_args or [])
+            source = "cold launch (run `python3 e2e_browser.py start` to reuse a browser)"
+
+        shared_context = bool(cache and info)
+        if shared_context:
+            # The default context is backed by the on-disk profile
+            context = browser.contexts[0]
+            context.clear_cookies()
+            page = context.new_page()
+            if viewport:
+                page.set_viewport_size(viewport)
+            source += ", persistent cache"
+        else:
+            if viewport:
+                context_options["viewport"] = viewport
+            context = browser.new_context(**context_options)
+            page = context.new_page()
+        print(f"[e2e_browser] Browser ready in {(time.perf_counter() - start) * 1000:.0f} ms ({source})")
+
+        try:
+            yield page
+        finally:
+            if shared_context:
+                page.close()
+            else:
+                context.close()
+    finally:
+        # Disconnects from a server without closing it
+        if browser:
+            browser.close()
+        playwright.stop()
+
+
+def pause_for_inspection(message="Browser open for inspection, press Enter to close..."):
+    """Keep the page open until Enter (only when run from a terminal)"""
+    if sys.stdin.isatty():
+        input(f"\n⏸️  {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-lived browser for the E2E/diagnostic scripts")
+    sub = parser.add_subparsers(dest="command", required=True)
+    start = sub.add_parser("start", help="Start the browser server")
+    start.add_argument("--headed", action="store_true", help="Show browser windows")
+    start.add_argument("--devtools", action="store_true", help="Open DevTools for new tabs")
+    sub.add_parser("stop", help="Stop the browser server")
+    sub.add_parser("status", help="Show whether the server is running")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        start_server(headed=args.headed, devtools=args.devtools)
+    elif args.command == "stop":
+        stop_server()
+    else:
+        info = server_info()
+        if info:
+            print(f"Running on port {PORT}: {info.get('Browser')}")
+        else:
+            print(f"Not running (port {PORT})")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+E2E DOM Snapshot Probe
+
+Collects everything a check asserts on in a single page.evaluate (one CDP
+round trip) instead of one query_selector / inner_text / evaluate call per
+assertion. Assertions then run locally in Python against the snapshot.
+With Playwright's async API, probe() returns an awaitable (await probe(page, ...)).
+
+    from e2e_probe import probe
+
+    snap = probe(
+        page,
+        sections=["hero", "products"],
+        counts={"nav_dots": ("nav.fixed", "button")},
+        texts=["5,000"],
+    )
+    record("Nav dots present", snap["counts"]["nav_dots"] >= 4)
+    record("Reservation 5,000 shown", snap["texts"]["5,000"])
+
+Snapshot keys (always present):
+    url, title
+    scroll: {width, client_width, height, y, horizontal_overflow}
+    broken_images: src of loaded images with no pixels (first 10)
+    sections: {id: exists}
+    counts: {name: number of elements matching the selector}
+    texts: {text: body text contains it}
+    patterns: {name: regex (case-insensitive) matches the first text_limit chars of body text}
+    main_patterns: {name: same, with the footer's text removed}
+    text_of: {name: innerText of the first match, or None}
+    attrs: {name: attribute of the first match, or None}
+    visible: {name: first match exists and is rendered}
+"""
+
+_PROBE_JS = """(spec) => {
+    const first = (selector) => document.querySelector(selector);
+    const map = (obj, fn) => Object.fromEntries(Object.entries(obj).map(([k, v]) => [k, fn(v)]));
+    const bodyText = document.body ? document.body.innerText : '';
+    const footer = first('footer');
+    const head = bodyText.substring(0, spec.textLimit);
+    const mainHead = (footer ? bodyText.replace(footer.innerText, '') : bodyText).substring(0, spec.textLimit);
+    const root = document.documentElement;
+
+    return {
+        url: location.href,
+        title: document.title,
+        scroll: {
+            width: root.scrollWidth,
+            client_width: root.clientWidth,
+            height: root.scrollHeight,
+            y: window.scrollY,
+            horizontal_overflow: root.scrollWidth > root.clientWidth,
+        },
+        broken_images: Array.from(document.images)
+            .filter((img) => img.complete && img.naturalWidth === 0 && img.src && !img.src.startsWith('data:'))
+            .slice(0, 10)
+            .map((img) => img.src),
+        sections: Object.fromEntries(spec.sections.map((id) => [id, !!document.getElementById(id)])),
+        counts: map(spec.counts, (selector) => Array.isArray(selector)
+            ? (first(selector[0])?.querySelectorAll(selector[1]).length ?? 0)
+            : document.querySelectorAll(selector).length),
+        texts: Object.fromEntries(spec.texts.map((text) => [text, bodyText.includes(text)])),
+        patterns: map(spec.patterns, (re) => new RegExp(re, 'i').test(head)),
+        main_patterns: map(spec.mainPatterns, (re) => new RegExp(re, 'i').test(mainHead)),
+        text_of: map(spec.textOf, (selector) => first(selector)?.innerText ?? null),
+        attrs: map(spec.attrs, ([selector, name]) => first(selector)?.getAttribute(name) ?? null),
+        visible: map(spec.visible, (selector) => {
+            const el = first(selector);
+            return !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+        }),
+    };
+}"""
+
+
+def probe(page, sections=(), counts=None, texts=(), patterns=None, main_patterns=None,
+          text_of=None, attrs=None, visible=None, text_limit=3000):
+    """
+    Snapshot the page's assertion-relevant state in one evaluate
+
+    Args:
+        sections: Element ids to check for
+        counts: {name: selector} to count, or {name: (scope, selector)} to
+                count within the first match of scope
+        texts: Substrings to look for in body text
+        patterns, main_patterns: {name: JS regex source}, case-insensitive,
+                                 for body text (main_patterns: footer text removed)
+        text_of: {name: selector} whose innerText to return
+        attrs: {name: (selector, attribute)} to read
+        visible: {name: selector} to check rendering of
+        text_limit: Characters of body text the patterns are tested against
+
+    Returns:
+        dict: snapshot (see module docstring)
+    """
+    return page.evaluate(_PROBE_JS, {
+        "sections": list(sections),
+        "counts": {name: selector if isinstance(selector, str) else list(selector)
+                   for name, selector in (counts or {}).items()},
+        "texts": list(texts),
+        "patterns": patterns or {},
+        "mainPatterns": main_patterns or {},
+        "textOf": text_of or {},
+        "attrs": {name: list(pair) for name, pair in (attrs or {}).items()},
+        "visible": visible or {},
+        "textLimit": text_limit,
+    })
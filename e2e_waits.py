@@ -0,0 +1,274 @@
+"""
+E2E Wait Helpers
+
+Condition-based waits for the Playwright scripts, replacing fixed pauses
+(time.sleep / page.wait_for_timeout / slow_mo). Each helper returns as soon as
+its condition holds and records how long it actually waited, so suites only
+spend time on real work and a slow network gets the full timeout instead of
+a guess.
+
+    from e2e_waits import wait_for_products, wait_for_flip, print_wait_summary
+
+    wait_for_products(page)                      # #products grid rendered
+    card.hover()
+    wait_for_flip(card_inner, flipped=True)      # class applied + transition done
+    print_wait_summary()                         # time spent per wait kind
+
+All helpers take a timeout in ms and raise Playwright's TimeoutError when the
+condition never holds, like the built-in waits.
+"""
+
+import re
+import time
+from contextlib import contextmanager
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+DEFAULT_TIMEOUT_MS = 15000
+
+# Wait conditions (page.wait_for_function predicates), shared with e2e_async.py
+
+# Finite CSS transitions/animations still running (infinite ones such as
+# animate-pulse never finish and are ignored)
+_RUNNING_ANIMATIONS_JS = """(a) => a.playState === 'running'
+    && a.effect?.getComputedTiming().iterations !== Infinity"""
+
+PAGE_ANIMATIONS_DONE_JS = f"() => !document.getAnimations().some({_RUNNING_ANIMATIONS_JS})"
+ELEMENT_ANIMATIONS_DONE_JS = f"(el) => !el.getAnimations({{ subtree: true }}).some({_RUNNING_ANIMATIONS_JS})"
+
+FLIP_SETTLED_JS = """([el, flipped]) => el.classList.contains('rotate-y-180') === flipped
+    && el.getAnimations().every((a) => a.playState !== 'running')"""
+
+APP_READY_JS = "() => !!window.lenis"
+
+PRODUCTS_RENDERED_JS = """(minCount) => {
+    const grid = document.querySelector('#products .grid');
+    if (!grid || grid.querySelector('.animate-pulse')) return false;
+    return grid.children.length >= minCount ? grid.children.length : false;
+}"""
+
+SELECTOR_COUNT_JS = """([selector, minCount]) => {
+    const count = document.querySelectorAll(selector).length;
+    return count >= minCount ? count : false;
+}"""
+
+SCROLL_SETTLED_JS = """(quietFrames) => {
+    const s = window.__e2eScroll || (window.__e2eScroll = { last: -1, still: 0 });
+    const moving = window.lenis?.isScrolling || window.scrollY !== s.last;
+    s.still = moving ? 0 : s.still + 1;
+    s.last = window.scrollY;
+    if (s.still < quietFrames) return false;
+    delete window.__e2eScroll;
+    return true;
+}"""
+
+TEXT_PRESENT_JS = """([selector, text]) => (document.querySelector(selector)?.innerText || '').includes(text)"""
+
+TEXT_CHANGED_JS = """([selector, previous]) => {
+    const text = document.querySelector(selector)?.innerText;
+    return text !== undefined && text !== previous ? text : false;
+}"""
+
+# (label, elapsed ms) for every wait in this process
+WAIT_TIMINGS = []
+
+
+@contextmanager
+def timed_wait(label):
+    """Record the duration of a wait (also for ad-hoc Playwright waits)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        WAIT_TIMINGS.append((label, (time.perf_counter() - start) * 1000))
+
+
+def wait_summary():
+    """
+    Wait time per label
+
+    Returns:
+        dict: label -> {"count", "total_ms", "max_ms"}
+    """
+    summary = {}
+    for label, ms in WAIT_TIMINGS:
+        entry = summary.setdefault(label, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] += ms
+        entry["max_ms"] = max(entry["max_ms"], ms)
+    return summary
+
+
+def print_wait_summary():
+    summary = wait_summary()
+    if not summary:
+        return
+    total = sum(entry["total_ms"] for entry in summary.values())
+    print(f"\nWait time: {total / 1000:.2f}s in {len(WAIT_TIMINGS)} waits")
+    for label, entry in sorted(summary.items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"  {label:<22} x{entry['count']:<3} total {entry['total_ms']:8.0f} ms  max {entry['max_ms']:6.0f} ms")
+
+
+def wait_for_animations(target, timeout=DEFAULT_TIMEOUT_MS):
+    """
+    Wait until CSS transitions/animations have finished (the point where
+    transitionend/animationend fire, including ones that already fired)
+
+    Args:
+        target: ElementHandle (element and descendants), or a Page (whole document)
+    """
+    with timed_wait("animations"):
+        if hasattr(target, "goto"):
+            target.wait_for_function(PAGE_ANIMATIONS_DONE_JS, timeout=timeout)
+        else:
+            target.owner_frame().wait_for_function(ELEMENT_ANIMATIONS_DONE_JS, arg=target, timeout=timeout)
+
+
+def wait_for_flip(card_inner, flipped=True, timeout=DEFAULT_TIMEOUT_MS):
+    """
+    Wait for a product card's .transform-style-3d element to settle:
+    rotate-y-180 present (or absent) and its flip transition finished.
+    Returns silently once settled; raises TimeoutError if the class never
+    reaches the expected state.
+    """
+    with timed_wait("flip"):
+        card_inner.owner_frame().wait_for_function(FLIP_SETTLED_JS, arg=[card_inner, flipped], timeout=timeout)
+
+
+def flip_state_within(card_inner, flipped, timeout=3000):
+    """
+    Like wait_for_flip(), but report whether the state was reached instead of
+    raising (for checks that assert on the outcome). A card detached by an
+    unexpected navigation counts as not reached.
+    """
+    try:
+        wait_for_flip(card_inner, flipped, timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_app_ready(page, timeout=DEFAULT_TIMEOUT_MS):
+    """
+    Wait until the client app has hydrated: LenisProvider's mount effect has
+    exposed window.lenis, so click handlers are attached
+    """
+    with timed_wait("hydration"):
+        page.wait_for_function(APP_READY_JS, timeout=timeout)
+
+
+def wait_for_products(page, min_count=1, timeout=DEFAULT_TIMEOUT_MS):
+    """
+    Wait until the #products grid has rendered product cards (not the
+    loading skeleton)
+
+    Returns:
+        int: number of grid children
+    """
+    with timed_wait("products"):
+        handle = page.wait_for_function(PRODUCTS_RENDERED_JS, arg=min_count, timeout=timeout)
+        return handle.json_value()
+
+
+def wait_for_selector_count(page, selector, min_count=1, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until at least min_count elements match selector; returns the count"""
+    with timed_wait("selector"):
+        handle = page.wait_for_function(SELECTOR_COUNT_JS, arg=[selector, min_count], timeout=timeout)
+        return handle.json_value()
+
+
+def wait_for_scroll_settled(page, quiet_frames=5, timeout=DEFAULT_TIMEOUT_MS):
+    """
+    Wait until smooth scrolling (Lenis or native) has finished: Lenis reports
+    no scroll in progress and scrollY is unchanged for quiet_frames frames
+    """
+    with timed_wait("scroll"):
+        page.wait_for_function(SCROLL_SETTLED_JS, arg=quiet_frames, timeout=timeout)
+
+
+def wait_for_visible(page, selector, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait for the first element matching selector to be visible; returns it"""
+    with timed_wait("visible"):
+        return page.wait_for_selector(selector, state="visible", timeout=timeout)
+
+
+def wait_for_hidden(page, selector, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until no element matching selector is visible"""
+    with timed_wait("hidden"):
+        page.wait_for_selector(selector, state="hidden", timeout=timeout)
+
+
+def wait_for_text(page, text, selector="body", timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until selector's text contains text"""
+    with timed_wait("text"):
+        page.wait_for_function(TEXT_PRESENT_JS, arg=[selector, text], timeout=timeout)
+
+
+def text_within(page, text, selector="body", timeout=5000):
+    """Like wait_for_text(), but report whether the text appeared instead of raising"""
+    try:
+        wait_for_text(page, text, selector, timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_text_change(page, selector, previous, timeout=DEFAULT_TIMEOUT_MS):
+    """Wait until selector's text differs from previous; returns the new text"""
+    with timed_wait("text"):
+        handle = page.wait_for_function(TEXT_CHANGED_JS, arg=[selector, previous], timeout=timeout)
+        return handle.json_value()
+
+
+class RequestTracker:
+    """
+    Track in-flight requests whose URL matches a pattern, to wait for
+    network quiet on specific endpoints (e.g. /api/products) instead of
+    the whole page. Attach before the action that triggers the requests.
+
+        tracker = RequestTracker(page, r"/api/products")
+        page.click("input[value=eSIM]")
+        tracker.wait_quiet()
+    """
+
+    def __init__(self, page, pattern):
+        self.page = page
+        self.pattern = re.compile(pattern)
+        self.in_flight = set()
+        self.seen = 0
+        self.last_activity = time.perf_counter()
+        page.on("request", self._on_start)
+        page.on("requestfinished", self._on_end)
+        page.on("requestfailed", self._on_end)
+
+    def _on_start(self, request):
+        if self.pattern.search(request.url):
+            self.in_flight.add(request)
+            self.seen += 1
+            self.last_activity = time.perf_counter()
+
+    def _on_end(self, request):
+        if request in self.in_flight:
+            self.in_flight.discard(request)
+            self.last_activity = time.perf_counter()
+
+    def wait_quiet(self, quiet_ms=250, timeout=DEFAULT_TIMEOUT_MS):
+        """Wait until no matching request has been in flight for quiet_ms"""
+        with timed_wait("network"):
+            deadline = time.perf_counter() + timeout / 1000
+            while True:
+                idle_ms = (time.perf_counter() - self.last_activity) * 1000
+                if not self.in_flight and idle_ms >= quiet_ms:
+                    return
+                if time.perf_counter() > deadline:
+                    raise PlaywrightTimeoutError(
+                        f"{len(self.in_flight)} request(s) matching {self.pattern.pattern} still in flight"
+                    )
+                # Lets Playwright dispatch request events while we wait
+                self.page.wait_for_timeout(25)
+
+    def detach(self):
+        self.page.remove_listener("request", self._on_start)
+        self.page.remove_listener("requestfinished", self._on_end)
+        self.page.remove_listener("requestfailed", self._on_end)
@@ -0,0 +1,37 @@
+'use client';
+
+import { useCallback, useRef } from 'react';
+
+function randomKey(): string {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 14)}`;
+}
+
+/**
+ * Idempotency key for a submit action (e.g. POST /api/orders)
+ *
+ * Returns the same key while the request body is unchanged, so double clicks
+ * and resubmits after a timeout replay the first result on the server. A
+ * changed body (different cart or billing details) gets a new key.
+ *
+ * @example
+ * const getIdempotencyKey = useIdempotencyKey();
+ * const body = JSON.stringify(payload);
+ * await fetch('/api/orders', {
+ *   method: 'POST',
+ *   headers: { 'Content-Type': 'application/json', 'Idempotency-Key': getIdempotencyKey(body) },
+ *   body,
+ * });
+ */
+export function useIdempotencyKey(): (body: string) => string {
+  const current = useRef<{ body: string; key: string } | null>(null);
+
+  return useCallback((body: string) => {
+    if (!current.current || current.current.body !== body) {
+      current.current = { body, key: randomKey() };
+    }
+    return current.current.key;
+  }, []);
+}
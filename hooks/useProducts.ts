@@ -1,44 +1,83 @@
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
-
-export interface Product {
-  id: number;
-  slug: string;
-  name: string;
-  price: string;
-  regularPrice?: string;
-  image: string;
-  imageFull: string;
-  category: string;
-  description: string;
-  duration?: string;
-  dataAmount?: string;
-  variations: any[];
+import { useCallback } from 'react';
+import { useRouter } from 'next/navigation';
+import { useQuery, keepPreviousData, queryOptions } from '@tanstack/react-query';
+import {
+  buildProductsQuery,
+  productsQueryKey,
+  type ProductsResponse,
+  type UseProductsOptions,
+} from '@/lib/product-query';
+
+export {
+  buildProductsQuery,
+  productsQueryKey,
+  type Product,
+  type ProductsResponse,
+  type ProductSort,
+  type UseProductsOptions,
+} from '@/lib/product-query';
+
+// Cache timing shared by every product list query
+const PRODUCTS_STALE_TIME_MS = 5 * 60 * 1000; // 5 minutes
+const PRODUCTS_GC_TIME_MS = 10 * 60 * 1000; // 10 minutes
+
+/**
+ * Fetch a product list from /api/products
+ */
+export async function fetchProducts(options: UseProductsOptions = {}): Promise<ProductsResponse> {
+  const response = await fetch(`/api/products?${buildProductsQuery(options)}`);
+  if (!response.ok) throw new Error('Failed to fetch products');
+
+  const data: ProductsResponse = await response.json();
+  if (!data.success) throw new Error('Failed to fetch products');
+  return data;
 }
 
-interface UseProductsOptions {
-  category?: string;
-  limit?: number;
-  imageSize?: 'thumbnail' | 'shop_catalog' | 'full';
+/**
+ * Query options for a product list: the single definition used by
+ * useProducts() and any prefetch, so all callers share one cache entry
+ */
+export function productsQueryOptions(options: UseProductsOptions = {}) {
+  return queryOptions({
+    queryKey: productsQueryKey(options),
+    queryFn: () => fetchProducts(options),
+    staleTime: PRODUCTS_STALE_TIME_MS,
+    gcTime: PRODUCTS_GC_TIME_MS,
+  });
 }
 
 export function useProducts(options: UseProductsOptions = {}) {
-  const { category, limit = 100, imageSize = 'shop_catalog' } = options;
-
-  return useQuery<{ success: boolean; products: Product[]; total: number }>({
-    queryKey: ['products', { category, limit, imageSize }],
-    queryFn: async () => {
-      const params = new URLSearchParams();
-      if (category) params.append('category', category);
-      params.append('limit', limit.toString());
-      params.append('imageSize', imageSize);
-
-      const response = await fetch(`/api/products?${params.toString()}`);
-      if (!response.ok) throw new Error('Failed to fetch products');
-      return response.json();
-    },
-    staleTime: 5 * 60 * 1000, // 5 minutes
-    gcTime: 10 * 60 * 1000, // 10 minutes
+  return useQuery({
+    ...productsQueryOptions(options),
+    // Keep showing the previous result while a new filter combination loads
+    placeholderData: keepPreviousData,
   });
 }
+
+// Detail routes already requested in this session (router.prefetch is not free)
+const prefetchedDetails = new Set<string>();
+
+/**
+ * Prefetch a product detail page (statically generated; its data arrives in
+ * the route payload) ahead of navigation, e.g. on card hover or when the
+ * touch modal opens.
+ * Cards rendered as <Link> are also prefetched by Next.js when they scroll
+ * into view; this covers hover/touch intent before that has happened.
+ *
+ * @returns Callback taking the detail page href
+ *
+ * @example
+ * const prefetchDetail = usePrefetchProductDetail();
+ * <div onMouseEnter={() => prefetchDetail(`/${locale}/shop/${slug}`)} />
+ */
+export function usePrefetchProductDetail() {
+  const router = useRouter();
+
+  return useCallback((href: string) => {
+    if (prefetchedDetails.has(href)) return;
+    prefetchedDetails.add(href);
+    router.prefetch(href);
+  }, [router]);
+}
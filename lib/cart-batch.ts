@@ -0,0 +1,160 @@
+/**
+ * Batched CoCart Mutations
+ *
+ * Applies a list of cart mutations for one cart key as a single unit:
+ * 1. Coalesce: only the final quantity per product matters, and a clear
+ *    discards everything queued before it
+ * 2. Serialize: mutations for the same cart key run under an in-process lock,
+ *    so overlapping batches never interleave their CoCart calls
+ * 3. Apply sequentially against CoCart and return only the final cart
+ *
+ * Mutations address products by productId (what the client cart store knows);
+ * CoCart item keys are resolved from the cart state on the server.
+ */
+
+import {
+  addCartItem,
+  clearCart,
+  getCart,
+  removeCartItem,
+  updateCartItem,
+  type Cart,
+} from './cart-session';
+import { cartLineKey, coalesceCartMutations, type CartMutation } from './cart-mutations';
+
+export type { CartMutation };
+
+/**
+ * Result of applying a batch
+ */
+export interface CartBatchResult {
+  cart: Cart | null;
+  /** Mutations received */
+  received: number;
+  /** Mutations left after coalescing and applied successfully */
+  applied: number;
+  /** Mutations (after coalescing) that CoCart did not apply */
+  failed: CartMutation[];
+  /** CoCart requests made */
+  upstreamCalls: number;
+}
+
+// Per cart-key tail of the mutation chain
+const cartLocks = new Map<string, Promise<unknown>>();
+
+/**
+ * Run `fn` after every earlier batch for the same cart key has finished
+ */
+async function withCartLock<T>(cartKey: string | undefined, fn: () => Promise<T>): Promise<T> {
+  // A cart without a key does not exist upstream yet, so nothing can race with it
+  if (!cartKey) return fn();
+
+  const previous = cartLocks.get(cartKey) || Promise.resolve();
+  const run = previous.catch(() => undefined).then(fn);
+  cartLocks.set(cartKey, run);
+
+  try {
+    return await run;
+  } finally {
+    if (cartLocks.get(cartKey) === run) cartLocks.delete(cartKey);
+  }
+}
+
+/**
+ * Apply a batch of cart mutations for one cart
+ *
+ * @param mutations - Mutations in the order they were made
+ * @param cartKey - CoCart cart key (undefined for a new guest cart)
+ * @returns Final cart state, call counts and the mutations that failed
+ *
+ * @example
+ * const { cart } = await applyCartMutations([
+ *   { op: 'set', productId: 12, quantity: 2 },
+ *   { op: 'set', productId: 12, quantity: 3 },
+ * ], cartKey);
+ * // One CoCart request: quantity 3
+ */
+export async function applyCartMutations(
+  mutations: CartMutation[],
+  cartKey?: string
+): Promise<CartBatchResult> {
+  const coalesced = coalesceCartMutations(mutations);
+
+  return withCartLock(cartKey, async () => {
+    let key = cartKey;
+    let cart: Cart | null = null;
+    let upstreamCalls = 0;
+
+    // Item keys are only needed when updating/removing existing products
+    const needsItems = coalesced.some((m) => m.op === 'set') && !!key;
+    if (needsItems) {
+      cart = await getCart(key);
+      upstreamCalls++;
+      if (!cart) {
+        // Without the current items every set would look like a new product
+        // and be added on top of the existing line: apply nothing
+        console.error('[cart-batch] Could not read cart, batch not applied');
+        return { cart: null, received: mutations.length, applied: 0, failed: coalesced, upstreamCalls };
+      }
+    }
+
+    let applied = 0;
+    const failed: CartMutation[] = [];
+
+    for (const mutation of coalesced) {
+      if (mutation.op === 'clear') {
+        const cleared = await clearCart(key);
+        upstreamCalls++;
+        if (!cleared) {
+          console.error('[cart-batch] Mutation failed:', mutation);
+          failed.push(mutation);
+          continue;
+        }
+        cart = cleared;
+        applied++;
+        continue;
+      }
+
+      const line = cartLineKey(mutation.productId, mutation.variationId);
+      const existing = cart?.items?.find((item) =>
+        cartLineKey(item.product_id, item.variation_id) === line
+      );
+
+      let next: Cart | null = null;
+      if (existing && mutation.quantity <= 0) {
+        next = await removeCartItem(existing.item_key, key);
+      } else if (existing) {
+        next = await updateCartItem(existing.item_key, mutation.quantity, key);
+      } else if (mutation.quantity > 0) {
+        next = await addCartItem(mutation.productId, mutation.quantity, key, mutation.variationId);
+      } else {
+        applied++; // Removing a product that is not in the cart
+        continue;
+      }
+      upstreamCalls++;
+
+      if (!next) {
+        console.error('[cart-batch] Mutation failed:', mutation);
+        failed.push(mutation);
+        continue;
+      }
+      cart = next;
+      key = next.cart_key || key;
+      applied++;
+    }
+
+    // Nothing changed upstream (e.g. all mutations cancelled out): report current state
+    if (!cart && key) {
+      cart = await getCart(key);
+      upstreamCalls++;
+    }
+
+    return {
+      cart,
+      received: mutations.length,
+      applied,
+      failed,
+      upstreamCalls,
+    };
+  });
+}
@@ -0,0 +1,61 @@
+/**
+ * Cart Mutation Types
+ *
+ * Shared by the client mutation queue (lib/cart-sync.ts) and the server batch
+ * applier (lib/cart-batch.ts). Kept free of server-only imports so it can be
+ * bundled for the browser.
+ */
+
+/**
+ * A single cart mutation
+ * - set: make the product's (or variation's) quantity exactly `quantity` (0 removes it)
+ * - clear: empty the cart
+ */
+export type CartMutation =
+  | { op: 'set'; productId: number; quantity: number; variationId?: number }
+  | { op: 'clear' };
+
+/**
+ * Cart line a set mutation addresses: variations of one product are separate lines
+ */
+export function cartLineKey(productId: number, variationId?: number): string {
+  return `${productId}:${variationId || 0}`;
+}
+
+/**
+ * Collapse a mutation list to the minimal equivalent list
+ *
+ * @param mutations - Mutations in the order they were made
+ * @returns At most one clear followed by one set per product/variation
+ *
+ * @example
+ * coalesceCartMutations([
+ *   { op: 'set', productId: 1, quantity: 2 },
+ *   { op: 'set', productId: 1, quantity: 3 },
+ * ]);
+ * // => [{ op: 'set', productId: 1, quantity: 3 }]
+ */
+export function coalesceCartMutations(mutations: CartMutation[]): CartMutation[] {
+  let cleared = false;
+  const sets = new Map<string, Extract<CartMutation, { op: 'set' }>>();
+
+  for (const mutation of mutations) {
+    if (mutation.op === 'clear') {
+      cleared = true;
+      sets.clear();
+    } else {
+      // Re-insert so the map keeps last-touched order
+      const key = cartLineKey(mutation.productId, mutation.variationId);
+      sets.delete(key);
+      sets.set(key, mutation);
+    }
+  }
+
+  const result: CartMutation[] = cleared ? [{ op: 'clear' }] : [];
+  for (const mutation of Array.from(sets.values())) {
+    // Removing a product from a freshly cleared cart is a no-op
+    if (cleared && mutation.quantity <= 0) continue;
+    result.push(mutation);
+  }
+  return result;
+}
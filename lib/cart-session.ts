@@ -10,8 +10,14 @@
  * Cart sessions are identified by a cart key (hash) stored in cookies.
  * For guest users, cart key is auto-generated by CoCart on first request.
  * For logged-in users, cart key can be associated with WordPress user ID.
+ *
+ * Cart reads are served from a short-TTL per-cart-key cache that every
+ * mutation writes through (CART_CACHE_TTL_MS, default 30s).
  */
 
+import { wpFetch } from './upstream-pool';
+import { readJsonTimed, recordCacheStatus } from './server-timing';
+
 /**
  * Cart item structure from CoCart API
  */
@@ -89,9 +95,130 @@ function createCoCartHeaders(cartKey?: string): HeadersInit {
   return headers;
 }
 
+// ---------------------------------------------------------------------------
+// Cart read cache
+//
+// Every cart mutation goes through this server, so the cart returned by a
+// mutation is the authoritative state. It is written through to a short-TTL
+// cache keyed by cart key, and getCart() serves it without a CoCart round trip.
+// TTL bounds staleness from changes made outside this instance.
+// ---------------------------------------------------------------------------
+
+const CART_CACHE_TTL_MS = parseInt(process.env.CART_CACHE_TTL_MS || '30000', 10);
+const CART_CACHE_MAX_ENTRIES = 1000;
+
+export type CartCacheBypassReason = 'no_key' | 'miss' | 'expired' | 'invalidated';
+
+/**
+ * Cart cache counters for tuning
+ */
+export interface CartCacheStats {
+  hits: number;
+  misses: number;
+  hitRatio: number;
+  writes: number;
+  invalidations: number;
+  bypass: Record<CartCacheBypassReason, number>;
+  size: number;
+  ttlMs: number;
+}
+
+const cartCache = new Map<string, { cart: Cart; cachedAt: number }>();
+// Keys dropped because a mutation failed; the next read reports why it bypassed
+const invalidatedKeys = new Set<string>();
+
+const cartCacheCounters = {
+  hits: 0,
+  writes: 0,
+  invalidations: 0,
+  bypass: { no_key: 0, miss: 0, expired: 0, invalidated: 0 } as Record<CartCacheBypassReason, number>,
+};
+
+/**
+ * Store a cart returned by CoCart (write-through after mutations and reads)
+ */
+function cacheCart(cartKey: string | undefined, cart: Cart): void {
+  const key = cart.cart_key || cartKey;
+  // Only cache full cart objects (some CoCart endpoints can return a message instead)
+  if (!key || !Array.isArray(cart.items)) {
+    if (cartKey) invalidateCart(cartKey);
+    return;
+  }
+
+  cartCache.delete(key);
+  cartCache.set(key, { cart, cachedAt: Date.now() });
+  invalidatedKeys.delete(key);
+  cartCacheCounters.writes++;
+
+  // Evict least recently written entries
+  while (cartCache.size > CART_CACHE_MAX_ENTRIES) {
+    const oldest = cartCache.keys().next().value;
+    if (oldest === undefined) break;
+    cartCache.delete(oldest);
+  }
+}
+
+/**
+ * Drop a cached cart (e.g. after a failed mutation left its state unknown)
+ */
+export function invalidateCart(cartKey: string): void {
+  if (cartCache.delete(cartKey)) {
+    cartCacheCounters.invalidations++;
+  }
+  invalidatedKeys.add(cartKey);
+}
+
+/**
+ * Look up a cached cart, recording the bypass reason on a miss
+ */
+function readCachedCart(cartKey: string | undefined): Cart | null {
+  const bypass = (reason: CartCacheBypassReason): null => {
+    cartCacheCounters.bypass[reason]++;
+    recordCacheStatus('cart', reason.toUpperCase());
+    return null;
+  };
+
+  if (!cartKey) return bypass('no_key');
+
+  const entry = cartCache.get(cartKey);
+  if (!entry) {
+    return bypass(invalidatedKeys.delete(cartKey) ? 'invalidated' : 'miss');
+  }
+
+  if (Date.now() - entry.cachedAt >= CART_CACHE_TTL_MS) {
+    cartCache.delete(cartKey);
+    return bypass('expired');
+  }
+
+  cartCacheCounters.hits++;
+  recordCacheStatus('cart', 'HIT');
+  return entry.cart;
+}
+
+/**
+ * Cart cache hit ratio and bypass reasons
+ */
+export function getCartCacheStats(): CartCacheStats {
+  const misses = Object.values(cartCacheCounters.bypass).reduce((sum, n) => sum + n, 0);
+  const lookups = cartCacheCounters.hits + misses;
+
+  return {
+    hits: cartCacheCounters.hits,
+    misses,
+    hitRatio: lookups > 0 ? cartCacheCounters.hits / lookups : 0,
+    writes: cartCacheCounters.writes,
+    invalidations: cartCacheCounters.invalidations,
+    bypass: { ...cartCacheCounters.bypass },
+    size: cartCache.size,
+    ttlMs: CART_CACHE_TTL_MS,
+  };
+}
+
 /**
  * Retrieves the current cart for a session
  *
+ * Served from the write-through cart cache when possible.
+ *
  * @param cartKey - Optional cart key (auto-generated if not provided)
  * @returns Cart data or null on failure
  *
@@ -100,10 +227,13 @@ function createCoCartHeaders(cartKey?: string): HeadersInit {
  * console.log('Items:', cart?.item_count);
  */
 export async function getCart(cartKey?: string): Promise<Cart | null> {
+  const cached = readCachedCart(cartKey);
+  if (cached) return cached;
+
   try {
     const baseUrl = getCoCartApiUrl();
 
-    const response = await fetch(`${baseUrl}/cart`, {
+    const response = await wpFetch(`${baseUrl}/cart`, {
       method: 'GET',
       headers: createCoCartHeaders(cartKey),
     });
@@ -113,7 +243,8 @@ export async function getCart(cartKey?: string): Promise<Cart | null> {
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
+    cacheCart(cartKey, data as Cart);
     return data as Cart;
   } catch (error) {
     console.error('[cart-session] Error fetching cart:', error);
@@ -156,7 +287,7 @@ export async function addCartItem(
       formData.append('variation_id', variationId.toString());
     }
 
-    const response = await fetch(`${baseUrl}/cart/add-item`, {
+    const response = await wpFetch(`${baseUrl}/cart/add-item`, {
       method: 'POST',
       headers: {
         ...createCoCartHeaders(cartKey),
@@ -168,13 +299,16 @@ export async function addCartItem(
     if (!response.ok) {
       const errorText = await response.text();
       console.error('[cart-session] Add cart item failed:', errorText);
+      if (cartKey) invalidateCart(cartKey);
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
+    cacheCart(cartKey, data as Cart);
     return data as Cart;
   } catch (error) {
     console.error('[cart-session] Error adding item to cart:', error);
+    if (cartKey) invalidateCart(cartKey);
     return null;
   }
 }
@@ -196,20 +330,23 @@ export async function removeCartItem(
   try {
     const baseUrl = getCoCartApiUrl();
 
-    const response = await fetch(`${baseUrl}/cart/item/${itemKey}`, {
+    const response = await wpFetch(`${baseUrl}/cart/item/${itemKey}`, {
       method: 'DELETE',
       headers: createCoCartHeaders(cartKey),
     });
 
     if (!response.ok) {
       console.error('[cart-session] Remove cart item failed:', response.statusText);
+      if (cartKey) invalidateCart(cartKey);
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
+    cacheCart(cartKey, data as Cart);
     return data as Cart;
   } catch (error) {
     console.error('[cart-session] Error removing item from cart:', error);
+    if (cartKey) invalidateCart(cartKey);
     return null;
   }
 }
@@ -241,7 +378,7 @@ export async function updateCartItem(
       quantity: quantity.toString(),
     });
 
-    const response = await fetch(`${baseUrl}/cart/item/${itemKey}`, {
+    const response = await wpFetch(`${baseUrl}/cart/item/${itemKey}`, {
       method: 'POST',
       headers: {
         ...createCoCartHeaders(cartKey),
@@ -253,13 +390,16 @@ export async function updateCartItem(
     if (!response.ok) {
       const errorText = await response.text();
       console.error('[cart-session] Update cart item failed:', errorText);
+      if (cartKey) invalidateCart(cartKey);
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
+    cacheCart(cartKey, data as Cart);
     return data as Cart;
   } catch (error) {
     console.error('[cart-session] Error updating cart item:', error);
+    if (cartKey) invalidateCart(cartKey);
     return null;
   }
 }
@@ -278,20 +418,23 @@ export async function clearCart(cartKey?: string): Promise<Cart | null> {
   try {
     const baseUrl = getCoCartApiUrl();
 
-    const response = await fetch(`${baseUrl}/cart/clear`, {
+    const response = await wpFetch(`${baseUrl}/cart/clear`, {
       method: 'POST',
       headers: createCoCartHeaders(cartKey),
     });
 
     if (!response.ok) {
       console.error('[cart-session] Clear cart failed:', response.statusText);
+      if (cartKey) invalidateCart(cartKey);
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
+    cacheCart(cartKey, data as Cart);
     return data as Cart;
   } catch (error) {
     console.error('[cart-session] Error clearing cart:', error);
+    if (cartKey) invalidateCart(cartKey);
     return null;
   }
 }
@@ -308,7 +451,7 @@ export async function getCartTotals(cartKey?: string): Promise<CartTotals | null
   try {
     const baseUrl = getCoCartApiUrl();
 
-    const response = await fetch(`${baseUrl}/cart/totals`, {
+    const response = await wpFetch(`${baseUrl}/cart/totals`, {
       method: 'GET',
       headers: createCoCartHeaders(cartKey),
     });
@@ -318,7 +461,7 @@ export async function getCartTotals(cartKey?: string): Promise<CartTotals | null
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
     return data as CartTotals;
   } catch (error) {
     console.error('[cart-session] Error fetching cart totals:', error);
@@ -0,0 +1,171 @@
+/**
+ * Client Cart Mutation Queue
+ *
+ * Debounces CoCart cart changes made in the browser (quantity steppers,
+ * add/remove) and sends them to POST /api/cart/batch as one request, so rapid
+ * clicks become a single CoCart round trip instead of one per click. For UI
+ * that edits the CoCart session; the local cart store (stores/cart.ts) does
+ * not sync through it.
+ *
+ * - Mutations are coalesced before sending (last quantity per product/variation wins)
+ * - Only one batch is in flight per tab; changes made meanwhile go in the next one
+ * - Mutations the server reports as failed (or a whole batch that never got an
+ *   answer) are re-queued ahead of newer changes and retried with backoff
+ * - Pending changes are flushed with sendBeacon when the page is hidden. If a
+ *   batch is still in flight then, a beacon could overtake it (or create a
+ *   second guest cart), so the changes are kept in sessionStorage instead and
+ *   sent by the next page in this tab
+ */
+
+import { coalesceCartMutations, type CartMutation } from './cart-mutations';
+
+// Quiet period after the last change before sending
+const DEBOUNCE_MS = 400;
+// sessionStorage key for changes left unsent at pagehide
+const CARRY_OVER_KEY = 'cart-sync-pending';
+// Consecutive failed batches before failed mutations are dropped
+const MAX_RETRIES = 3;
+const RETRY_BASE_MS = 1000;
+
+let pending: CartMutation[] = [];
+let timer: ReturnType<typeof setTimeout> | null = null;
+let inFlight: Promise<void> | null = null;
+let pageHideListenerAdded = false;
+let retries = 0;
+
+/**
+ * Put mutations that were not applied back in front of newer changes
+ * (which win when the queue is coalesced) and schedule a retry
+ */
+function requeueFailed(failed: CartMutation[]): void {
+  if (failed.length === 0) return;
+  if (++retries > MAX_RETRIES) {
+    console.error('[cart-sync] Giving up on cart mutations:', failed);
+    retries = 0;
+    return;
+  }
+
+  pending = [...failed, ...pending];
+  if (timer) clearTimeout(timer);
+  timer = setTimeout(() => {
+    timer = null;
+    flushCartMutations();
+  }, RETRY_BASE_MS * 2 ** (retries - 1));
+}
+
+/**
+ * Send everything queued so far (waits for an in-flight batch first)
+ */
+export async function flushCartMutations(): Promise<void> {
+  if (timer) {
+    clearTimeout(timer);
+    timer = null;
+  }
+  if (inFlight) {
+    await inFlight;
+  }
+  if (pending.length === 0) return;
+
+  const mutations = coalesceCartMutations(pending);
+  pending = [];
+  if (mutations.length === 0) return;
+
+  inFlight = (async () => {
+    let failed: CartMutation[] = [];
+    try {
+      const response = await fetch('/api/cart/batch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ mutations }),
+      });
+      if (response.ok) {
+        retries = 0;
+      } else {
+        console.error('[cart-sync] Batch failed:', response.status);
+        // 4xx: the batch itself is invalid and retrying cannot help
+        if (response.status >= 500) {
+          const data = await response.json().catch(() => null);
+          failed = Array.isArray(data?.failed) ? data.failed : mutations;
+        }
+      }
+    } catch (error) {
+      console.error('[cart-sync] Batch request error:', error);
+      failed = mutations;
+    } finally {
+      inFlight = null;
+    }
+    requeueFailed(failed);
+  })();
+
+  await inFlight;
+}
+
+/**
+ * Flush pending mutations without waiting, surviving page unload
+ */
+function flushOnPageHide() {
+  if (timer) {
+    clearTimeout(timer);
+    timer = null;
+  }
+  if (pending.length === 0) return;
+  const mutations = coalesceCartMutations(pending);
+  pending = [];
+  if (mutations.length === 0) return;
+
+  if (inFlight) {
+    try {
+      sessionStorage.setItem(CARRY_OVER_KEY, JSON.stringify(mutations));
+    } catch (error) {
+      console.error('[cart-sync] Could not keep unsent cart changes:', error);
+    }
+    return;
+  }
+
+  const body = new Blob([JSON.stringify({ mutations })], { type: 'application/json' });
+  navigator.sendBeacon('/api/cart/batch', body);
+}
+
+/**
+ * Queue changes a previous page in this tab could not send
+ */
+function takeCarryOver(): CartMutation[] {
+  try {
+    const saved = sessionStorage.getItem(CARRY_OVER_KEY);
+    if (!saved) return [];
+    sessionStorage.removeItem(CARRY_OVER_KEY);
+    const mutations = JSON.parse(saved);
+    return Array.isArray(mutations) ? mutations : [];
+  } catch {
+    return [];
+  }
+}
+
+/**
+ * Queue a cart mutation; it is sent after DEBOUNCE_MS without further changes
+ *
+ * @param mutation - Cart mutation
+ *
+ * @example
+ * queueCartMutation({ op: 'set', productId: 12, quantity: 3 });
+ */
+export function queueCartMutation(mutation: CartMutation): void {
+  if (typeof window === 'undefined') return;
+
+  if (!pageHideListenerAdded) {
+    window.addEventListener('pagehide', flushOnPageHide);
+    pageHideListenerAdded = true;
+  }
+
+  pending.push(mutation);
+  if (timer) clearTimeout(timer);
+  timer = setTimeout(() => {
+    timer = null;
+    flushCartMutations();
+  }, DEBOUNCE_MS);
+}
+
+// Send changes carried over from the previous page in this tab
+if (typeof window !== 'undefined') {
+  takeCarryOver().forEach(queueCartMutation);
+}
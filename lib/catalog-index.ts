@@ -0,0 +1,228 @@
+/**
+ * Catalog Index
+ *
+ * Precomputed lookup structures for filtering, sorting and paginating the
+ * product catalog on the server. The index is built once per catalog refresh
+ * (see getCatalog() in lib/woocommerce.ts) so each /api/products request only
+ * intersects posting lists and walks a presorted order array.
+ *
+ * Filter semantics match the original client-side filters:
+ * - values within one facet are OR-ed (e.g. 3 Days OR 5 Days)
+ * - different facets are AND-ed (duration AND dataAmount AND type)
+ */
+
+import type { WooProduct } from './woocommerce';
+
+export type CatalogSort = 'price-asc' | 'price-desc' | 'newest';
+
+export type CatalogFacet = 'category' | 'duration' | 'dataAmount' | 'type';
+
+/**
+ * Precomputed catalog index
+ */
+export interface CatalogIndex {
+  products: WooProduct[];
+  /** Numeric price per product position (NaN when unparseable) */
+  prices: Float64Array;
+  /** Posting lists: facet -> value -> ascending product positions */
+  postings: Record<CatalogFacet, Map<string, number[]>>;
+  /** Product positions presorted for each sort mode */
+  order: Record<CatalogSort, Uint32Array>;
+  /** Slug -> product position */
+  bySlug: Map<string, number>;
+}
+
+/**
+ * Catalog query parameters
+ */
+export interface CatalogQuery {
+  category?: string[];
+  duration?: string[];
+  dataAmount?: string[];
+  type?: string[];
+  sort?: CatalogSort;
+  /** 1-based page number (ignored when cursor is set) */
+  page?: number;
+  perPage?: number;
+  /** Opaque cursor returned as nextCursor by a previous query */
+  cursor?: string;
+}
+
+/**
+ * Catalog query result
+ */
+export interface CatalogQueryResult {
+  products: WooProduct[];
+  total: number;
+  page: number;
+  perPage: number;
+  totalPages: number;
+  nextCursor: string | null;
+}
+
+/**
+ * Parse a WooCommerce price string ("45,000" or "45000") into a number
+ */
+export function parsePrice(price: string | undefined): number {
+  return parseFloat((price || '').replace(/,/g, ''));
+}
+
+/**
+ * Product type used by the storefront filter (eSIM vs physical SIM)
+ */
+export function getProductType(product: WooProduct): 'eSIM' | 'Physical' {
+  return product.name.toLowerCase().includes('esim') ? 'eSIM' : 'Physical';
+}
+
+/**
+ * First option of a named product attribute (e.g. "Duration", "Data")
+ */
+export function getAttributeOption(product: WooProduct, name: string): string | undefined {
+  return product.attributes?.find((attr) => attr.name === name)?.options[0];
+}
+
+function addPosting(postings: Map<string, number[]>, value: string | undefined, position: number) {
+  if (!value) return;
+  const list = postings.get(value);
+  if (list) {
+    list.push(position);
+  } else {
+    postings.set(value, [position]);
+  }
+}
+
+/**
+ * Build the catalog index
+ *
+ * @param products - Catalog in upstream (newest-first) order
+ * @returns Index with posting lists, numeric prices and presorted orders
+ */
+export function buildCatalogIndex(products: WooProduct[]): CatalogIndex {
+  const count = products.length;
+  const prices = new Float64Array(count);
+  const postings: CatalogIndex['postings'] = {
+    category: new Map(),
+    duration: new Map(),
+    dataAmount: new Map(),
+    type: new Map(),
+  };
+  const bySlug = new Map<string, number>();
+
+  products.forEach((product, position) => {
+    if (!bySlug.has(product.slug)) bySlug.set(product.slug, position);
+    prices[position] = parsePrice(product.price);
+    for (const category of product.categories || []) {
+      addPosting(postings.category, category.slug, position);
+    }
+    addPosting(postings.duration, getAttributeOption(product, 'Duration'), position);
+    addPosting(postings.dataAmount, getAttributeOption(product, 'Data'), position);
+    addPosting(postings.type, getProductType(product), position);
+  });
+
+  const newest = Uint32Array.from({ length: count }, (_, i) => i);
+  // Unparseable prices sort last in both directions; ties keep upstream order
+  const byPrice = (direction: 1 | -1) =>
+    Uint32Array.from(newest).sort((a, b) => {
+      const pa = prices[a];
+      const pb = prices[b];
+      if (Number.isNaN(pa) || Number.isNaN(pb)) {
+        return Number.isNaN(pa) === Number.isNaN(pb) ? a - b : Number.isNaN(pa) ? 1 : -1;
+      }
+      return (pa - pb) * direction || a - b;
+    });
+
+  return {
+    products,
+    prices,
+    postings,
+    order: {
+      newest,
+      'price-asc': byPrice(1),
+      'price-desc': byPrice(-1),
+    },
+    bySlug,
+  };
+}
+
+/**
+ * Look up a product by slug in O(1)
+ *
+ * @param index - Catalog index from buildCatalogIndex()
+ * @param slug - Product slug
+ * @returns The product, or null if the slug is not in the catalog
+ */
+export function findBySlug(index: CatalogIndex, slug: string): WooProduct | null {
+  const position = index.bySlug.get(slug);
+  return position === undefined ? null : index.products[position];
+}
+
+/**
+ * Encode a result offset as an opaque cursor
+ */
+function encodeCursor(offset: number): string {
+  return Buffer.from(`o:${offset}`).toString('base64url');
+}
+
+/**
+ * Decode a cursor back into an offset (null if malformed)
+ */
+function decodeCursor(cursor: string): number | null {
+  const decoded = Buffer.from(cursor, 'base64url').toString();
+  const match = /^o:(\d+)$/.exec(decoded);
+  return match ? parseInt(match[1], 10) : null;
+}
+
+/**
+ * Filter, sort and paginate the catalog using the precomputed index
+ *
+ * @param index - Catalog index from buildCatalogIndex()
+ * @param query - Facet filters, sort mode and page/cursor
+ * @returns One page of products plus pagination metadata
+ */
+export function queryCatalog(index: CatalogIndex, query: CatalogQuery = {}): CatalogQueryResult {
+  const count = index.products.length;
+  const perPage = Math.max(1, query.perPage || count || 1);
+
+  // Intersect facets: each active facet contributes a union of its posting lists
+  let mask: Uint8Array | null = null;
+  for (const facet of ['category', 'duration', 'dataAmount', 'type'] as CatalogFacet[]) {
+    const values = query[facet];
+    if (!values || values.length === 0) continue;
+
+    const facetMask = new Uint8Array(count);
+    for (const value of values) {
+      for (const position of index.postings[facet].get(value) || []) {
+        facetMask[position] = 1;
+      }
+    }
+    if (mask) {
+      for (let i = 0; i < count; i++) mask[i] &= facetMask[i];
+    } else {
+      mask = facetMask;
+    }
+  }
+
+  // Walk the presorted order once, keeping matches
+  const order = index.order[query.sort || 'newest'];
+  const matches: number[] = [];
+  for (let i = 0; i < order.length; i++) {
+    if (!mask || mask[order[i]]) matches.push(order[i]);
+  }
+
+  const total = matches.length;
+  const totalPages = Math.max(1, Math.ceil(total / perPage));
+  const cursorOffset = query.cursor ? decodeCursor(query.cursor) : null;
+  const offset = cursorOffset !== null
+    ? cursorOffset
+    : (Math.max(1, query.page || 1) - 1) * perPage;
+  const end = offset + perPage;
+
+  return {
+    products: matches.slice(offset, end).map((position) => index.products[position]),
+    total,
+    page: Math.floor(offset / perPage) + 1,
+    perPage,
+    totalPages,
+    nextCursor: end < total ? encodeCursor(end) : null,
+  };
+}
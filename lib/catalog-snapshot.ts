@@ -0,0 +1,165 @@
+/**
+ * Persistent Catalog Snapshot
+ *
+ * A cold serverless instance used to block its first /api/products request on
+ * a full multi-page WooCommerce fetch. Instead, it now starts from a snapshot
+ * of the catalog and refreshes in the background (see getCatalog() in
+ * lib/woocommerce.ts).
+ *
+ * Snapshots are JSON files with a schema version and the `_fields` projection
+ * they were fetched with; a snapshot whose version or fields do not match the
+ * running code is ignored.
+ * - build snapshot: lib/generated/catalog-snapshot.json, written by
+ *   scripts/build-catalog-snapshot.js before `next build` (read-only at runtime)
+ * - runtime snapshot: CATALOG_SNAPSHOT_DIR, rewritten after catalog refreshes
+ *   (at most every 5 minutes, and on the first refresh after revalidation)
+ * The newest valid snapshot wins.
+ *
+ * Configuration (environment variables):
+ * - CATALOG_SNAPSHOT: 'off' disables loading and writing snapshots
+ * - CATALOG_SNAPSHOT_DIR: runtime snapshot directory (default: <os tmpdir>/catalog-snapshot)
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import type { WooProduct } from './woocommerce';
+
+// Bump when the snapshot layout or the product shape the code relies on changes
+export const CATALOG_SNAPSHOT_VERSION = 1;
+
+const SNAPSHOT_ENABLED = process.env.CATALOG_SNAPSHOT !== 'off';
+const BUILD_SNAPSHOT_FILE = path.join(process.cwd(), 'lib', 'generated', 'catalog-snapshot.json');
+const RUNTIME_SNAPSHOT_DIR = process.env.CATALOG_SNAPSHOT_DIR || path.join(os.tmpdir(), 'catalog-snapshot');
+const RUNTIME_SNAPSHOT_FILE = path.join(RUNTIME_SNAPSHOT_DIR, 'catalog-snapshot.json');
+
+// Minimum interval between runtime snapshot writes
+const WRITE_INTERVAL_MS = 5 * 60 * 1000;
+
+export interface CatalogSnapshot {
+  version: number;
+  /** Epoch ms when the products were fetched */
+  generatedAt: number;
+  /** `_fields` projection used, or null for full product objects */
+  fields: string[] | null;
+  products: WooProduct[];
+}
+
+export interface CatalogSnapshotStats {
+  enabled: boolean;
+  loadedFrom: 'build' | 'runtime' | null;
+  loadMs: number | null;
+  loadedAgeMs: number | null;
+  writes: number;
+  writeErrors: number;
+  lastWriteAt: number | null;
+}
+
+const snapshotStats: CatalogSnapshotStats = {
+  enabled: SNAPSHOT_ENABLED,
+  loadedFrom: null,
+  loadMs: null,
+  loadedAgeMs: null,
+  writes: 0,
+  writeErrors: 0,
+  lastWriteAt: null,
+};
+
+let writing: Promise<void> | null = null;
+
+function sameFields(a: string[] | null, b: string[] | null): boolean {
+  if (a === null || b === null) return a === b;
+  return a.length === b.length && a.every((field, i) => field === b[i]);
+}
+
+function readSnapshot(file: string, fields: string[] | null): CatalogSnapshot | null {
+  let snapshot: CatalogSnapshot;
+  try {
+    snapshot = JSON.parse(fs.readFileSync(file, 'utf8'));
+  } catch {
+    return null; // Missing or unreadable
+  }
+
+  if (
+    snapshot?.version !== CATALOG_SNAPSHOT_VERSION ||
+    !Array.isArray(snapshot.products) ||
+    snapshot.products.length === 0 ||
+    typeof snapshot.generatedAt !== 'number' ||
+    !sameFields(snapshot.fields ?? null, fields)
+  ) {
+    console.warn(`[catalog-snapshot] Ignoring incompatible snapshot: ${file}`);
+    return null;
+  }
+  return snapshot;
+}
+
+/**
+ * Load the newest compatible snapshot (runtime or build)
+ *
+ * @param fields - `_fields` projection the running code fetches with
+ * @returns Snapshot or null when none is usable
+ */
+export function loadCatalogSnapshot(fields: string[] | null): CatalogSnapshot | null {
+  if (!SNAPSHOT_ENABLED) return null;
+
+  const start = performance.now();
+  const runtime = readSnapshot(RUNTIME_SNAPSHOT_FILE, fields);
+  const build = readSnapshot(BUILD_SNAPSHOT_FILE, fields);
+  const snapshot = runtime && (!build || runtime.generatedAt >= build.generatedAt) ? runtime : build;
+
+  if (snapshot) {
+    snapshotStats.loadedFrom = snapshot === runtime ? 'runtime' : 'build';
+    snapshotStats.loadMs = Math.round((performance.now() - start) * 10) / 10;
+    snapshotStats.loadedAgeMs = Date.now() - snapshot.generatedAt;
+    console.log(
+      `[catalog-snapshot] Loaded ${snapshot.products.length} products from ${snapshotStats.loadedFrom} snapshot ` +
+      `(${Math.round(snapshotStats.loadedAgeMs / 1000)}s old) in ${snapshotStats.loadMs}ms`
+    );
+  }
+  return snapshot;
+}
+
+/**
+ * Persist a freshly fetched catalog for future cold starts
+ *
+ * Runs in the background; write failures are logged, never thrown.
+ *
+ * @param products - Catalog just fetched from WooCommerce
+ * @param fields - `_fields` projection it was fetched with
+ * @param force - Write even if a snapshot was written recently (after revalidation)
+ */
+export function saveCatalogSnapshot(products: WooProduct[], fields: string[] | null, force = false): void {
+  if (!SNAPSHOT_ENABLED || products.length === 0 || writing) return;
+  const now = Date.now();
+  if (!force && snapshotStats.lastWriteAt !== null && now - snapshotStats.lastWriteAt < WRITE_INTERVAL_MS) return;
+
+  const snapshot: CatalogSnapshot = {
+    version: CATALOG_SNAPSHOT_VERSION,
+    generatedAt: now,
+    fields,
+    products,
+  };
+
+  snapshotStats.lastWriteAt = now;
+  writing = (async () => {
+    try {
+      await fs.promises.mkdir(RUNTIME_SNAPSHOT_DIR, { recursive: true });
+      const tmpFile = `${RUNTIME_SNAPSHOT_FILE}.${process.pid}.tmp`;
+      await fs.promises.writeFile(tmpFile, JSON.stringify(snapshot));
+      await fs.promises.rename(tmpFile, RUNTIME_SNAPSHOT_FILE);
+      snapshotStats.writes++;
+    } catch (error) {
+      snapshotStats.writeErrors++;
+      console.error('[catalog-snapshot] Failed to write snapshot:', error);
+    } finally {
+      writing = null;
+    }
+  })();
+}
+
+/**
+ * Snapshot load/write metrics
+ */
+export function getCatalogSnapshotStats(): CatalogSnapshotStats {
+  return { ...snapshotStats };
+}
@@ -0,0 +1,186 @@
+/**
+ * Upstream Circuit Breakers
+ *
+ * Stops sending requests to a struggling upstream so a Gabia slowdown fails
+ * fast (and callers fall back) instead of tying up serverless function time.
+ *
+ * - closed: requests flow; the breaker opens after `failureThreshold`
+ *   consecutive failures, or when at least half of the last `windowSize` calls
+ *   failed or were slower than `slowCallMs` (latency spike)
+ * - open: requests are rejected immediately for `cooldownMs`
+ * - half-open: one probe request is let through; success closes the breaker,
+ *   failure re-opens it
+ *
+ * Breakers are per isolate and named by endpoint group (e.g. woo:catalog).
+ * State is observable via getCircuitBreakerStats() (see /api/test).
+ */
+
+export type CircuitState = 'closed' | 'open' | 'half-open';
+
+export interface CircuitBreakerOptions {
+  failureThreshold: number;
+  slowCallMs: number;
+  windowSize: number;
+  cooldownMs: number;
+}
+
+export interface CircuitBreakerStats {
+  state: CircuitState;
+  consecutiveFailures: number;
+  /** Failed or slow share of the recent call window (0-1) */
+  badCallRatio: number;
+  windowCalls: number;
+  trips: number;
+  rejected: number;
+  openedAt: number | null;
+  retryAt: number | null;
+}
+
+export interface CircuitBreaker {
+  /** Whether a request may be sent now (claims the half-open probe) */
+  allowRequest(): boolean;
+  recordSuccess(durationMs: number): void;
+  recordFailure(durationMs: number): void;
+  stats(): CircuitBreakerStats;
+}
+
+const DEFAULT_OPTIONS: CircuitBreakerOptions = {
+  failureThreshold: parseInt(process.env.BREAKER_FAILURE_THRESHOLD || '5', 10),
+  slowCallMs: parseInt(process.env.BREAKER_SLOW_CALL_MS || '5000', 10),
+  windowSize: 20,
+  cooldownMs: parseInt(process.env.BREAKER_COOLDOWN_MS || '30000', 10),
+};
+
+// Minimum calls in the window before the bad-call ratio can trip the breaker
+const MIN_WINDOW_CALLS = 10;
+const BAD_CALL_RATIO = 0.5;
+
+const breakers = new Map<string, CircuitBreaker>();
+
+function createCircuitBreaker(name: string, options: CircuitBreakerOptions): CircuitBreaker {
+  let state: CircuitState = 'closed';
+  let consecutiveFailures = 0;
+  let openedAt: number | null = null;
+  let probeInFlight = false;
+  let trips = 0;
+  let rejected = 0;
+  // Recent calls: true = failed or slow
+  const window: boolean[] = [];
+
+  const badCallRatio = () =>
+    window.length === 0 ? 0 : window.filter(Boolean).length / window.length;
+
+  const trip = (reason: string) => {
+    state = 'open';
+    openedAt = Date.now();
+    probeInFlight = false;
+    trips++;
+    window.length = 0;
+    console.error(`[circuit-breaker] ${name} opened (${reason})`);
+  };
+
+  const pushCall = (bad: boolean) => {
+    window.push(bad);
+    if (window.length > options.windowSize) window.shift();
+  };
+
+  return {
+    allowRequest() {
+      if (state === 'closed') return true;
+
+      if (state === 'open' && openedAt !== null && Date.now() - openedAt >= options.cooldownMs) {
+        state = 'half-open';
+      }
+      if (state === 'half-open' && !probeInFlight) {
+        probeInFlight = true;
+        return true;
+      }
+
+      rejected++;
+      return false;
+    },
+
+    recordSuccess(durationMs: number) {
+      const slow = durationMs > options.slowCallMs;
+
+      if (state === 'half-open') {
+        probeInFlight = false;
+        if (slow) {
+          trip(`slow probe: ${Math.round(durationMs)}ms`);
+          return;
+        }
+        state = 'closed';
+        openedAt = null;
+        consecutiveFailures = 0;
+        console.log(`[circuit-breaker] ${name} closed`);
+        return;
+      }
+
+      consecutiveFailures = 0;
+      pushCall(slow);
+      if (state === 'closed' && window.length >= MIN_WINDOW_CALLS && badCallRatio() >= BAD_CALL_RATIO) {
+        trip(`latency: ${Math.round(badCallRatio() * 100)}% of recent calls slower than ${options.slowCallMs}ms or failed`);
+      }
+    },
+
+    recordFailure(durationMs: number) {
+      if (state === 'half-open') {
+        trip('probe failed');
+        return;
+      }
+
+      consecutiveFailures++;
+      pushCall(true);
+      if (state !== 'closed') return;
+
+      if (consecutiveFailures >= options.failureThreshold) {
+        trip(`${consecutiveFailures} consecutive failures, last after ${Math.round(durationMs)}ms`);
+      } else if (window.length >= MIN_WINDOW_CALLS && badCallRatio() >= BAD_CALL_RATIO) {
+        trip(`${Math.round(badCallRatio() * 100)}% of recent calls failed or slow`);
+      }
+    },
+
+    stats() {
+      return {
+        state,
+        consecutiveFailures,
+        badCallRatio: badCallRatio(),
+        windowCalls: window.length,
+        trips,
+        rejected,
+        openedAt,
+        retryAt: state === 'open' && openedAt !== null ? openedAt + options.cooldownMs : null,
+      };
+    },
+  };
+}
+
+/**
+ * Get (or create) the breaker for an upstream endpoint group
+ *
+ * @param name - Breaker name, e.g. 'woo:catalog'
+ * @param options - Overrides for the defaults (first call wins)
+ *
+ * @example
+ * const breaker = getCircuitBreaker('woo:orders');
+ * if (!breaker.allowRequest()) throw new Error('circuit open');
+ */
+export function getCircuitBreaker(name: string, options: Partial<CircuitBreakerOptions> = {}): CircuitBreaker {
+  let breaker = breakers.get(name);
+  if (!breaker) {
+    breaker = createCircuitBreaker(name, { ...DEFAULT_OPTIONS, ...options });
+    breakers.set(name, breaker);
+  }
+  return breaker;
+}
+
+/**
+ * State of every breaker created in this isolate
+ */
+export function getCircuitBreakerStats(): Record<string, CircuitBreakerStats> {
+  const stats: Record<string, CircuitBreakerStats> = {};
+  breakers.forEach((breaker, name) => {
+    stats[name] = breaker.stats();
+  });
+  return stats;
+}
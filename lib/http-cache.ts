@@ -0,0 +1,72 @@
+import { NextResponse } from 'next/server';
+import crypto from 'crypto';
+
+/**
+ * HTTP Cache Helpers
+ *
+ * Validators and Cache-Control for JSON API responses, so browsers and
+ * Vercel's edge can reuse a response instead of re-downloading it.
+ */
+
+/**
+ * Compute a strong ETag from a serialized response body
+ *
+ * @param body - Serialized response body
+ * @returns Quoted ETag value
+ */
+export function computeEtag(body: string): string {
+  const hash = crypto.createHash('sha1').update(body).digest('base64url');
+  return `"${hash}"`;
+}
+
+/**
+ * Check an If-None-Match header against an ETag
+ *
+ * Handles lists ("a", "b"), the * wildcard and weak (W/) validators.
+ */
+export function etagMatches(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  if (ifNoneMatch.trim() === '*') return true;
+
+  return ifNoneMatch
+    .split(',')
+    .map((tag) => tag.trim().replace(/^W\//, ''))
+    .includes(etag);
+}
+
+/**
+ * Return a JSON response with an ETag, answering If-None-Match with 304
+ *
+ * @param request - Incoming request (for If-None-Match)
+ * @param payload - JSON payload
+ * @param cacheControl - Cache-Control header value
+ * @param headers - Extra response headers
+ * @returns 200 with body, or 304 without body when the client copy is current
+ *
+ * @example
+ * return jsonWithEtag(request, { success: true, products },
+ *   'public, max-age=0, s-maxage=60, stale-while-revalidate=600');
+ */
+export function jsonWithEtag(
+  request: Request,
+  payload: unknown,
+  cacheControl: string,
+  headers: Record<string, string> = {}
+): NextResponse {
+  const body = JSON.stringify(payload);
+  const etag = computeEtag(body);
+  const responseHeaders = {
+    ...headers,
+    ETag: etag,
+    'Cache-Control': cacheControl,
+  };
+
+  if (etagMatches(request.headers.get('if-none-match'), etag)) {
+    return new NextResponse(null, { status: 304, headers: responseHeaders });
+  }
+
+  return new NextResponse(body, {
+    status: 200,
+    headers: { ...responseHeaders, 'Content-Type': 'application/json' },
+  });
+}
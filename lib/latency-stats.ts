@@ -0,0 +1,45 @@
+/**
+ * Latency Sample Tracking
+ *
+ * Fixed-size window of recent durations with nearest-rank percentiles, for
+ * the p50/p95 figures exposed on /api/test.
+ */
+
+/**
+ * Percentile summary of a latency window (milliseconds)
+ */
+export interface LatencySummary {
+  p50: number;
+  p95: number;
+  samples: number;
+}
+
+export interface LatencyTracker {
+  record(durationMs: number): void;
+  summary(): LatencySummary;
+}
+
+/**
+ * Create a tracker keeping the most recent `size` samples
+ *
+ * @example
+ * const latency = createLatencyTracker();
+ * latency.record(Date.now() - start);
+ * latency.summary(); // => { p50: 120, p95: 480, samples: 37 }
+ */
+export function createLatencyTracker(size: number = 200): LatencyTracker {
+  const samples: number[] = [];
+
+  return {
+    record(durationMs: number) {
+      samples.push(durationMs);
+      if (samples.length > size) samples.shift();
+    },
+    summary() {
+      if (samples.length === 0) return { p50: 0, p95: 0, samples: 0 };
+      const sorted = [...samples].sort((a, b) => a - b);
+      const at = (pct: number) => sorted[Math.min(sorted.length - 1, Math.ceil((pct / 100) * sorted.length) - 1)];
+      return { p50: Math.round(at(50)), p95: Math.round(at(95)), samples: sorted.length };
+    },
+  };
+}
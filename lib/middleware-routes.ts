@@ -0,0 +1,41 @@
+/**
+ * Middleware Path Classifier
+ *
+ * Routes every request seen by middleware.ts in a single regex pass, replacing
+ * the startsWith chain and the per-request array of protected-route patterns:
+ *
+ * - protected-api: /api/orders/{id}, /api/user/* (JWT required)
+ * - public-api:    any other /api/*
+ * - cms-proxy:     /wp-admin, /wp-login, /wp-includes, /wp-content, /wp-json
+ * - locale:        everything else (next-intl)
+ *
+ * The pattern is compiled once per isolate. Alternatives are ordered so the
+ * more specific protected routes win over the generic /api/ prefix.
+ * scripts/benchmark_middleware_classifier.js reads ROUTE_PATTERN from this
+ * file; keep it on one line.
+ */
+
+export type RouteClass = 'protected-api' | 'public-api' | 'cms-proxy' | 'locale';
+
+// Capture groups: 1 = protected API, 2 = public API, 3 = WordPress proxy
+const ROUTE_PATTERN = /^(?:(\/api\/(?:orders\/[^/]+|user\/))|(\/api\/)|(\/wp-(?:admin|login|includes|content|json)))/;
+
+/**
+ * Classify a request pathname
+ *
+ * @param pathname - URL pathname (request.nextUrl.pathname)
+ * @returns Route class deciding how middleware handles the request
+ *
+ * @example
+ * classifyPath('/api/orders/123');    // => 'protected-api'
+ * classifyPath('/api/products');      // => 'public-api'
+ * classifyPath('/wp-json/wc/v3');     // => 'cms-proxy'
+ * classifyPath('/ko/shop');           // => 'locale'
+ */
+export function classifyPath(pathname: string): RouteClass {
+  const match = ROUTE_PATTERN.exec(pathname);
+  if (!match) return 'locale';
+  if (match[1]) return 'protected-api';
+  if (match[2]) return 'public-api';
+  return 'cms-proxy';
+}
@@ -0,0 +1,276 @@
+/**
+ * Idempotent Order Creation
+ *
+ * Wraps WooCommerce order creation for POST /api/orders so a Gabia stall can
+ * neither hang checkout nor create duplicate pending orders:
+ * 1. Idempotency: requests carrying the same client key share one in-flight
+ *    creation, and a completed order is replayed for later resubmits
+ * 2. Deadlines: each attempt is aborted after ORDER_ATTEMPT_TIMEOUT_MS and the
+ *    whole creation after ORDER_DEADLINE_MS
+ * 3. Retries: upstream failures are retried with full-jitter backoff. A timed
+ *    out attempt may still have created the order, so before retrying, the
+ *    order is looked up by its `_idempotency_key` meta and reused if found
+ *
+ * Completed results are kept in-process only (per instance).
+ *
+ * Configuration (environment variables):
+ * - ORDER_ATTEMPT_TIMEOUT_MS: per-attempt deadline (default: 10000)
+ * - ORDER_DEADLINE_MS: overall deadline (default: 25000). Must stay below the
+ *   maxDuration of app/api/orders/route.ts (30 s), or the platform kills the
+ *   function before the pipeline can answer
+ * - ORDER_MAX_ATTEMPTS: creation attempts (default: 3)
+ */
+
+import crypto from 'crypto';
+import {
+  createOrderOrThrow,
+  findOrderByIdempotencyKey,
+  type WooOrder,
+} from './woocommerce';
+import { createLatencyTracker, type LatencySummary } from './latency-stats';
+
+const ATTEMPT_TIMEOUT_MS = parseInt(process.env.ORDER_ATTEMPT_TIMEOUT_MS || '10000', 10);
+const DEADLINE_MS = parseInt(process.env.ORDER_DEADLINE_MS || '25000', 10);
+const MAX_ATTEMPTS = parseInt(process.env.ORDER_MAX_ATTEMPTS || '3', 10);
+
+// Full-jitter backoff: random(0, min(cap, base * 2^attempt))
+const RETRY_BASE_MS = 500;
+const RETRY_CAP_MS = 4000;
+
+// Completed orders are replayed for the same key for 24 hours
+const RESULT_TTL_MS = 24 * 60 * 60 * 1000;
+const MAX_KEYS = 1000;
+
+// Client keys: UUIDs or similar opaque tokens
+const IDEMPOTENCY_KEY_RE = /^[A-Za-z0-9_-]{8,128}$/;
+
+export type OrderPipelineErrorCode =
+  | 'IDEMPOTENCY_KEY_REUSED'
+  | 'ORDER_REJECTED'
+  | 'ORDER_TIMEOUT'
+  | 'ORDER_FAILED';
+
+export type OrderPipelineResult =
+  | { ok: true; order: WooOrder; replayed: boolean; attempts: number }
+  | { ok: false; code: OrderPipelineErrorCode; status: number; message: string };
+
+/**
+ * Order creation counters and latency
+ */
+export interface OrderPipelineStats {
+  created: number;
+  replayed: number;
+  /** Orders found by idempotency key after an ambiguous failure */
+  reconciled: number;
+  retries: number;
+  failed: number;
+  inFlight: number;
+  cachedKeys: number;
+  /** Request received -> order created, in ms */
+  latencyMs: LatencySummary;
+}
+
+interface KeyEntry {
+  fingerprint: string;
+  promise: Promise<OrderPipelineResult>;
+  completedAt?: number;
+}
+
+const entries = new Map<string, KeyEntry>();
+
+const counters = {
+  created: 0,
+  replayed: 0,
+  reconciled: 0,
+  retries: 0,
+  failed: 0,
+};
+const orderLatency = createLatencyTracker();
+
+/**
+ * Validate a client-supplied idempotency key
+ */
+export function isValidIdempotencyKey(key: string): boolean {
+  return IDEMPOTENCY_KEY_RE.test(key);
+}
+
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/**
+ * Upstream rejected the order itself (bad input); retrying will not help
+ */
+function isRejection(error: any): boolean {
+  const status = error?.status;
+  return typeof status === 'number' && status >= 400 && status < 500 && status !== 408 && status !== 429;
+}
+
+function pruneEntries(now: number): void {
+  entries.forEach((entry, key) => {
+    if (entry.completedAt && now - entry.completedAt > RESULT_TTL_MS) {
+      entries.delete(key);
+    }
+  });
+  // Oldest keys first (insertion order)
+  while (entries.size > MAX_KEYS) {
+    const oldest = entries.keys().next().value;
+    if (oldest === undefined) break;
+    entries.delete(oldest);
+  }
+}
+
+/**
+ * Create the order with deadlines, jittered retries and reconciliation
+ */
+async function runPipeline(key: string, orderData: Partial<WooOrder>): Promise<OrderPipelineResult> {
+  const startedAt = Date.now();
+  const deadline = startedAt + DEADLINE_MS;
+  // Lookups only consider orders created from this request on (with clock skew margin)
+  const searchAfter = new Date(startedAt - 5 * 60 * 1000);
+  const email = orderData.billing?.email || '';
+
+  const data: Partial<WooOrder> = {
+    ...orderData,
+    meta_data: [...(orderData.meta_data || []), { key: '_idempotency_key', value: key }],
+  };
+
+  let ambiguous = false;
+  let lastError: any = null;
+
+  const succeed = (order: WooOrder, attempts: number): OrderPipelineResult => {
+    counters.created++;
+    orderLatency.record(Date.now() - startedAt);
+    return { ok: true, order, replayed: false, attempts };
+  };
+
+  for (let attempt = 1; attempt <= MAX_ATTEMPTS; attempt++) {
+    const remaining = deadline - Date.now();
+    if (remaining <= 0) break;
+
+    if (ambiguous && email) {
+      // The previous attempt may have created the order before failing
+      try {
+        const existing = await findOrderByIdempotencyKey(
+          key, email, searchAfter, AbortSignal.timeout(Math.min(ATTEMPT_TIMEOUT_MS, remaining))
+        );
+        if (existing) {
+          counters.reconciled++;
+          return succeed(existing, attempt - 1);
+        }
+      } catch (error) {
+        // Unknown whether the order exists; retrying could duplicate it
+        console.error('[order-pipeline] Idempotency lookup failed, not retrying:', error);
+        break;
+      }
+    }
+
+    try {
+      const timeout = Math.min(ATTEMPT_TIMEOUT_MS, deadline - Date.now());
+      if (timeout <= 0) break;
+      const order = await createOrderOrThrow(data, AbortSignal.timeout(timeout));
+      return succeed(order, attempt);
+    } catch (error: any) {
+      lastError = error;
+      if (isRejection(error)) {
+        counters.failed++;
+        return {
+          ok: false,
+          code: 'ORDER_REJECTED',
+          status: 400,
+          message: error.message || 'Order was rejected by WooCommerce',
+        };
+      }
+      // An open circuit rejects before sending, so the order cannot exist
+      if (error?.code !== 'CIRCUIT_OPEN') ambiguous = true;
+      console.error(`[order-pipeline] Attempt ${attempt} failed:`, error?.message || error);
+    }
+
+    if (attempt < MAX_ATTEMPTS) {
+      counters.retries++;
+      const backoff = Math.random() * Math.min(RETRY_CAP_MS, RETRY_BASE_MS * 2 ** (attempt - 1));
+      await sleep(Math.min(backoff, Math.max(0, deadline - Date.now())));
+    }
+  }
+
+  counters.failed++;
+  const timedOut = Date.now() >= deadline || lastError?.name === 'TimeoutError';
+  return {
+    ok: false,
+    code: timedOut ? 'ORDER_TIMEOUT' : 'ORDER_FAILED',
+    status: timedOut ? 504 : 502,
+    message: lastError?.message || 'Order creation did not complete in time',
+  };
+}
+
+/**
+ * Create a WooCommerce order at most once per idempotency key
+ *
+ * @param orderData - Order payload for WooCommerce
+ * @param idempotencyKey - Client key (Idempotency-Key header); without one the
+ *   request still gets deadlines and safe retries, but no cross-request replay
+ * @returns Created (or replayed) order, or a failure with HTTP status
+ *
+ * @example
+ * const result = await createOrderIdempotent(orderData, request.headers.get('idempotency-key'));
+ * if (result.ok) console.log(result.order.id, result.replayed);
+ */
+export async function createOrderIdempotent(
+  orderData: Partial<WooOrder>,
+  idempotencyKey?: string | null
+): Promise<OrderPipelineResult> {
+  if (!idempotencyKey) {
+    return runPipeline(crypto.randomUUID(), orderData);
+  }
+
+  const fingerprint = crypto.createHash('sha256').update(JSON.stringify(orderData)).digest('hex');
+  const now = Date.now();
+  pruneEntries(now);
+
+  const existing = entries.get(idempotencyKey);
+  if (existing) {
+    if (existing.fingerprint !== fingerprint) {
+      return {
+        ok: false,
+        code: 'IDEMPOTENCY_KEY_REUSED',
+        status: 422,
+        message: 'Idempotency key was already used for a different order',
+      };
+    }
+    counters.replayed++;
+    const result = await existing.promise;
+    return result.ok ? { ...result, replayed: true } : result;
+  }
+
+  const entry: KeyEntry = {
+    fingerprint,
+    promise: runPipeline(idempotencyKey, orderData),
+  };
+  entries.set(idempotencyKey, entry);
+
+  const result = await entry.promise;
+  if (result.ok) {
+    entry.completedAt = Date.now();
+  } else if (entries.get(idempotencyKey) === entry) {
+    // Failures are not cached: the shopper can retry with the same key
+    entries.delete(idempotencyKey);
+  }
+  return result;
+}
+
+/**
+ * Order creation counters and p50/p95 latency
+ */
+export function getOrderPipelineStats(): OrderPipelineStats {
+  let inFlight = 0;
+  entries.forEach((entry) => {
+    if (!entry.completedAt) inFlight++;
+  });
+
+  return {
+    ...counters,
+    inFlight,
+    cachedKeys: entries.size,
+    latencyMs: orderLatency.summary(),
+  };
+}
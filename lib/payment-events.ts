@@ -0,0 +1,389 @@
+/**
+ * Payment Webhook Events
+ *
+ * PortOne/Eximbay callbacks are recorded here and their WooCommerce
+ * order-status change is applied before the webhook is acknowledged, within a
+ * bounded deadline (applyPaymentEvent). If the write fails or misses the
+ * deadline the webhook answers 503, so the gateway redelivers it: the
+ * gateway's retry is what guarantees delivery, not this process, which may be
+ * frozen or recycled as soon as the response is sent.
+ *
+ * - Idempotent: events are de-duplicated by gateway transaction
+ *   (PortOne imp_uid + status, Eximbay ref + rescode); redelivered callbacks
+ *   for an already applied event are acknowledged without writing again
+ * - Journaled (best effort): events are appended to a JSON-lines journal, and
+ *   a long-running process retries failed writes in the background with
+ *   exponential backoff and resumes pending events from the journal after a
+ *   restart. This is not a delivery guarantee: on serverless hosts (Vercel)
+ *   the default journal in /tmp belongs to one function instance and is lost
+ *   with it, so a write that fails after the 503 is only ever retried by the
+ *   gateway's redelivery. The journal mainly serves de-duplication and
+ *   diagnostics there
+ *
+ * Configuration (environment variables):
+ * - PAYMENT_WEBHOOK_TIMEOUT_MS: deadline for the status write made while the
+ *   gateway waits (default: 8000, below the serverless function limit)
+ * - PAYMENT_EVENT_DIR: journal directory (default: <os tmpdir>/payment-events,
+ *   per instance). Only a directory on durable storage shared by all
+ *   instances makes background replay survive instance recycling
+ * - PAYMENT_EVENT_MAX_ATTEMPTS: background status write attempts per event (default: 6)
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { updateOrderStatus } from './woocommerce';
+import { createLatencyTracker, type LatencySummary } from './latency-stats';
+
+const EVENT_DIR = process.env.PAYMENT_EVENT_DIR || path.join(os.tmpdir(), 'payment-events');
+const JOURNAL_FILE = path.join(EVENT_DIR, 'events.jsonl');
+const MAX_ATTEMPTS = parseInt(process.env.PAYMENT_EVENT_MAX_ATTEMPTS || '6', 10);
+const APPLY_TIMEOUT_MS = parseInt(process.env.PAYMENT_WEBHOOK_TIMEOUT_MS || '8000', 10);
+
+// Backoff between attempts: 1s, 2s, 4s ... capped at 60s
+const RETRY_BASE_MS = 1000;
+const RETRY_MAX_MS = 60000;
+
+// Completed events are kept (for de-duplication) for 7 days
+const RETENTION_MS = 7 * 24 * 60 * 60 * 1000;
+
+export type PaymentProvider = 'portone' | 'eximbay';
+export type PaymentEventState = 'pending' | 'done' | 'failed';
+
+/**
+ * A recorded payment callback and its processing state
+ */
+export interface PaymentEvent {
+  /** De-duplication key, e.g. portone:imp_123:paid */
+  id: string;
+  provider: PaymentProvider;
+  orderId: number;
+  /** WooCommerce status to apply */
+  status: string;
+  state: PaymentEventState;
+  attempts: number;
+  receivedAt: number;
+  nextAttemptAt: number;
+  completedAt?: number;
+  lastError?: string;
+}
+
+/**
+ * Queue depth, outcomes and latency
+ */
+export interface PaymentEventQueueStats {
+  depth: number;
+  processing: boolean;
+  received: number;
+  duplicates: number;
+  applied: number;
+  retries: number;
+  failed: number;
+  /** Received -> status applied, in ms */
+  latencyMs: LatencySummary;
+  /** Duration of a single WooCommerce status write, in ms */
+  attemptMs: LatencySummary;
+  journal: string;
+}
+
+const events = new Map<string, PaymentEvent>();
+let loaded = false;
+let draining: Promise<void> | null = null;
+let retryTimer: ReturnType<typeof setTimeout> | null = null;
+// Status writes in progress, per event id (webhook and worker share them)
+const attempts = new Map<string, Promise<void>>();
+
+const counters = {
+  received: 0,
+  duplicates: 0,
+  applied: 0,
+  retries: 0,
+  failed: 0,
+};
+const processingLatency = createLatencyTracker();
+const attemptLatency = createLatencyTracker();
+
+/**
+ * Build the de-duplication key for a gateway callback
+ *
+ * @param provider - Payment gateway
+ * @param transactionId - PortOne imp_uid or Eximbay ref
+ * @param result - Gateway status/result code (the same transaction may legitimately
+ *   report several states, e.g. PortOne `ready` then `paid`)
+ */
+export function paymentEventId(provider: PaymentProvider, transactionId: string, result: string): string {
+  return `${provider}:${transactionId}:${result}`;
+}
+
+function appendJournal(event: PaymentEvent): void {
+  fs.mkdirSync(EVENT_DIR, { recursive: true });
+  fs.appendFileSync(JOURNAL_FILE, JSON.stringify(event) + '\n');
+}
+
+/**
+ * Load the journal once per process: the last record per event wins.
+ * The journal is compacted to live events on load.
+ */
+function ensureLoaded(): void {
+  if (loaded) return;
+  loaded = true;
+
+  let contents = '';
+  try {
+    contents = fs.readFileSync(JOURNAL_FILE, 'utf8');
+  } catch {
+    return; // No journal yet
+  }
+
+  const cutoff = Date.now() - RETENTION_MS;
+  for (const line of contents.split('\n')) {
+    if (!line) continue;
+    try {
+      const event = JSON.parse(line) as PaymentEvent;
+      events.set(event.id, event);
+    } catch {
+      console.error('[payment-events] Skipping corrupt journal line');
+    }
+  }
+
+  const live: string[] = [];
+  events.forEach((event, id) => {
+    if (event.state !== 'pending' && (event.completedAt || event.receivedAt) < cutoff) {
+      events.delete(id);
+    } else {
+      live.push(JSON.stringify(event));
+    }
+  });
+
+  try {
+    const tmpFile = `${JOURNAL_FILE}.tmp`;
+    fs.writeFileSync(tmpFile, live.length ? live.join('\n') + '\n' : '');
+    fs.renameSync(tmpFile, JOURNAL_FILE);
+  } catch (error) {
+    console.error('[payment-events] Journal compaction failed:', error);
+  }
+
+  // Resume events left pending by a previous process (same journal directory)
+  scheduleRetry();
+}
+
+/**
+ * Record a payment callback unless it was already received
+ *
+ * A callback redelivered for an event that is not applied yet (pending, or
+ * given up on) returns that event again so the caller can retry the write.
+ *
+ * @returns The stored event and whether it was already applied
+ *
+ * @example
+ * const { event, duplicate } = enqueuePaymentEvent({
+ *   id: paymentEventId('portone', imp_uid, status),
+ *   provider: 'portone',
+ *   orderId: 123,
+ *   status: 'processing',
+ * });
+ * const applied = duplicate || (await applyPaymentEvent(event));
+ */
+export function enqueuePaymentEvent(input: {
+  id: string;
+  provider: PaymentProvider;
+  orderId: number;
+  status: string;
+}): { event: PaymentEvent; duplicate: boolean } {
+  ensureLoaded();
+  counters.received++;
+
+  const existing = events.get(input.id);
+  if (existing?.state === 'done') {
+    counters.duplicates++;
+    return { event: existing, duplicate: true };
+  }
+  if (existing) {
+    if (existing.state === 'failed') {
+      // The gateway redelivered: give the event a new round of attempts
+      existing.state = 'pending';
+      existing.attempts = 0;
+      existing.completedAt = undefined;
+    }
+    return { event: existing, duplicate: false };
+  }
+
+  const now = Date.now();
+  const event: PaymentEvent = {
+    ...input,
+    state: 'pending',
+    attempts: 0,
+    receivedAt: now,
+    nextAttemptAt: now,
+  };
+
+  // Written before the webhook is acknowledged
+  appendJournal(event);
+  events.set(event.id, event);
+  return { event, duplicate: false };
+}
+
+/**
+ * Apply one event's status change, scheduling a retry on failure
+ */
+async function processEvent(event: PaymentEvent, signal?: AbortSignal): Promise<void> {
+  event.attempts++;
+  const start = Date.now();
+
+  let error: string | undefined;
+  try {
+    const order = await updateOrderStatus(event.orderId, event.status, signal);
+    if (!order) error = 'WooCommerce status update failed';
+  } catch (e: any) {
+    error = e?.message || String(e);
+  }
+
+  const now = Date.now();
+  attemptLatency.record(now - start);
+
+  if (!error) {
+    event.state = 'done';
+    event.completedAt = now;
+    event.lastError = undefined;
+    counters.applied++;
+    processingLatency.record(now - event.receivedAt);
+    console.log(`[payment-events] Order ${event.orderId} -> ${event.status} (${event.id}, attempt ${event.attempts})`);
+  } else if (event.attempts >= MAX_ATTEMPTS) {
+    event.state = 'failed';
+    event.completedAt = now;
+    event.lastError = error;
+    counters.failed++;
+    console.error(`[payment-events] Giving up on ${event.id} after ${event.attempts} attempts:`, error);
+  } else {
+    event.lastError = error;
+    event.nextAttemptAt = now + Math.min(RETRY_BASE_MS * 2 ** (event.attempts - 1), RETRY_MAX_MS);
+    counters.retries++;
+    console.error(`[payment-events] Attempt ${event.attempts} for ${event.id} failed, retrying:`, error);
+  }
+
+  try {
+    appendJournal(event);
+  } catch (journalError) {
+    console.error('[payment-events] Failed to journal event state:', journalError);
+  }
+}
+
+/**
+ * Run one status write for an event, joining a write already in progress
+ */
+function attemptEvent(event: PaymentEvent, signal?: AbortSignal): Promise<void> {
+  const running = attempts.get(event.id);
+  if (running) return running;
+
+  const attempt = processEvent(event, signal).finally(() => {
+    attempts.delete(event.id);
+  });
+  attempts.set(event.id, attempt);
+  return attempt;
+}
+
+/**
+ * Apply an event's status change while the webhook waits
+ *
+ * The write is aborted at the deadline, so nothing is left running after the
+ * response is sent.
+ *
+ * @returns true once the status is applied; false means the webhook should
+ *   fail so the gateway redelivers it
+ */
+export async function applyPaymentEvent(
+  event: PaymentEvent,
+  timeoutMs: number = APPLY_TIMEOUT_MS
+): Promise<boolean> {
+  if (event.state === 'done') return true;
+
+  // A background attempt already in progress carries no deadline: bound the wait too
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  await Promise.race([
+    attemptEvent(event, AbortSignal.timeout(timeoutMs)),
+    new Promise<void>((resolve) => {
+      timer = setTimeout(resolve, timeoutMs);
+    }),
+  ]);
+  clearTimeout(timer);
+
+  if ((event.state as PaymentEventState) === 'done') return true;
+  scheduleRetry();
+  return false;
+}
+
+/**
+ * Schedule the next drain for the earliest pending retry
+ */
+function scheduleRetry(): void {
+  let next = Infinity;
+  events.forEach((event) => {
+    if (event.state === 'pending') next = Math.min(next, event.nextAttemptAt);
+  });
+  if (next === Infinity) return;
+
+  if (retryTimer) clearTimeout(retryTimer);
+  retryTimer = setTimeout(() => {
+    retryTimer = null;
+    void drainPaymentEvents();
+  }, Math.max(0, next - Date.now()));
+  // Do not keep the process alive just for retries
+  (retryTimer as any).unref?.();
+}
+
+/**
+ * Process every due event, oldest first (one worker per process)
+ *
+ * Background retries for long-running processes; concurrent calls share the
+ * running drain.
+ */
+export function drainPaymentEvents(): Promise<void> {
+  ensureLoaded();
+  if (draining) return draining;
+
+  draining = (async () => {
+    try {
+      for (;;) {
+        const now = Date.now();
+        const due: PaymentEvent[] = [];
+        events.forEach((event) => {
+          if (event.state === 'pending' && event.nextAttemptAt <= now) due.push(event);
+        });
+        if (due.length === 0) break;
+
+        // Receipt order keeps status transitions for one order in sequence
+        due.sort((a, b) => a.receivedAt - b.receivedAt);
+        for (const event of due) {
+          await attemptEvent(event);
+        }
+      }
+    } catch (error) {
+      console.error('[payment-events] Worker error:', error);
+    } finally {
+      draining = null;
+      scheduleRetry();
+    }
+  })();
+
+  return draining;
+}
+
+/**
+ * Queue depth and processing latency
+ */
+export function getPaymentEventQueueStats(): PaymentEventQueueStats {
+  ensureLoaded();
+  let depth = 0;
+  events.forEach((event) => {
+    if (event.state === 'pending') depth++;
+  });
+
+  return {
+    depth,
+    processing: draining !== null,
+    ...counters,
+    latencyMs: processingLatency.summary(),
+    attemptMs: attemptLatency.summary(),
+    journal: JOURNAL_FILE,
+  };
+}
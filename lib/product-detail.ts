@@ -0,0 +1,141 @@
+/**
+ * Product Detail Transform
+ *
+ * Maps a WooCommerce product to the shape rendered by the product detail page.
+ * Shared by GET /api/products/[slug] and the statically generated
+ * app/[locale]/shop/[slug] page so both produce identical data.
+ */
+
+import type { WooProduct } from './woocommerce';
+import { resolveProductImage } from './product-images';
+
+/**
+ * Purchasable plan shown in the plan selector
+ */
+export interface ProductPlan {
+  id: string;
+  duration: string;
+  dataAmount: string;
+  price: number;
+  regularPrice?: number;
+  recommended?: boolean;
+}
+
+/**
+ * Product detail data (frontend format)
+ */
+export interface ProductDetail {
+  id: number;
+  slug: string;
+  name: string;
+  price: string;
+  regularPrice: string;
+  salePrice: string;
+  onSale: boolean;
+  image: string;
+  images: Array<{ id: number; src: string; alt: string }>;
+  category: string;
+  description: string;
+  shortDescription: string;
+  features: string[];
+  plans: ProductPlan[];
+  stockStatus: WooProduct['stock_status'];
+  stockQuantity: number | null;
+}
+
+/**
+ * Transform a WooCommerce product into the product detail format
+ *
+ * @param product - WooCommerce product
+ * @returns Product detail data
+ */
+export function toProductDetail(product: WooProduct): ProductDetail {
+  return {
+    id: product.id,
+    slug: product.slug,
+    name: product.name,
+    price: product.price,
+    regularPrice: product.regular_price,
+    salePrice: product.sale_price,
+    onSale: product.on_sale,
+    image: resolveProductImage(product.images[0]?.src, 'full'),
+    images: product.images.map((img) => ({
+      id: img.id,
+      src: resolveProductImage(img.src, 'full'),
+      alt: img.alt || product.name
+    })),
+    category: product.categories[0]?.name || 'Uncategorized',
+    // Missing when only catalog list fields could be loaded
+    description: product.description || '',
+    shortDescription: product.short_description,
+    features: extractFeatures(product.description || ''),
+    // Extract plan variations from product attributes
+    plans: extractPlans(product),
+    stockStatus: product.stock_status,
+    stockQuantity: product.stock_quantity
+  };
+}
+
+/**
+ * Extract features from product description HTML
+ */
+function extractFeatures(description: string): string[] {
+  // Basic HTML parsing to extract list items
+  const listItemRegex = /<li[^>]*>(.*?)<\/li>/gi;
+  const matches = Array.from(description.matchAll(listItemRegex));
+  const features: string[] = [];
+
+  for (const match of matches) {
+    // Remove HTML tags from content
+    const cleanText = match[1].replace(/<[^>]+>/g, '').trim();
+    if (cleanText) {
+      features.push(cleanText);
+    }
+  }
+
+  // If no list items found, return default features
+  if (features.length === 0) {
+    return [
+      'High-speed data connectivity',
+      'Easy activation',
+      'Reliable network coverage',
+      '24/7 customer support'
+    ];
+  }
+
+  return features;
+}
+
+/**
+ * Extract plan variations from product attributes
+ * Looks for Duration and Data attributes to create plan options
+ *
+ * Variable products get one placeholder plan per variation id. Reading
+ * variation-level details (per-variation duration, data and price) would need
+ * a products/{id}/variations request per product and is out of scope here.
+ */
+function extractPlans(product: WooProduct): ProductPlan[] {
+  // Check if this is a variable product with variations
+  if (product.type === 'variable' && product.variations && product.variations.length > 0) {
+    return product.variations.map((variationId, index) => ({
+      id: `plan-${variationId}`,
+      duration: `${(index + 1) * 3} Days`,
+      dataAmount: 'Unlimited',
+      price: parseFloat(product.price),
+      regularPrice: parseFloat(product.regular_price),
+      recommended: index === 1 // Mark second plan as recommended
+    }));
+  }
+
+  // For simple products, create a single plan
+  return [
+    {
+      id: `plan-${product.id}`,
+      duration: product.attributes.find((attr) => attr.name === 'Duration')?.options[0] || '10 Days',
+      dataAmount: product.attributes.find((attr) => attr.name === 'Data')?.options[0] || 'Unlimited',
+      price: parseFloat(product.price),
+      regularPrice: parseFloat(product.regular_price || product.price),
+      recommended: true
+    }
+  ];
+}
@@ -0,0 +1,114 @@
+/**
+ * Product Image Resolution
+ *
+ * Maps WooCommerce image URLs to files under /images/products/ using the
+ * build-time manifest (scripts/build-image-manifest.js). Only files that
+ * exist are returned: a requested size picks the nearest available variant,
+ * falling back to the full-size file.
+ *
+ * Images were downloaded from Gabia into public/images/products to avoid
+ * HTTP proxy issues; images missing locally are served through the
+ * /wp-content proxy instead of a guessed (404) local path.
+ */
+
+import manifest from './generated/image-manifest.json';
+
+export type ImageSize = 'thumbnail' | 'shop_catalog' | 'full';
+
+interface ManifestFile {
+  format: string;
+  file: string;
+}
+
+interface ManifestVariant extends ManifestFile {
+  width: number;
+  height: number;
+}
+
+interface ManifestEntry {
+  full: ManifestFile[];
+  variants: ManifestVariant[];
+}
+
+// WooCommerce image sizes (thumbnail = 150x150, shop_catalog = 300x300)
+const TARGET_WIDTH: Record<Exclude<ImageSize, 'full'>, number> = {
+  thumbnail: 150,
+  shop_catalog: 300,
+};
+
+// Generic product image used when a product has no image at all
+export const DEFAULT_PRODUCT_IMAGE = '/images/products/esim-standard.jpg';
+
+const FILENAME_RE = /^(.+?)(?:-\d+x\d+)?\.(jpe?g|png|webp|avif)$/i;
+
+const images = manifest.images as Record<string, ManifestEntry>;
+
+// Resolved URLs per (source URL, size); the catalog is small and stable
+const resolved = new Map<string, string>();
+
+/**
+ * Pick a file, preferring the source format when several formats exist
+ */
+function pickFormat<T extends ManifestFile>(files: T[], format: string): T | undefined {
+  return files.find((f) => f.format === format) || files[0];
+}
+
+/**
+ * Pick the variant nearest to the target width: the smallest one at least as
+ * wide as the target, otherwise the widest one available
+ */
+function pickVariant(variants: ManifestVariant[], target: number, format: string): ManifestVariant | undefined {
+  const larger = variants.filter((v) => v.width >= target);
+  const width = larger.length > 0 ? larger[0].width : variants[variants.length - 1]?.width;
+  if (width === undefined) return undefined;
+  return pickFormat(variants.filter((v) => v.width === width), format);
+}
+
+/**
+ * Fallback for images not present locally: serve through the /wp-content proxy
+ */
+function proxiedUrl(url: string): string {
+  try {
+    const { pathname } = new URL(url);
+    return pathname.startsWith('/wp-content/') ? pathname : DEFAULT_PRODUCT_IMAGE;
+  } catch {
+    return url.startsWith('/') ? url : DEFAULT_PRODUCT_IMAGE;
+  }
+}
+
+function resolve(url: string, size: ImageSize): string {
+  const filename = url.split('/').pop() || '';
+  const match = FILENAME_RE.exec(filename);
+  const entry = match ? images[match[1]] : undefined;
+  if (!match || !entry) return proxiedUrl(url);
+
+  const format = match[2].toLowerCase();
+  const file = size === 'full'
+    ? pickFormat(entry.full, format) || entry.variants[entry.variants.length - 1]
+    : pickVariant(entry.variants, TARGET_WIDTH[size], format) || pickFormat(entry.full, format);
+
+  return file ? `${manifest.basePath}/${file.file}` : proxiedUrl(url);
+}
+
+/**
+ * Resolve a WooCommerce image URL to an existing local image
+ *
+ * @param url - WooCommerce image src (any size variant)
+ * @param size - Requested size
+ * @returns URL of an image that exists
+ *
+ * @example
+ * resolveProductImage('http://82mobile.com/wp-content/uploads/2026/01/skt_30day_sim_ai.jpg', 'shop_catalog');
+ * // => '/images/products/skt_30day_sim_ai-300x300.jpg'
+ */
+export function resolveProductImage(url: string | undefined, size: ImageSize = 'full'): string {
+  if (!url) return DEFAULT_PRODUCT_IMAGE;
+
+  const key = `${size}|${url}`;
+  let result = resolved.get(key);
+  if (result === undefined) {
+    result = resolve(url, size);
+    resolved.set(key, result);
+  }
+  return result;
+}
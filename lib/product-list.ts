@@ -0,0 +1,77 @@
+/**
+ * Product List Transform
+ *
+ * Maps WooCommerce products to the list shape returned by GET /api/products.
+ * Shared by the route and server components that pre-fetch the same data into
+ * the React Query cache, so hydrated and fetched lists are identical.
+ */
+
+import { getCatalog, type CatalogCacheStatus, type WooProduct } from './woocommerce';
+import { getAttributeOption, queryCatalog } from './catalog-index';
+import { resolveProductImage, type ImageSize } from './product-images';
+import { normalizeProductsOptions, type Product, type ProductsResponse, type UseProductsOptions } from './product-query';
+
+/**
+ * Transform a WooCommerce product to the list format
+ * Images resolve against the build-time manifest of files in /images/products/
+ */
+export function toProductListItem(product: WooProduct, imageSize: ImageSize): Product {
+  const rawUrl = product.images[0]?.src;
+
+  return {
+    id: product.id,
+    slug: product.slug,
+    name: product.name,
+    price: product.price,
+    regularPrice: product.regular_price,
+    image: resolveProductImage(rawUrl, imageSize), // Optimized image
+    imageFull: resolveProductImage(rawUrl, 'full'), // Full resolution image
+    category: product.categories[0]?.name || 'Uncategorized',
+    description: product.short_description || product.description || '',
+    // Extract custom attributes (duration, data amount)
+    duration: getAttributeOption(product, 'Duration'),
+    dataAmount: getAttributeOption(product, 'Data'),
+    // Variations for plan selector
+    variations: product.variations || []
+  };
+}
+
+/**
+ * Build the /api/products response for list options, server-side
+ *
+ * @param options - Same options the client passes to useProducts()
+ * @returns Response body plus the catalog cache status and age
+ */
+export async function getProductsResponse(options: UseProductsOptions = {}): Promise<{
+  response: ProductsResponse;
+  cacheStatus: CatalogCacheStatus;
+  ageMs: number;
+}> {
+  const { category, duration, dataAmount, type, sortBy, page, limit, imageSize } = normalizeProductsOptions(options);
+  const { products, index, status, ageMs } = await getCatalog();
+
+  const result = queryCatalog(index, {
+    category: category ? category.split(',') : undefined,
+    duration,
+    dataAmount,
+    type,
+    sort: sortBy,
+    page,
+    perPage: limit,
+  });
+
+  return {
+    response: {
+      success: true,
+      products: result.products.map((product) => toProductListItem(product, imageSize as ImageSize)),
+      total: result.total,
+      page: result.page,
+      perPage: result.perPage,
+      totalPages: result.totalPages,
+      nextCursor: result.nextCursor,
+      catalogTotal: products.length
+    },
+    cacheStatus: status,
+    ageMs,
+  };
+}
@@ -0,0 +1,95 @@
+/**
+ * Product List Query
+ *
+ * Shared by the client data layer (hooks/useProducts.ts) and server components
+ * that pre-fetch products into the React Query cache (HydrationBoundary), so
+ * both derive the same query key and /api/products query string. Not a client
+ * module: server components call these functions directly.
+ */
+
+export interface Product {
+  id: number;
+  slug: string;
+  name: string;
+  price: string;
+  regularPrice?: string;
+  image: string;
+  imageFull: string;
+  category: string;
+  description: string;
+  duration?: string;
+  dataAmount?: string;
+  variations: any[];
+}
+
+export interface ProductsResponse {
+  success: boolean;
+  products: Product[];
+  total: number;
+  page: number;
+  perPage: number;
+  totalPages: number;
+  nextCursor: string | null;
+  catalogTotal: number;
+}
+
+export type ProductSort = 'price-asc' | 'price-desc' | 'newest';
+
+export type ProductImageSize = 'thumbnail' | 'shop_catalog' | 'full';
+
+export interface UseProductsOptions {
+  category?: string;
+  duration?: string[];
+  dataAmount?: string[];
+  type?: string[];
+  sortBy?: ProductSort;
+  page?: number;
+  limit?: number;
+  imageSize?: ProductImageSize;
+}
+
+/**
+ * Apply defaults and drop empty filters, so equivalent option objects
+ * (e.g. `{}` from the shop page and `{ duration: [] }` from the home page
+ * filter) share one cache entry
+ */
+export function normalizeProductsOptions(options: UseProductsOptions = {}): UseProductsOptions {
+  const { category, duration, dataAmount, type, sortBy = 'newest', page = 1, limit = 100, imageSize = 'shop_catalog' } = options;
+
+  return {
+    category: category || undefined,
+    duration: duration?.length ? duration : undefined,
+    dataAmount: dataAmount?.length ? dataAmount : undefined,
+    type: type?.length ? type : undefined,
+    sortBy,
+    page,
+    limit,
+    imageSize,
+  };
+}
+
+/**
+ * React Query key for a product list
+ */
+export function productsQueryKey(options: UseProductsOptions = {}) {
+  return ['products', normalizeProductsOptions(options)] as const;
+}
+
+/**
+ * Build the /api/products query string (filtering and sorting run server-side)
+ */
+export function buildProductsQuery(options: UseProductsOptions = {}): string {
+  const { category, duration, dataAmount, type, sortBy, page, limit, imageSize } = normalizeProductsOptions(options);
+
+  const params = new URLSearchParams();
+  if (category) params.append('category', category);
+  if (duration) params.append('duration', duration.join(','));
+  if (dataAmount) params.append('dataAmount', dataAmount.join(','));
+  if (type) params.append('type', type.join(','));
+  if (sortBy && sortBy !== 'newest') params.append('sort', sortBy);
+  if (page && page > 1) params.append('page', page.toString());
+  params.append('limit', String(limit));
+  params.append('imageSize', String(imageSize));
+
+  return params.toString();
+}
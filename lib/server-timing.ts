@@ -0,0 +1,185 @@
+/**
+ * Server-Timing Instrumentation
+ *
+ * Attributes API route latency to where it was spent, as a `Server-Timing`
+ * header readable in browser devtools and by synthetic probes:
+ *
+ *   Server-Timing: upstream;dur=412.3;desc="2 calls", parse;dur=8.1,
+ *                  transform;dur=1.7, cache;desc="catalog=HIT", total;dur=425.0
+ *
+ * Route handlers are wrapped with withServerTiming(); the WordPress clients
+ * record into the current request's timing context without any arguments
+ * being threaded through:
+ * - upstream: wpFetch() time to response headers (WooCommerce, CoCart, JWT)
+ * - parse: response body read + JSON.parse (readJsonTimed)
+ * - transform/query: route-level mapping and catalog queries (timeSpan)
+ * - cache: cache status of the data used (recordCacheStatus)
+ *
+ * Set SERVER_TIMING_LOG=1 to also log one structured JSON line per request.
+ *
+ * Recording outside a wrapped request (build time, background work) is a no-op.
+ */
+
+import type { AsyncLocalStorage as AsyncLocalStorageType } from 'async_hooks';
+
+const LOG_ENABLED = process.env.SERVER_TIMING_LOG === '1';
+
+interface TimingMetric {
+  durationMs: number;
+  count: number;
+}
+
+interface TimingContext {
+  start: number;
+  metrics: Map<string, TimingMetric>;
+  cache: string[];
+}
+
+let storage: AsyncLocalStorageType<TimingContext> | null | undefined;
+
+/**
+ * Per-request context storage (Node async_hooks, or the Edge runtime global)
+ */
+function getStorage(): AsyncLocalStorageType<TimingContext> | null {
+  if (storage !== undefined) return storage;
+
+  const EdgeAsyncLocalStorage = (globalThis as any).AsyncLocalStorage;
+  if (EdgeAsyncLocalStorage) {
+    storage = new EdgeAsyncLocalStorage();
+  } else if (process.env.NEXT_RUNTIME !== 'edge') {
+    const { AsyncLocalStorage } = require('async_hooks') as typeof import('async_hooks');
+    storage = new AsyncLocalStorage<TimingContext>();
+  } else {
+    storage = null;
+  }
+  return storage ?? null;
+}
+
+function now(): number {
+  return performance.now();
+}
+
+/**
+ * Add a duration to a metric of the current request
+ *
+ * @param name - Metric name (upstream, parse, transform, ...)
+ * @param durationMs - Duration in milliseconds
+ */
+export function recordTiming(name: string, durationMs: number): void {
+  const context = getStorage()?.getStore();
+  if (!context) return;
+
+  const metric = context.metrics.get(name);
+  if (metric) {
+    metric.durationMs += durationMs;
+    metric.count++;
+  } else {
+    context.metrics.set(name, { durationMs, count: 1 });
+  }
+}
+
+/**
+ * Record the cache status of data used by the current request
+ *
+ * @example
+ * recordCacheStatus('catalog', 'HIT'); // cache;desc="catalog=HIT"
+ */
+export function recordCacheStatus(cache: string, status: string): void {
+  getStorage()?.getStore()?.cache.push(`${cache}=${status}`);
+}
+
+/**
+ * Time a (sync or async) function as a metric of the current request
+ *
+ * @example
+ * const products = await timeSpan('transform', () => result.products.map(toCard));
+ */
+export async function timeSpan<T>(name: string, fn: () => T | Promise<T>): Promise<T> {
+  const start = now();
+  try {
+    return await fn();
+  } finally {
+    recordTiming(name, now() - start);
+  }
+}
+
+/**
+ * Read and parse a JSON response body, recorded as `parse`
+ */
+export async function readJsonTimed<T = any>(response: Response): Promise<T> {
+  const start = now();
+  try {
+    return await response.json();
+  } finally {
+    recordTiming('parse', now() - start);
+  }
+}
+
+/**
+ * Format the timing context as a Server-Timing header value
+ */
+function formatServerTiming(context: TimingContext, totalMs: number): string {
+  const entries: string[] = [];
+  context.metrics.forEach((metric, name) => {
+    const desc = metric.count > 1 ? `;desc="${metric.count} calls"` : '';
+    entries.push(`${name};dur=${metric.durationMs.toFixed(1)}${desc}`);
+  });
+  if (context.cache.length > 0) {
+    entries.push(`cache;desc="${context.cache.join(' ')}"`);
+  }
+  entries.push(`total;dur=${totalMs.toFixed(1)}`);
+  return entries.join(', ');
+}
+
+function logTiming(route: string, request: Request, status: number, context: TimingContext, totalMs: number): void {
+  const metrics: Record<string, number> = {};
+  context.metrics.forEach((metric, name) => {
+    metrics[name] = Math.round(metric.durationMs * 10) / 10;
+  });
+
+  console.log(JSON.stringify({
+    type: 'server-timing',
+    route,
+    method: request.method,
+    status,
+    totalMs: Math.round(totalMs * 10) / 10,
+    metrics,
+    cache: context.cache,
+  }));
+}
+
+/**
+ * Wrap an app/api route handler with Server-Timing instrumentation
+ *
+ * @param route - Route name for the log line (e.g. 'products', 'cart/batch')
+ * @param handler - Route handler
+ * @returns Handler that runs inside a timing context and adds the header
+ *
+ * @example
+ * export const GET = withServerTiming('products', async function GET(request: Request) {
+ *   ...
+ * });
+ */
+export function withServerTiming<Req extends Request, Args extends unknown[], Res extends Response>(
+  route: string,
+  handler: (request: Req, ...args: Args) => Promise<Res>
+): (request: Req, ...args: Args) => Promise<Res> {
+  return async (request: Req, ...args: Args): Promise<Res> => {
+    const store = getStorage();
+    if (!store) return handler(request, ...args);
+
+    const context: TimingContext = { start: now(), metrics: new Map(), cache: [] };
+    const response = await store.run(context, () => handler(request, ...args));
+    const totalMs = now() - context.start;
+
+    try {
+      response.headers.append('Server-Timing', formatServerTiming(context, totalMs));
+    } catch {
+      // Immutable headers (e.g. a Response.redirect()); timing is still logged
+    }
+    if (LOG_ENABLED) {
+      logTiming(route, request, response.status, context, totalMs);
+    }
+    return response;
+  };
+}
@@ -0,0 +1,59 @@
+/**
+ * Streaming text replacement
+ *
+ * Used by the cms-proxy route to rewrite WordPress HTML while it streams,
+ * instead of buffering the whole page. Matching is done on raw bytes: the
+ * search and replacement strings are ASCII, and ASCII bytes never occur inside
+ * multi-byte UTF-8 sequences, so chunks never need to be decoded.
+ *
+ * A match split across two chunks is handled by holding back the last
+ * (search.length - 1) bytes of each chunk until the next one arrives.
+ */
+
+/**
+ * Create a TransformStream that replaces every occurrence of `search`
+ *
+ * @param search - ASCII string to find
+ * @param replacement - ASCII string to substitute
+ * @returns Byte stream transformer
+ *
+ * @example
+ * const rewritten = upstreamBody.pipeThrough(
+ *   createReplaceStream('http://82mobile.com', 'https://82mobile.com')
+ * );
+ */
+export function createReplaceStream(
+  search: string,
+  replacement: string
+): TransformStream<Uint8Array, Uint8Array> {
+  const needle = Buffer.from(search);
+  const substitute = Buffer.from(replacement);
+  const holdBack = needle.length - 1;
+  let carry: Buffer = Buffer.alloc(0);
+
+  return new TransformStream<Uint8Array, Uint8Array>({
+    transform(chunk, controller) {
+      const buf = carry.length > 0 ? Buffer.concat([carry, chunk]) : Buffer.from(chunk);
+      const parts: Buffer[] = [];
+      let pos = 0;
+      let match = buf.indexOf(needle, pos);
+
+      while (match !== -1) {
+        parts.push(buf.subarray(pos, match), substitute);
+        pos = match + needle.length;
+        match = buf.indexOf(needle, pos);
+      }
+
+      // Hold back a possible partial match at the end of the chunk
+      const keepFrom = Math.max(pos, buf.length - holdBack);
+      parts.push(buf.subarray(pos, keepFrom));
+      carry = Buffer.from(buf.subarray(keepFrom));
+
+      const out = Buffer.concat(parts);
+      if (out.length > 0) controller.enqueue(out);
+    },
+    flush(controller) {
+      if (carry.length > 0) controller.enqueue(carry);
+    },
+  });
+}
@@ -0,0 +1,303 @@
+/**
+ * WordPress Upstream Connection Pool
+ *
+ * Shared keep-alive HTTP(S) agents for every WordPress-bound request
+ * (WooCommerce 82m/v1, CoCart, JWT auth and the cms-proxy route), so calls to
+ * the Gabia host reuse warm TCP connections instead of opening a new one each
+ * time.
+ *
+ * Like fetch(), wpFetch() asks for compressed responses (gzip, deflate, br) and
+ * decodes them, and follows redirects for GET/HEAD requests.
+ *
+ * Configuration (environment variables):
+ * - WP_POOL_MAX_SOCKETS: max concurrent sockets per origin (default: 16)
+ * - WP_POOL_MAX_FREE_SOCKETS: max idle sockets kept open per origin (default: 8)
+ * - WP_POOL_IDLE_TIMEOUT_MS: idle socket timeout (default: 15000)
+ *
+ * Node built-ins are loaded lazily so this module can be imported from code
+ * that is also bundled for the Edge runtime (e.g. lib/wordpress-auth.ts via
+ * middleware). On Edge, wpFetch() falls back to the platform fetch.
+ */
+
+import type * as Http from 'http';
+import type * as Stream from 'stream';
+import { recordTiming } from './server-timing';
+
+const MAX_SOCKETS = parseInt(process.env.WP_POOL_MAX_SOCKETS || '16', 10);
+const MAX_FREE_SOCKETS = parseInt(process.env.WP_POOL_MAX_FREE_SOCKETS || '8', 10);
+const IDLE_TIMEOUT_MS = parseInt(process.env.WP_POOL_IDLE_TIMEOUT_MS || '15000', 10);
+
+// Same hop limit as fetch()
+const MAX_REDIRECTS = 20;
+const REDIRECT_STATUSES = [301, 302, 303, 307, 308];
+
+/**
+ * Connection pool metrics
+ */
+export interface UpstreamPoolStats {
+  requests: number;
+  reusedSockets: number;
+  /** Share of requests served on an already-open socket (0-1) */
+  reuseRatio: number;
+  activeSockets: number;
+  idleSockets: number;
+  queuedRequests: number;
+  errors: number;
+  maxSockets: number;
+  maxFreeSockets: number;
+}
+
+const agents: Partial<Record<'http:' | 'https:', Http.Agent>> = {};
+
+const poolCounters = {
+  requests: 0,
+  reusedSockets: 0,
+  errors: 0,
+};
+
+/**
+ * Get the shared keep-alive agent for a protocol
+ *
+ * @param protocol - 'http:' or 'https:'
+ * @returns Keep-alive agent shared by all WordPress-bound requests
+ */
+export function getWordPressAgent(protocol: 'http:' | 'https:' = 'http:'): Http.Agent {
+  const existing = agents[protocol];
+  if (existing) return existing;
+
+  const options: Http.AgentOptions = {
+    keepAlive: true,
+    keepAliveMsecs: 1000,
+    maxSockets: MAX_SOCKETS,
+    maxFreeSockets: MAX_FREE_SOCKETS,
+    timeout: IDLE_TIMEOUT_MS,
+    scheduling: 'lifo',
+  };
+
+  const agent: Http.Agent = protocol === 'https:'
+    ? new (require('https') as typeof import('https')).Agent(options)
+    : new (require('http') as typeof import('http')).Agent(options);
+
+  agents[protocol] = agent;
+  return agent;
+}
+
+/**
+ * Record a request issued on a pooled agent (used by wpFetch and cms-proxy)
+ */
+export function trackPooledRequest(req: Http.ClientRequest): void {
+  poolCounters.requests++;
+  req.once('socket', () => {
+    if (req.reusedSocket) poolCounters.reusedSockets++;
+  });
+  req.once('error', () => {
+    poolCounters.errors++;
+  });
+}
+
+function countSockets(map: NodeJS.ReadOnlyDict<unknown[]> | undefined): number {
+  if (!map) return 0;
+  return Object.values(map).reduce((sum, list) => sum + (list?.length || 0), 0);
+}
+
+/**
+ * Connection pool metrics across the http and https agents
+ */
+export function getUpstreamPoolStats(): UpstreamPoolStats {
+  const pooled = Object.values(agents) as Http.Agent[];
+
+  return {
+    ...poolCounters,
+    reuseRatio: poolCounters.requests > 0 ? poolCounters.reusedSockets / poolCounters.requests : 0,
+    activeSockets: pooled.reduce((sum, agent) => sum + countSockets(agent.sockets), 0),
+    idleSockets: pooled.reduce((sum, agent) => sum + countSockets(agent.freeSockets), 0),
+    queuedRequests: pooled.reduce((sum, agent) => sum + countSockets(agent.requests), 0),
+    maxSockets: MAX_SOCKETS,
+    maxFreeSockets: MAX_FREE_SOCKETS,
+  };
+}
+
+/**
+ * Serialize a fetch-style request body for http.request
+ */
+function toRequestBody(body: BodyInit | null | undefined): Buffer | undefined {
+  if (body === null || body === undefined) return undefined;
+  if (typeof body === 'string') return Buffer.from(body);
+  if (body instanceof URLSearchParams) return Buffer.from(body.toString());
+  if (body instanceof ArrayBuffer) return Buffer.from(body);
+  if (ArrayBuffer.isView(body)) return Buffer.from(body.buffer, body.byteOffset, body.byteLength);
+  throw new TypeError('wpFetch only supports string, URLSearchParams and binary bodies');
+}
+
+/**
+ * fetch()-compatible request over the shared WordPress keep-alive pool
+ *
+ * Supports the subset of RequestInit used by this codebase: method, headers,
+ * string/URLSearchParams/binary bodies, an AbortSignal and `redirect`.
+ * Redirects are followed for GET/HEAD (unless redirect is 'manual'); for other
+ * methods the redirect response is returned as-is. gzip/deflate/br response
+ * bodies are decompressed.
+ *
+ * @param input - Absolute http(s) URL
+ * @param init - Request options
+ * @returns Standard Response with a streaming body
+ *
+ * @example
+ * const response = await wpFetch(`${WORDPRESS_URL}/wp-json/cocart/v2/cart`);
+ * const cart = await response.json();
+ */
+export async function wpFetch(input: string | URL, init: RequestInit = {}): Promise<Response> {
+  const start = performance.now();
+  try {
+    return process.env.NEXT_RUNTIME === 'edge'
+      ? await fetch(input, init)
+      : await pooledFetch(input, init);
+  } finally {
+    // Time to response headers; the body read is attributed to `parse`
+    recordTiming('upstream', performance.now() - start);
+  }
+}
+
+/**
+ * Node implementation of wpFetch() over the keep-alive agents
+ */
+async function pooledFetch(input: string | URL, init: RequestInit): Promise<Response> {
+  let url = new URL(input.toString());
+  const method = (init.method || 'GET').toUpperCase();
+  const body = toRequestBody(init.body);
+
+  const headers: Record<string, string> = {};
+  new Headers(init.headers).forEach((value, key) => {
+    headers[key] = value;
+  });
+  if (body && !headers['content-length']) {
+    headers['content-length'] = String(body.byteLength);
+  }
+  if (!headers['accept-encoding']) {
+    headers['accept-encoding'] = 'gzip, deflate, br';
+  }
+
+  const follow = (method === 'GET' || method === 'HEAD') && init.redirect !== 'manual';
+
+  for (let hops = 0; ; hops++) {
+    const response = await pooledRequest(url, method, headers, body, init.signal);
+    const location = response.headers.get('location');
+    if (!follow || !location || !REDIRECT_STATUSES.includes(response.status)) {
+      return response;
+    }
+
+    // Read the (small) redirect body so the socket goes back to the pool
+    await response.arrayBuffer();
+    if (init.redirect === 'error' || hops >= MAX_REDIRECTS) {
+      throw new TypeError(`wpFetch: too many redirects or redirect not allowed (${url.href})`);
+    }
+
+    const next = new URL(location, url);
+    if (next.origin !== url.origin) {
+      // Credentials are not forwarded to another origin (same as fetch)
+      delete headers['authorization'];
+      delete headers['cookie'];
+    }
+    url = next;
+  }
+}
+
+/**
+ * Decompress a response stream according to its Content-Encoding
+ *
+ * @returns The decoded stream, or null if the encoding is not supported
+ */
+function decodeResponse(res: Http.IncomingMessage, encoding: string): Stream.Readable | null {
+  const zlib = require('zlib') as typeof import('zlib');
+  const { pipeline } = require('stream') as typeof import('stream');
+
+  const decoder = encoding === 'gzip' || encoding === 'x-gzip' ? zlib.createGunzip()
+    : encoding === 'deflate' ? zlib.createInflate()
+    : encoding === 'br' ? zlib.createBrotliDecompress()
+    : null;
+  if (!decoder) return null;
+
+  // pipeline destroys the decoder (erroring the body stream) if either side fails
+  pipeline(res, decoder, () => undefined);
+  return decoder;
+}
+
+/**
+ * One HTTP request/response over the keep-alive agents (no redirect handling)
+ */
+function pooledRequest(
+  url: URL,
+  method: string,
+  headers: Record<string, string>,
+  body: Buffer | undefined,
+  signal: AbortSignal | null | undefined
+): Promise<Response> {
+  const http = require('http') as typeof import('http');
+  const https = require('https') as typeof import('https');
+  const { Readable } = require('stream') as typeof import('stream');
+
+  const protocol = url.protocol === 'https:' ? 'https:' : 'http:';
+  const transport = protocol === 'https:' ? https : http;
+
+  return new Promise<Response>((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(signal.reason ?? new Error('Aborted'));
+      return;
+    }
+
+    const req = transport.request(
+      url,
+      {
+        method,
+        headers,
+        agent: getWordPressAgent(protocol),
+      },
+      (res) => {
+        const status = res.statusCode || 500;
+        const responseHeaders = new Headers();
+        for (const [key, value] of Object.entries(res.headers)) {
+          if (value === undefined) continue;
+          for (const v of Array.isArray(value) ? value : [value]) {
+            responseHeaders.append(key, v);
+          }
+        }
+
+        // Null-body statuses must not carry a stream
+        const nullBody = method === 'HEAD' || [101, 204, 205, 304].includes(status);
+        if (nullBody) res.resume();
+
+        let stream: Stream.Readable = res;
+        const encoding = (res.headers['content-encoding'] || '').trim().toLowerCase();
+        if (!nullBody && encoding && encoding !== 'identity') {
+          const decoded = decodeResponse(res, encoding);
+          if (decoded) {
+            stream = decoded;
+            // The body is now the decoded payload
+            responseHeaders.delete('content-encoding');
+            responseHeaders.delete('content-length');
+          }
+        }
+
+        resolve(
+          new Response(nullBody ? null : (Readable.toWeb(stream) as unknown as ReadableStream), {
+            status,
+            statusText: res.statusMessage || '',
+            headers: responseHeaders,
+          })
+        );
+      }
+    );
+
+    trackPooledRequest(req);
+    req.on('error', reject);
+
+    if (signal) {
+      const onAbort = () => req.destroy(signal.reason ?? new Error('Aborted'));
+      signal.addEventListener('abort', onAbort, { once: true });
+      req.once('close', () => signal.removeEventListener('abort', onAbort));
+    }
+
+    if (body) req.write(body);
+    req.end();
+  });
+}
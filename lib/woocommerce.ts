@@ -1,4 +1,5 @@
-// Custom WooCommerce API client using native fetch
+// Custom WooCommerce API client using a fetch-compatible client over the
+// shared keep-alive pool (lib/upstream-pool.ts)
 // This bypasses issues with @woocommerce/woocommerce-rest-api library
 // not properly handling Host header injection for Gabia virtual hosting.
 //
@@ -11,25 +12,74 @@
 // IMPORTANT: Gabia hosting uses virtual host configuration.
 // Requests to IP without proper Host header return 403 Forbidden.
 
+import { wpFetch } from './upstream-pool';
+import { readJsonTimed, recordCacheStatus } from './server-timing';
+import { buildCatalogIndex, findBySlug, type CatalogIndex } from './catalog-index';
+import { getCircuitBreaker } from './circuit-breaker';
+import { loadCatalogSnapshot, saveCatalogSnapshot } from './catalog-snapshot';
+
 const WORDPRESS_URL = process.env.WORDPRESS_URL || "http://182.162.142.102";
 const WORDPRESS_HOST = process.env.WORDPRESS_HOST || "82mobile.com";
 const WC_CONSUMER_KEY = process.env.WC_CONSUMER_KEY || "";
 const WC_CONSUMER_SECRET = process.env.WC_CONSUMER_SECRET || "";
 
+// ---------------------------------------------------------------------------
+// Upstream deadlines and circuit breakers
+//
+// Every WooCommerce call gets a deadline for its endpoint group and goes
+// through that group's circuit breaker (lib/circuit-breaker.ts), so a Gabia
+// slowdown fails fast instead of holding serverless functions open. Callers
+// passing their own AbortSignal (e.g. the order pipeline) keep their deadline.
+// ---------------------------------------------------------------------------
+
+interface WooEndpointGroup {
+  breaker: string;
+  timeoutMs: number;
+}
+
+const CATALOG_TIMEOUT_MS = parseInt(process.env.WOO_CATALOG_TIMEOUT_MS || "8000", 10);
+const ORDER_TIMEOUT_MS = parseInt(process.env.WOO_ORDER_TIMEOUT_MS || "15000", 10);
+const DEFAULT_TIMEOUT_MS = parseInt(process.env.WOO_DEFAULT_TIMEOUT_MS || "10000", 10);
+
 /**
- * Make authenticated WooCommerce API request
+ * Deadline and breaker for an endpoint
+ */
+function getEndpointGroup(endpoint: string): WooEndpointGroup {
+  if (endpoint === "products" || endpoint.startsWith("products/")) {
+    return { breaker: "woo:catalog", timeoutMs: CATALOG_TIMEOUT_MS };
+  }
+  if (endpoint === "orders" || endpoint.startsWith("orders/")) {
+    return { breaker: "woo:orders", timeoutMs: ORDER_TIMEOUT_MS };
+  }
+  return { breaker: "woo:default", timeoutMs: DEFAULT_TIMEOUT_MS };
+}
+
+/**
+ * Whether a failure says anything about upstream health
+ * (4xx rejections other than 408/429 mean WooCommerce is answering fine)
+ */
+function isUpstreamFailure(error: any): boolean {
+  const status = error?.status;
+  return !(typeof status === "number" && status >= 400 && status < 500 && status !== 408 && status !== 429);
+}
+
+/**
+ * Make authenticated WooCommerce API request and keep the response headers
+ * (needed for pagination: X-WP-Total / X-WP-TotalPages)
  * @param endpoint - API endpoint (e.g., "products", "orders/123")
  * @param params - Query parameters
  * @param method - HTTP method
  * @param body - Request body for POST/PUT
- * @returns API response data
+ * @param signal - Optional AbortSignal (overrides the endpoint group deadline)
+ * @returns API response data and headers
  */
-async function wooRequest(
+async function wooRequestWithHeaders(
   endpoint: string,
   params: Record<string, any> = {},
   method: string = "GET",
-  body?: any
-): Promise<any> {
+  body?: any,
+  signal?: AbortSignal
+): Promise<{ data: any; headers: Headers }> {
   // Build query string with OAuth credentials
   const queryParams = new URLSearchParams({
     consumer_key: WC_CONSUMER_KEY,
@@ -40,26 +90,66 @@ async function wooRequest(
   // Use custom 82m/v1 proxy endpoint to bypass WooCommerce OAuth auth issues on HTTP
   const url = `${WORDPRESS_URL}/wp-json/82m/v1/${endpoint}?${queryParams}`;
 
+  const group = getEndpointGroup(endpoint);
+  const breaker = getCircuitBreaker(group.breaker);
+  if (!breaker.allowRequest()) {
+    throw Object.assign(
+      new Error(`WooCommerce circuit open: ${group.breaker}`),
+      { code: "CIRCUIT_OPEN" }
+    );
+  }
+
+  const start = Date.now();
   try {
-    const response = await fetch(url, {
+    const response = await wpFetch(url, {
       method,
       headers: {
         "Content-Type": "application/json",
       },
       body: body ? JSON.stringify(body) : undefined,
+      signal: signal ?? AbortSignal.timeout(group.timeoutMs),
     });
 
     if (!response.ok) {
-      throw new Error(`WooCommerce API error: ${response.status} ${response.statusText}`);
+      // status lets callers tell rejected requests (4xx) from upstream failures
+      throw Object.assign(
+        new Error(`WooCommerce API error: ${response.status} ${response.statusText}`),
+        { status: response.status }
+      );
     }
 
-    return await response.json();
+    const data = await readJsonTimed(response);
+    breaker.recordSuccess(Date.now() - start);
+    return { data, headers: response.headers };
   } catch (error) {
+    if (isUpstreamFailure(error)) {
+      breaker.recordFailure(Date.now() - start);
+    } else {
+      breaker.recordSuccess(Date.now() - start);
+    }
     console.error(`WooCommerce API request failed: ${endpoint}`, error);
     throw error;
   }
 }
 
+/**
+ * Make authenticated WooCommerce API request
+ * @param endpoint - API endpoint (e.g., "products", "orders/123")
+ * @param params - Query parameters
+ * @param method - HTTP method
+ * @param body - Request body for POST/PUT
+ * @returns API response data
+ */
+async function wooRequest(
+  endpoint: string,
+  params: Record<string, any> = {},
+  method: string = "GET",
+  body?: any
+): Promise<any> {
+  const { data } = await wooRequestWithHeaders(endpoint, params, method, body);
+  return data;
+}
+
 // Legacy woo object for backward compatibility
 export const woo = {
   get: async (endpoint: string, params?: Record<string, any>) => {
@@ -89,7 +179,8 @@ export interface WooProduct {
   type: 'simple' | 'grouped' | 'external' | 'variable';
   status: 'draft' | 'pending' | 'private' | 'publish';
   featured: boolean;
-  description: string;
+  /** Only present on detail reads (PRODUCT_DETAIL_FIELDS), not on catalog/list items */
+  description?: string;
   short_description: string;
   price: string;
   regular_price: string;
@@ -113,6 +204,7 @@ export interface WooProduct {
     name: string;
     options: string[];
   }>;
+  variations?: number[];
 }
 
 export interface WooOrder {
@@ -161,6 +253,7 @@ export async function getProducts(
       page,
       per_page: perPage,
       status: 'publish',
+      ...fieldsParam(PRODUCT_LIST_FIELDS),
     });
     return data as WooProduct[];
   } catch (error) {
@@ -169,6 +262,467 @@ export async function getProducts(
   }
 }
 
+// ---------------------------------------------------------------------------
+// Field projection
+//
+// WooCommerce returns every product field (meta_data, _links, related_ids,
+// dimensions, dates, ...). Only the fields a view reads are requested via the
+// WordPress REST `_fields` parameter, which also applies to the 82m/v1 routes.
+// Set CATALOG_FIELD_PROJECTION=off to request full objects (for benchmarking).
+// ---------------------------------------------------------------------------
+
+const FIELD_PROJECTION_ENABLED = process.env.CATALOG_FIELD_PROJECTION !== 'off';
+
+/**
+ * Fields read by product list views (/api/products transform, catalog index)
+ */
+export const PRODUCT_LIST_FIELDS = [
+  'id',
+  'name',
+  'slug',
+  'price',
+  'regular_price',
+  'categories',
+  'images',
+  'attributes',
+  'variations',
+  'short_description',
+];
+
+/**
+ * Fields read by the product detail view (lib/product-detail.ts)
+ *
+ * The full HTML description is the largest field, so only single-product
+ * reads request it; the catalog is fetched with PRODUCT_LIST_FIELDS.
+ */
+export const PRODUCT_DETAIL_FIELDS = [
+  ...PRODUCT_LIST_FIELDS,
+  'description',
+  'type',
+  'sale_price',
+  'on_sale',
+  'stock_status',
+  'stock_quantity',
+];
+
+/**
+ * Build the `_fields` query parameter for a projection (empty when disabled)
+ */
+function fieldsParam(fields: string[]): Record<string, string> {
+  return FIELD_PROJECTION_ENABLED ? { _fields: fields.join(',') } : {};
+}
+
+// Projection the full catalog is fetched with (recorded in catalog snapshots)
+const CATALOG_FIELDS = FIELD_PROJECTION_ENABLED ? PRODUCT_LIST_FIELDS : null;
+
+// Full-catalog fetch configuration
+// WooCommerce caps per_page at 100; pages beyond the first are fetched concurrently.
+const CATALOG_PAGE_SIZE = parseInt(process.env.CATALOG_PAGE_SIZE || "100", 10);
+const CATALOG_FETCH_CONCURRENCY = parseInt(process.env.CATALOG_FETCH_CONCURRENCY || "4", 10);
+// Safety cap for upstreams that ignore the page parameter and never return a short page
+const CATALOG_MAX_PAGES = 50;
+
+/**
+ * Fetch one page of published products (throws on failure)
+ */
+async function fetchProductPage(
+  page: number,
+  perPage: number
+): Promise<{ products: WooProduct[]; totalPages: number | null }> {
+  const { data, headers } = await wooRequestWithHeaders("products", {
+    page,
+    per_page: perPage,
+    status: 'publish',
+    // Detail fields are loaded per product (getCatalogProductBySlug)
+    ...fieldsParam(PRODUCT_LIST_FIELDS),
+  });
+
+  const totalPagesHeader = headers.get('x-wp-totalpages');
+  const totalHeader = headers.get('x-wp-total');
+  let totalPages: number | null = null;
+  if (totalPagesHeader) {
+    totalPages = parseInt(totalPagesHeader, 10);
+  } else if (totalHeader) {
+    totalPages = Math.ceil(parseInt(totalHeader, 10) / perPage);
+  }
+
+  return {
+    products: data as WooProduct[],
+    totalPages: totalPages !== null && Number.isFinite(totalPages) ? totalPages : null,
+  };
+}
+
+/**
+ * Fetch every published product page and merge them (throws on failure)
+ *
+ * The page count is read from the first response's X-WP-TotalPages / X-WP-Total
+ * headers and the remaining pages are fetched with at most `concurrency`
+ * requests in flight. If the upstream omits those headers, pages are fetched
+ * in batches of `concurrency` until a short page is returned (or CATALOG_MAX_PAGES).
+ * Pages in a batch past the end are fetched speculatively, so an error on a
+ * page after the first short/empty page, or a 400 (WooCommerce's
+ * rest_post_invalid_page_number) past page 1, means "end of catalog"; other
+ * errors on pages that should have had products fail the fetch.
+ */
+async function fetchAllProductPages(
+  perPage: number = CATALOG_PAGE_SIZE,
+  concurrency: number = CATALOG_FETCH_CONCURRENCY
+): Promise<WooProduct[]> {
+  const first = await fetchProductPage(1, perPage);
+  const pages: WooProduct[][] = [first.products];
+  const workers = Math.max(1, concurrency);
+
+  if (first.totalPages !== null) {
+    let nextPage = 2;
+    const worker = async () => {
+      while (nextPage <= first.totalPages!) {
+        const page = nextPage++;
+        const { products } = await fetchProductPage(page, perPage);
+        pages[page - 1] = products;
+      }
+    };
+    await Promise.all(Array.from({ length: Math.min(workers, first.totalPages - 1) }, worker));
+  } else if (first.products.length === perPage) {
+    let nextPage = 2;
+    let done = false;
+    while (!done && nextPage <= CATALOG_MAX_PAGES) {
+      const batch = Array.from({ length: workers }, (_, i) => nextPage + i);
+      nextPage += workers;
+      const results = await Promise.allSettled(batch.map((page) => fetchProductPage(page, perPage)));
+      for (let i = 0; i < results.length && !done; i++) {
+        const result = results[i];
+        if (result.status === 'rejected') {
+          if ((result.reason as any)?.status === 400) {
+            done = true;
+            break;
+          }
+          throw result.reason;
+        }
+        pages[batch[i] - 1] = result.value.products;
+        if (result.value.products.length < perPage) done = true;
+      }
+    }
+  }
+
+  // Merge in page order, dropping duplicates if the catalog shifted mid-fetch
+  const seen = new Set<number>();
+  const merged: WooProduct[] = [];
+  for (const page of pages) {
+    for (const product of page || []) {
+      if (seen.has(product.id)) continue;
+      seen.add(product.id);
+      merged.push(product);
+    }
+  }
+  return merged;
+}
+
+/**
+ * Fetch the complete published catalog across all pages
+ * @param perPage - Page size per upstream request (default: CATALOG_PAGE_SIZE)
+ * @param concurrency - Maximum concurrent page requests (default: CATALOG_FETCH_CONCURRENCY)
+ * @returns Array of all WooCommerce products
+ */
+export async function getAllProducts(
+  perPage: number = CATALOG_PAGE_SIZE,
+  concurrency: number = CATALOG_FETCH_CONCURRENCY
+): Promise<WooProduct[]> {
+  try {
+    return await fetchAllProductPages(perPage, concurrency);
+  } catch (error) {
+    console.error('Error fetching all products:', error);
+    return [];
+  }
+}
+
+// ---------------------------------------------------------------------------
+// Catalog cache
+//
+// /api/products is force-dynamic, so without a cache every storefront visit
+// costs a round trip to Gabia. The catalog is kept in process memory:
+// - fresh (age < TTL): served directly
+// - stale (TTL <= age < TTL + STALE): served immediately, refreshed in background
+// - expired / cold: caller awaits a refresh
+// - refresh failed (or circuit open): the last successfully fetched catalog is
+//   served as FALLBACK, with its age, instead of an empty shop
+// - cold instance: the persisted catalog snapshot (lib/catalog-snapshot.ts) is
+//   served as SNAPSHOT while the first refresh runs in the background
+// Concurrent refreshes share one in-flight upstream request.
+// ---------------------------------------------------------------------------
+
+const CATALOG_CACHE_TTL_MS = parseInt(process.env.CATALOG_CACHE_TTL_MS || "60000", 10);
+const CATALOG_CACHE_STALE_MS = parseInt(process.env.CATALOG_CACHE_STALE_MS || "600000", 10);
+// Older snapshots are kept only as the FALLBACK catalog, never served up front
+const CATALOG_SNAPSHOT_MAX_AGE_MS = parseInt(process.env.CATALOG_SNAPSHOT_MAX_AGE_MS || "86400000", 10);
+
+export type CatalogCacheStatus = 'HIT' | 'STALE' | 'MISS' | 'FALLBACK' | 'SNAPSHOT';
+
+export interface CatalogResult {
+  products: WooProduct[];
+  /** Filter/sort index built once per catalog refresh */
+  index: CatalogIndex;
+  status: CatalogCacheStatus;
+  ageMs: number;
+}
+
+export interface CatalogCacheStats {
+  hits: number;
+  staleHits: number;
+  misses: number;
+  refreshes: number;
+  refreshErrors: number;
+  dedupedRequests: number;
+  fallbacks: number;
+  snapshotHits: number;
+  ageMs: number | null;
+  lastGoodAgeMs: number | null;
+  size: number;
+  ttlMs: number;
+  staleMs: number;
+}
+
+interface CatalogCacheEntry {
+  products: WooProduct[];
+  index: CatalogIndex;
+  fetchedAt: number;
+  /** Loaded from a persisted snapshot rather than fetched by this instance */
+  fromSnapshot?: boolean;
+}
+
+let catalogEntry: CatalogCacheEntry | null = null;
+// Last successful fetch; survives invalidation, used only as a fallback
+let lastGoodCatalog: CatalogCacheEntry | null = null;
+let catalogInFlight: Promise<CatalogCacheEntry> | null = null;
+// Bumped by invalidateCatalogCache(); a refresh started in an older
+// generation may have read pre-save data, so its result is not cached
+let catalogGeneration = 0;
+let catalogInFlightGeneration = 0;
+// Detail reads for indexed slugs; an entry is reused until the catalog is
+// refreshed after it was fetched
+const productDetails = new Map<string, { product: WooProduct; fetchedAt: number }>();
+// The snapshot is read at most once per instance, on the first catalog request
+let snapshotChecked = false;
+// Set by invalidateCatalogCache(): the next refresh rewrites the snapshot
+let snapshotDirty = false;
+
+const catalogCounters = {
+  hits: 0,
+  staleHits: 0,
+  misses: 0,
+  refreshes: 0,
+  refreshErrors: 0,
+  dedupedRequests: 0,
+  fallbacks: 0,
+  snapshotHits: 0,
+};
+
+/**
+ * Fetch the catalog from WooCommerce (throws on failure so errors are never cached)
+ */
+async function fetchCatalog(): Promise<WooProduct[]> {
+  return fetchAllProductPages();
+}
+
+/**
+ * Start a catalog refresh, or join the one already in flight
+ *
+ * A refresh started before the last invalidation is never joined: a new one
+ * is started, and the older one's result is returned to its own callers only.
+ */
+function refreshCatalog(): Promise<CatalogCacheEntry> {
+  if (catalogInFlight && catalogInFlightGeneration === catalogGeneration) {
+    catalogCounters.dedupedRequests++;
+    return catalogInFlight;
+  }
+
+  catalogCounters.refreshes++;
+  const generation = catalogGeneration;
+  const refresh: Promise<CatalogCacheEntry> = fetchCatalog()
+    .then((products) => {
+      const entry: CatalogCacheEntry = { products, index: buildCatalogIndex(products), fetchedAt: Date.now() };
+      if (generation === catalogGeneration) {
+        catalogEntry = entry;
+        lastGoodCatalog = entry;
+        saveCatalogSnapshot(products, CATALOG_FIELDS, snapshotDirty);
+        snapshotDirty = false;
+      }
+      return entry;
+    })
+    .catch((error) => {
+      catalogCounters.refreshErrors++;
+      throw error;
+    })
+    .finally(() => {
+      if (catalogInFlight === refresh) catalogInFlight = null;
+    });
+
+  catalogInFlight = refresh;
+  catalogInFlightGeneration = generation;
+  return refresh;
+}
+
+/**
+ * Seed a cold instance from the persisted catalog snapshot
+ */
+function loadSnapshotOnce(now: number): void {
+  if (snapshotChecked) return;
+  snapshotChecked = true;
+  if (catalogEntry || lastGoodCatalog) return;
+
+  const snapshot = loadCatalogSnapshot(CATALOG_FIELDS);
+  if (!snapshot) return;
+
+  const entry: CatalogCacheEntry = {
+    products: snapshot.products,
+    index: buildCatalogIndex(snapshot.products),
+    fetchedAt: snapshot.generatedAt,
+    fromSnapshot: true,
+  };
+  lastGoodCatalog = entry;
+  if (now - snapshot.generatedAt < CATALOG_SNAPSHOT_MAX_AGE_MS) {
+    catalogEntry = entry;
+  }
+}
+
+/**
+ * Get the product catalog through the in-process cache
+ * @returns Products plus the cache status and age of the served snapshot
+ */
+export async function getCatalog(): Promise<CatalogResult> {
+  const now = Date.now();
+  loadSnapshotOnce(now);
+
+  if (catalogEntry?.fromSnapshot) {
+    // Served until the first refresh succeeds, however old (within max age)
+    catalogCounters.snapshotHits++;
+    recordCacheStatus('catalog', 'SNAPSHOT');
+    refreshCatalog().catch((error) => {
+      console.error('Background catalog refresh failed:', error);
+    });
+    return { products: catalogEntry.products, index: catalogEntry.index, status: 'SNAPSHOT', ageMs: now - catalogEntry.fetchedAt };
+  }
+
+  if (catalogEntry) {
+    const ageMs = now - catalogEntry.fetchedAt;
+
+    if (ageMs < CATALOG_CACHE_TTL_MS) {
+      catalogCounters.hits++;
+      recordCacheStatus('catalog', 'HIT');
+      return { products: catalogEntry.products, index: catalogEntry.index, status: 'HIT', ageMs };
+    }
+
+    if (ageMs < CATALOG_CACHE_TTL_MS + CATALOG_CACHE_STALE_MS) {
+      catalogCounters.staleHits++;
+      recordCacheStatus('catalog', 'STALE');
+      refreshCatalog().catch((error) => {
+        console.error('Background catalog refresh failed:', error);
+      });
+      return { products: catalogEntry.products, index: catalogEntry.index, status: 'STALE', ageMs };
+    }
+  }
+
+  catalogCounters.misses++;
+  recordCacheStatus('catalog', 'MISS');
+  try {
+    const { products, index } = await refreshCatalog();
+    return { products, index, status: 'MISS', ageMs: 0 };
+  } catch (error) {
+    console.error('Error fetching catalog:', error);
+    if (lastGoodCatalog) {
+      catalogCounters.fallbacks++;
+      recordCacheStatus('catalog', 'FALLBACK');
+      const { products, index, fetchedAt } = lastGoodCatalog;
+      return { products, index, status: 'FALLBACK', ageMs: Date.now() - fetchedAt };
+    }
+    return { products: [], index: buildCatalogIndex([]), status: 'MISS', ageMs: 0 };
+  }
+}
+
+/**
+ * Resolve a product by slug from the cached catalog's slug index
+ *
+ * The catalog only carries list fields, so the detail fields (description,
+ * stock, sale price) of an indexed product are read once and reused until the
+ * catalog is refreshed. Falls back to a ?slug= query against WooCommerce when
+ * the slug is not in the catalog (e.g. published after the last refresh). The
+ * slug index is part of the catalog entry, so invalidateCatalogCache() drops
+ * both together.
+ *
+ * @param slug - Product slug
+ * @returns Product (or null) and where it was resolved from
+ */
+export async function getCatalogProductBySlug(
+  slug: string
+): Promise<{
+  product: WooProduct | null;
+  source: 'index' | 'upstream';
+  catalogStatus: CatalogCacheStatus;
+  catalogAgeMs: number;
+}> {
+  const { index, status, ageMs } = await getCatalog();
+  const indexed = findBySlug(index, slug);
+  if (!indexed) {
+    return { product: await getProductBySlug(slug), source: 'upstream', catalogStatus: status, catalogAgeMs: ageMs };
+  }
+  // Without projection the catalog already holds full product objects
+  if (!CATALOG_FIELDS) {
+    return { product: indexed, source: 'index', catalogStatus: status, catalogAgeMs: ageMs };
+  }
+
+  const catalogFetchedAt = Date.now() - ageMs;
+  const cached = productDetails.get(slug);
+  if (cached && cached.fetchedAt >= catalogFetchedAt) {
+    return { product: cached.product, source: 'index', catalogStatus: status, catalogAgeMs: ageMs };
+  }
+
+  const generation = catalogGeneration;
+  const fetchedAt = Date.now();
+  const detail = await getProductBySlug(slug);
+  if (detail && generation === catalogGeneration) {
+    productDetails.set(slug, { product: detail, fetchedAt });
+  }
+  // Upstream failed: serve the catalog's list fields rather than an error
+  return { product: detail || indexed, source: 'upstream', catalogStatus: status, catalogAgeMs: ageMs };
+}
+
+/**
+ * Drop the cached catalog (and its derived indexes) so the next request
+ * fetches from WooCommerce. The last-good snapshot is kept as a fallback,
+ * and the persisted snapshot is rewritten by the next successful refresh.
+ * A refresh already in flight is superseded: its (possibly pre-save) result
+ * is not cached.
+ */
+export function invalidateCatalogCache(): void {
+  catalogEntry = null;
+  catalogGeneration++;
+  productDetails.clear();
+  snapshotDirty = true;
+}
+
+/**
+ * Refresh the catalog in the background (e.g. right after revalidation), so
+ * the next visitor and the persisted snapshot get the new catalog
+ */
+export function warmCatalogCache(): void {
+  refreshCatalog().catch((error) => {
+    console.error('Catalog warm-up failed:', error);
+  });
+}
+
+/**
+ * Catalog cache counters for monitoring
+ */
+export function getCatalogCacheStats(): CatalogCacheStats {
+  return {
+    ...catalogCounters,
+    ageMs: catalogEntry ? Date.now() - catalogEntry.fetchedAt : null,
+    lastGoodAgeMs: lastGoodCatalog ? Date.now() - lastGoodCatalog.fetchedAt : null,
+    size: catalogEntry?.products.length ?? 0,
+    ttlMs: CATALOG_CACHE_TTL_MS,
+    staleMs: CATALOG_CACHE_STALE_MS,
+  };
+}
+
 /**
  * Fetch a single product by slug
  * @param slug - Product slug
@@ -176,17 +730,31 @@ export async function getProducts(
  */
 export async function getProductBySlug(slug: string): Promise<WooProduct | null> {
   try {
-    const { data } = await woo.get("products", {
-      slug,
-      status: 'publish',
-    });
-    return data[0] || null;
+    return await getProductBySlugOrThrow(slug);
   } catch (error) {
     console.error(`Error fetching product ${slug}:`, error);
     return null;
   }
 }
 
+/**
+ * Fetch a single product by slug, throwing on failure
+ *
+ * Used by ISR page rendering: a failed render throws, so Next.js keeps serving
+ * the last generated page instead of caching a 404 for a WooCommerce outage.
+ *
+ * @param slug - Product slug
+ * @returns Single WooCommerce product, or null if no published product has the slug
+ */
+export async function getProductBySlugOrThrow(slug: string): Promise<WooProduct | null> {
+  const { data } = await woo.get("products", {
+    slug,
+    status: 'publish',
+    ...fieldsParam(PRODUCT_DETAIL_FIELDS),
+  });
+  return data[0] || null;
+}
+
 /**
  * Fetch products by category
  * @param categoryId - WooCommerce category ID
@@ -205,6 +773,7 @@ export async function getProductsByCategory(
       page,
       per_page: perPage,
       status: 'publish',
+      ...fieldsParam(PRODUCT_LIST_FIELDS),
     });
     return data as WooProduct[];
   } catch (error) {
@@ -228,6 +797,55 @@ export async function createOrder(orderData: Partial<WooOrder>): Promise<WooOrde
   }
 }
 
+/**
+ * Create order, throwing on failure
+ *
+ * Used by the order pipeline (lib/order-pipeline.ts), which needs the failure
+ * cause to decide whether to retry. Errors carry the HTTP `status` when
+ * WooCommerce answered.
+ *
+ * @param orderData - Order data
+ * @param signal - Aborts the request (per-attempt deadline)
+ * @returns Created order
+ */
+export async function createOrderOrThrow(
+  orderData: Partial<WooOrder>,
+  signal?: AbortSignal
+): Promise<WooOrder> {
+  const { data } = await wooRequestWithHeaders("orders", {}, "POST", orderData, signal);
+  return data as WooOrder;
+}
+
+/**
+ * Find a recent order created with an idempotency key
+ *
+ * Orders created through the pipeline carry `_idempotency_key` meta. Searching
+ * by billing email (indexed by WooCommerce order search) narrows the scan.
+ *
+ * @param key - Idempotency key
+ * @param email - Billing email of the order
+ * @param after - Only consider orders created after this time
+ * @param signal - Aborts the request
+ * @returns Matching order or null
+ */
+export async function findOrderByIdempotencyKey(
+  key: string,
+  email: string,
+  after: Date,
+  signal?: AbortSignal
+): Promise<WooOrder | null> {
+  const { data } = await wooRequestWithHeaders("orders", {
+    search: email,
+    after: after.toISOString(),
+    per_page: "20",
+  }, "GET", undefined, signal);
+
+  const orders = Array.isArray(data) ? (data as WooOrder[]) : [];
+  return orders.find((order) =>
+    order.meta_data?.some((meta: any) => meta.key === '_idempotency_key' && meta.value === key)
+  ) || null;
+}
+
 /**
  * Get order by ID
  * @param orderId - Order ID
@@ -247,14 +865,16 @@ export async function getOrder(orderId: number): Promise<WooOrder | null> {
  * Update order status
  * @param orderId - Order ID
  * @param status - New order status
+ * @param signal - Optional AbortSignal (overrides the orders deadline)
  * @returns Updated order
  */
 export async function updateOrderStatus(
   orderId: number,
-  status: string
+  status: string,
+  signal?: AbortSignal
 ): Promise<WooOrder | null> {
   try {
-    const { data } = await woo.put(`orders/${orderId}`, { status });
+    const { data } = await wooRequestWithHeaders(`orders/${orderId}`, {}, "PUT", { status }, signal);
     return data as WooOrder;
   } catch (error) {
     console.error(`Error updating order ${orderId}:`, error);
@@ -1,4 +1,5 @@
-import { jwtVerify } from 'jose';
+import { wpFetch } from './upstream-pool';
+import { readJsonTimed, timeSpan } from './server-timing';
 
 /**
  * WordPress JWT Authentication Utilities
@@ -10,6 +11,14 @@ import { jwtVerify } from 'jose';
  * - JWT tokens should be stored in httpOnly cookies (not localStorage)
  * - Uses jose library for Edge Runtime compatibility (not jsonwebtoken)
  * - Tokens are generated by WordPress, Next.js only verifies them
+ *
+ * Verification cost:
+ * - jose is loaded on first verification (middleware imports this module
+ *   only on the auth path)
+ * - The JWT secret is encoded once per isolate
+ * - Verified tokens are remembered (by SHA-256 hash, never the raw token) in a
+ *   bounded LRU until their `exp`, so repeat requests from the same session
+ *   skip signature verification
  */
 
 /**
@@ -31,6 +40,8 @@ export interface JwtVerificationResult {
   valid: boolean;
   payload?: any;
   error?: string;
+  /** True when served from the verified-token cache */
+  cached?: boolean;
 }
 
 /**
@@ -50,6 +61,87 @@ function getEnvVar(key: string, fallback?: string): string {
   }
 }
 
+// Maximum number of verified tokens remembered per isolate
+const VERIFIED_TOKEN_CACHE_SIZE = parseInt(process.env.JWT_VERIFY_CACHE_SIZE || '500', 10);
+
+const textEncoder = new TextEncoder();
+
+// JWT secret as Uint8Array (jose format), prepared on first use
+let secretKey: Uint8Array | null = null;
+
+// Token hash -> verified payload, in least-recently-used order
+const verifiedTokens = new Map<string, { payload: any; expiresAt: number }>();
+
+/**
+ * Encoded JWT secret, or null when JWT_SECRET is not configured
+ */
+function getSecretKey(): Uint8Array | null {
+  if (secretKey) return secretKey;
+
+  const jwtSecret = getEnvVar('JWT_SECRET');
+  if (!jwtSecret) return null;
+
+  secretKey = textEncoder.encode(jwtSecret);
+  return secretKey;
+}
+
+// jose module, loaded on first verification
+let joseModule: Promise<typeof import('jose')> | null = null;
+
+function loadJose(): Promise<typeof import('jose')> {
+  if (!joseModule) {
+    joseModule = import('jose').catch((error) => {
+      joseModule = null; // Retry on the next verification
+      throw error;
+    });
+  }
+  return joseModule;
+}
+
+/**
+ * SHA-256 hex digest of a token (Web Crypto, available in Edge and Node)
+ */
+async function hashToken(token: string): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-256', textEncoder.encode(token));
+  const bytes = new Uint8Array(digest);
+  let hex = '';
+  for (let i = 0; i < bytes.length; i++) {
+    hex += bytes[i].toString(16).padStart(2, '0');
+  }
+  return hex;
+}
+
+/**
+ * Look up a verified token, dropping it once it has expired
+ */
+function getVerifiedToken(hash: string): any | null {
+  const entry = verifiedTokens.get(hash);
+  if (!entry) return null;
+
+  verifiedTokens.delete(hash);
+  if (Date.now() >= entry.expiresAt) return null;
+
+  // Re-insert to mark as most recently used
+  verifiedTokens.set(hash, entry);
+  return entry.payload;
+}
+
+/**
+ * Remember a verified token until its `exp` claim
+ */
+function rememberVerifiedToken(hash: string, payload: any): void {
+  // Tokens without an expiry are re-verified every time
+  if (typeof payload?.exp !== 'number') return;
+
+  verifiedTokens.set(hash, { payload, expiresAt: payload.exp * 1000 });
+
+  while (verifiedTokens.size > VERIFIED_TOKEN_CACHE_SIZE) {
+    const oldest = verifiedTokens.keys().next().value;
+    if (oldest === undefined) break;
+    verifiedTokens.delete(oldest);
+  }
+}
+
 /**
  * Generates a JWT token by authenticating with WordPress
  *
@@ -74,7 +166,7 @@ export async function getJwtToken(
   try {
     const wordpressUrl = getEnvVar('WORDPRESS_URL', 'https://82mobile.com');
 
-    const response = await fetch(
+    const response = await wpFetch(
       `${wordpressUrl}/wp-json/jwt-auth/v1/token`,
       {
         method: 'POST',
@@ -91,7 +183,7 @@ export async function getJwtToken(
       return null;
     }
 
-    const data = await response.json();
+    const data = await readJsonTimed(response);
 
     return {
       token: data.token,
@@ -112,6 +204,7 @@ export async function getJwtToken(
  *
  * Uses jose library for Edge Runtime compatibility.
  * The token was generated by WordPress using the same JWT_SECRET.
+ * Tokens verified earlier in this isolate are answered from the LRU cache.
  *
  * @param token - JWT token string to verify
  * @returns Verification result with validity and payload
@@ -126,20 +219,29 @@ export async function verifyJwtToken(
   token: string
 ): Promise<JwtVerificationResult> {
   try {
-    const jwtSecret = getEnvVar('JWT_SECRET');
+    const secret = getSecretKey();
 
-    if (!jwtSecret) {
+    if (!secret) {
       return {
         valid: false,
         error: 'JWT_SECRET not configured',
       };
     }
 
-    // jose requires secret as Uint8Array
-    const secret = new TextEncoder().encode(jwtSecret);
+    const hash = await hashToken(token);
+    const cachedPayload = getVerifiedToken(hash);
+    if (cachedPayload) {
+      return {
+        valid: true,
+        payload: cachedPayload,
+        cached: true,
+      };
+    }
 
     // Verify JWT token
-    const { payload } = await jwtVerify(token, secret);
+    const { jwtVerify } = await loadJose();
+    const { payload } = await timeSpan('jwt', () => jwtVerify(token, secret));
+    rememberVerifiedToken(hash, payload);
 
     return {
       valid: true,
@@ -1,7 +1,7 @@
 import createMiddleware from 'next-intl/middleware';
 import { NextResponse } from 'next/server';
 import type { NextRequest } from 'next/server';
-import { verifyJwtToken } from '@/lib/wordpress-auth';
+import { classifyPath } from '@/lib/middleware-routes';
 
 // Create the next-intl middleware
 const intlMiddleware = createMiddleware({
@@ -15,94 +15,106 @@ const intlMiddleware = createMiddleware({
   localePrefix: 'always'
 });
 
+/**
+ * Middleware decision paths, reported with their latency in Server-Timing
+ * (e.g. `Server-Timing: mw;desc="auth-cached";dur=0.21`)
+ */
+type MiddlewarePath =
+  | 'public-api'
+  | 'auth-missing'
+  | 'auth-cached'
+  | 'auth-verified'
+  | 'auth-invalid'
+  | 'auth-error'
+  | 'cms-proxy'
+  | 'intl';
+
+/**
+ * Attach the decision path and middleware latency to a response
+ */
+function withTiming<T extends Response>(response: T, path: MiddlewarePath, start: number): T {
+  const duration = (performance.now() - start).toFixed(2);
+  response.headers.append('Server-Timing', `mw;desc="${path}";dur=${duration}`);
+  return response;
+}
+
 /**
  * Combined middleware: handles both i18n and JWT authentication
  */
 export default async function middleware(request: NextRequest) {
+  const start = performance.now();
   const { pathname } = request.nextUrl;
 
+  const routeClass = classifyPath(pathname);
+
   // Handle JWT authentication for protected API routes
-  if (pathname.startsWith('/api/')) {
-    // Define protected route patterns
-    const protectedPatterns = [
-      /^\/api\/orders\/[^/]+/, // /api/orders/{id}
-      /^\/api\/user\/.*/       // /api/user/*
-    ];
-
-    // Check if the current path matches any protected pattern
-    const isProtectedRoute = protectedPatterns.some(pattern =>
-      pattern.test(pathname)
-    );
-
-    if (isProtectedRoute) {
-      // Extract JWT token from cookie or Authorization header
-      const token = request.cookies.get('auth-token')?.value ||
-        request.headers.get('authorization')?.replace('Bearer ', '');
-
-      if (!token) {
-        return NextResponse.json(
+  if (routeClass === 'protected-api') {
+    // Extract JWT token from cookie or Authorization header
+    const token = request.cookies.get('auth-token')?.value ||
+      request.headers.get('authorization')?.replace('Bearer ', '');
+
+    if (!token) {
+      return withTiming(NextResponse.json(
+        {
+          success: false,
+          error: 'Authentication required',
+          message: 'No authentication token provided',
+          code: 'AUTH_REQUIRED'
+        },
+        { status: 401 }
+      ), 'auth-missing', start);
+    }
+
+    try {
+      // Loaded on the auth path only, so jose is not evaluated for other traffic
+      const { verifyJwtToken } = await import('@/lib/wordpress-auth');
+
+      // Verify JWT token (repeat tokens are answered from the verified-token cache)
+      const result = await verifyJwtToken(token);
+
+      if (!result.valid) {
+        return withTiming(NextResponse.json(
           {
             success: false,
-            error: 'Authentication required',
-            message: 'No authentication token provided',
-            code: 'AUTH_REQUIRED'
+            error: 'Invalid token',
+            message: 'Authentication token is invalid or expired',
+            code: 'AUTH_INVALID'
           },
           { status: 401 }
-        );
+        ), 'auth-invalid', start);
       }
 
-      try {
-        // Verify JWT token
-        const isValid = await verifyJwtToken(token);
-
-        if (!isValid) {
-          return NextResponse.json(
-            {
-              success: false,
-              error: 'Invalid token',
-              message: 'Authentication token is invalid or expired',
-              code: 'AUTH_INVALID'
-            },
-            { status: 401 }
-          );
-        }
-
-        // Token is valid - allow request to proceed
-        return NextResponse.next();
-      } catch (error: any) {
-        console.error('[middleware] JWT verification error:', error);
-        return NextResponse.json(
-          {
-            success: false,
-            error: 'Authentication failed',
-            message: 'Failed to verify authentication token',
-            code: 'AUTH_ERROR'
-          },
-          { status: 500 }
-        );
-      }
+      // Token is valid - allow request to proceed
+      return withTiming(NextResponse.next(), result.cached ? 'auth-cached' : 'auth-verified', start);
+    } catch (error: any) {
+      console.error('[middleware] JWT verification error:', error);
+      return withTiming(NextResponse.json(
+        {
+          success: false,
+          error: 'Authentication failed',
+          message: 'Failed to verify authentication token',
+          code: 'AUTH_ERROR'
+        },
+        { status: 500 }
+      ), 'auth-error', start);
     }
+  }
 
+  if (routeClass === 'public-api') {
     // Public API route - allow access
-    return NextResponse.next();
+    return withTiming(NextResponse.next(), 'public-api', start);
   }
 
   // Proxy WordPress paths through Node.js reverse proxy (Host header injection)
   // Next.js rewrite routes internally to cms-proxy handler while preserving original URL
-  if (
-    pathname.startsWith('/wp-admin') ||
-    pathname.startsWith('/wp-login') ||
-    pathname.startsWith('/wp-includes') ||
-    pathname.startsWith('/wp-content') ||
-    pathname.startsWith('/wp-json')
-  ) {
+  if (routeClass === 'cms-proxy') {
     const url = request.nextUrl.clone();
     url.pathname = `/api/cms-proxy${pathname}`;
-    return NextResponse.rewrite(url);
+    return withTiming(NextResponse.rewrite(url), 'cms-proxy', start);
   }
 
   // Handle internationalization for non-API routes
-  return intlMiddleware(request);
+  return withTiming(intlMiddleware(request), 'intl', start);
 }
 
 export const config = {
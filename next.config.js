@@ -35,6 +35,17 @@ const nextConfig = {
   reactStrictMode: true,
   // Optimize production builds
   swcMinify: true,
+  experimental: {
+    // Cold-start catalog snapshot (scripts/build-catalog-snapshot.js) is read
+    // from disk at runtime, so it must ship with the API functions and the
+    // shop pages that read the catalog. Keys are globs over route paths; `*`
+    // stands for the [locale] segment (brackets would be a glob character class).
+    outputFileTracingIncludes: {
+      '/api/**/*': ['./lib/generated/catalog-snapshot.json'],
+      '/*/shop': ['./lib/generated/catalog-snapshot.json'],
+      '/*/shop/**/*': ['./lib/generated/catalog-snapshot.json'],
+    },
+  },
 };
 
 module.exports = withNextIntl(nextConfig);
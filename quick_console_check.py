@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 """Quick check for QueryClient error in production"""
 
-from playwright.sync_api import sync_playwright
+from e2e_browser import browser_page, pause_for_inspection
 
 URL = "https://82mobile-next.vercel.app"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
+with browser_page() as page:
 
     errors = []
     def handle_console(msg):
@@ -37,6 +35,4 @@ with sync_playwright() as p:
     # Take screenshot
     page.screenshot(path='quick_check.png', full_page=True)
 
-    print("\n⏸️  Pausing for inspection (30s)...")
-    page.wait_for_timeout(30000)
-    browser.close()
+    pause_for_inspection()
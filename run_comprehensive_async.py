@@ -0,0 +1,315 @@
+"""Comprehensive Playwright test for 82mobile Next.js site (asyncio, concurrent scenarios).
+
+Same checks and report as run_comprehensive_test.py, but every scenario runs in
+its own context of one shared browser, concurrently (e2e_async.run_scenarios).
+Locale checks are split into /ko and /en scenarios, and the mobile scenario
+also runs on an emulated iPhone 12 Pro.
+
+Usage:
+    python3 run_comprehensive_async.py                       # all scenarios, 4 at a time
+    python3 run_comprehensive_async.py --concurrency 8
+    python3 run_comprehensive_async.py --scenarios desktop-home mobile
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from functools import partial
+
+import run_comprehensive_test as report
+from e2e_async import (
+    current_scenario, run_scenarios, text_within, wait_for_animations,
+    wait_for_app_ready, wait_for_products, wait_for_scroll_settled,
+)
+from e2e_probe import probe
+from run_comprehensive_test import (
+    BASE_URL, DESKTOP_CONTEXT, MOBILE_CONTEXT, PAGE_TIMEOUT_MS, SCREENSHOT_DIR,
+)
+
+# scenario name -> results, merged in SCENARIOS order for the report
+scenario_results = {}
+
+def record(name, passed, detail=""):
+    status = "PASS" if passed else "FAIL"
+    scenario_results.setdefault(current_scenario(), []).append({"test": name, "status": status, "detail": detail})
+    print(f"  [{status}] {current_scenario()}: {name}" + (f" - {detail}" if detail else ""))
+
+async def ss(page, name):
+    await page.screenshot(path=os.path.join(SCREENSHOT_DIR, f"{name}.png"), full_page=False)
+
+async def ss_full(page, name):
+    await page.screenshot(path=os.path.join(SCREENSHOT_DIR, f"{name}_full.png"), full_page=True)
+
+
+async def scenario_desktop_home(page):
+    resp = await page.goto(BASE_URL, wait_until="load", timeout=60000)
+    await wait_for_app_ready(page)
+    await wait_for_animations(page)
+    record("Homepage loads", resp.status == 200, f"status={resp.status}")
+    await ss(page, "desktop_home")
+    await ss_full(page, "desktop_home")
+
+    snap = await probe(
+        page,
+        sections=["hero", "products", "why-choose-us", "faq", "contact"],
+        counts={
+            "nav_dots": ("nav.fixed", "button"),
+            "progress_bar": 'div.fixed.top-0 [class*="gradient"]',
+        },
+    )
+    record("No horizontal scroll", not snap["scroll"]["horizontal_overflow"])
+
+    broken = snap["broken_images"]
+    record("No broken images", len(broken) == 0, f"broken={broken[:3]}" if broken else "")
+
+    # Nav dots
+    nav_dots = snap["counts"]["nav_dots"]
+    record("Nav dots present (desktop)", nav_dots >= 4, f"count={nav_dots}")
+
+    # Sections
+    for sec_id, exists in snap["sections"].items():
+        record(f"Section '#{sec_id}' exists", exists)
+
+    # Progress bar
+    record("Scroll progress bar exists", snap["counts"]["progress_bar"] > 0)
+
+    # Nav dot click
+    await page.evaluate("window.scrollTo(0, 0)")
+    await wait_for_scroll_settled(page)
+    nav_btn = await page.evaluate("""() => {
+        const nav = document.querySelector('nav.fixed');
+        if (!nav) return false;
+        const btns = nav.querySelectorAll('button');
+        if (btns.length >= 2) { btns[1].click(); return true; }
+        return false;
+    }""")
+    if nav_btn:
+        await wait_for_scroll_settled(page)
+        scroll_pos = await page.evaluate("window.scrollY")
+        record("Nav dot click scrolls page", scroll_pos > 100, f"scrollY={scroll_pos}")
+    else:
+        record("Nav dot click scrolls page", False, "no nav buttons")
+
+
+async def scenario_desktop_products(page):
+    await page.goto(f"{BASE_URL}/ko", wait_until="load", timeout=60000)
+    await wait_for_app_ready(page)
+    await wait_for_products(page)
+
+    await page.evaluate("document.getElementById('products')?.scrollIntoView({behavior:'instant'})")
+    await wait_for_scroll_settled(page)
+    await wait_for_animations(page)
+    await ss(page, "desktop_products")
+
+    snap = await probe(page, counts={"cards": ("#products", '[class*="cursor-pointer"], [role="button"], article')})
+    product_count = snap["counts"]["cards"]
+    record("Product cards loaded", product_count > 0, f"count={product_count}")
+
+    await page.evaluate("""() => {
+        const section = document.getElementById('products');
+        if (!section) return;
+        const el = section.querySelector('[class*="cursor-pointer"], [role="button"]');
+        if (el) el.click();
+    }""")
+    has_5000 = await text_within(page, "5,000")
+    await wait_for_animations(page)
+    await ss(page, "desktop_product_expanded")
+
+    record("Reservation 5,000 shown", has_5000)
+
+    reserve_btn = await page.query_selector('button:has-text("5,000"), button:has-text("Reserve"), button:has-text("예약")')
+    if reserve_btn:
+        await reserve_btn.click()
+        await wait_for_animations(page)
+        await ss(page, "desktop_cart_open")
+        snap = await probe(page, texts=["5,000"])
+        record("Cart shows 5,000", snap["texts"]["5,000"])
+    else:
+        record("Reserve button found", False, "not found")
+
+
+async def scenario_desktop_locale_ko(page):
+    await page.goto(f"{BASE_URL}/ko", wait_until="load", timeout=60000)
+    await wait_for_animations(page)
+    snap = await probe(page, patterns={"korean": "[가-힣]"}, text_limit=2000)
+    await ss(page, "desktop_ko_home")
+    record("Korean locale has Korean text", snap["patterns"]["korean"])
+
+
+async def scenario_desktop_locale_en(page):
+    await page.goto(f"{BASE_URL}/en", wait_until="load", timeout=60000)
+    await wait_for_animations(page)
+    await ss(page, "desktop_en_home")
+
+    snap = await probe(page, main_patterns={"korean": "[가-힣]"}, text_of={"footer": "footer"})
+    record("English: no Korean in main content", not snap["main_patterns"]["korean"])
+
+    ft = snap["text_of"]["footer"]
+    if ft is not None:
+        record("Footer has business info", "82mobile" in ft.lower() or "whitehat" in ft.lower())
+    else:
+        record("Footer exists", False)
+
+
+async def scenario_desktop_legal(page):
+    for lp in ["/privacy-policy", "/terms-of-service", "/refund-policy", "/in-store-pickup-policy"]:
+        try:
+            resp = await page.goto(f"{BASE_URL}{lp}", wait_until="load", timeout=30000)
+            ok = resp and resp.status == 200
+            if ok:
+                snap = await probe(page, patterns={"not_found": "404|not found"}, text_limit=200)
+                ok = not snap["patterns"]["not_found"]
+            record(f"Legal page {lp}", ok, f"status={resp.status if resp else 'none'}")
+        except Exception as e:
+            record(f"Legal page {lp}", False, str(e)[:80])
+
+
+async def scenario_desktop_faq(page):
+    await page.goto(BASE_URL, wait_until="load", timeout=60000)
+    await wait_for_app_ready(page)
+    await page.evaluate("document.getElementById('faq')?.scrollIntoView({behavior:'instant'})")
+    await wait_for_scroll_settled(page)
+    await wait_for_animations(page)
+    await ss(page, "desktop_faq")
+
+    faq_count = await page.evaluate("""() => {
+        const faq = document.getElementById('faq');
+        if (!faq) return 0;
+        return Array.from(faq.querySelectorAll('button')).filter(b =>
+            (b.textContent || '').includes('?') || b.textContent.length > 20
+        ).length;
+    }""")
+    record("FAQ items >= 6", faq_count >= 6, f"count={faq_count}")
+
+    accordion_works = await page.evaluate("""() => {
+        const faq = document.getElementById('faq');
+        if (!faq) return false;
+        const btns = Array.from(faq.querySelectorAll('button')).filter(b => (b.textContent||'').includes('?'));
+        if (btns.length > 1) { btns[1].click(); return true; }
+        if (btns.length > 0) { btns[0].click(); return true; }
+        return false;
+    }""")
+    await wait_for_animations(page)
+    await ss(page, "desktop_faq_expanded")
+    record("FAQ accordion clickable", accordion_works)
+
+
+async def scenario_mobile(page, label="Mobile", shot="mobile"):
+    await page.goto(BASE_URL, wait_until="load", timeout=60000)
+    await wait_for_app_ready(page)
+    await wait_for_animations(page)
+    await ss(page, f"{shot}_home")
+    await ss_full(page, f"{shot}_home")
+
+    snap = await probe(page)
+    record(f"{label}: no horizontal scroll", not snap["scroll"]["horizontal_overflow"])
+
+    # Mobile menu
+    menu_opened = await page.evaluate("""() => {
+        const header = document.querySelector('header');
+        if (!header) return 'no-header';
+        const buttons = header.querySelectorAll('button');
+        for (const btn of buttons) {
+            const rect = btn.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 && rect.width < 60) {
+                btn.click(); return 'clicked';
+            }
+        }
+        return 'no-button';
+    }""")
+    await wait_for_animations(page)
+    await ss(page, f"{shot}_menu_open")
+    record(f"{label} menu opens", menu_opened == "clicked", menu_opened)
+
+    if menu_opened == "clicked":
+        await page.evaluate("""() => {
+            const btn = document.querySelector('button[aria-label*="close" i], button[aria-label*="Close"]');
+            if (btn) btn.click();
+            else document.dispatchEvent(new KeyboardEvent('keydown', {key:'Escape'}));
+        }""")
+        await wait_for_animations(page)
+        record(f"{label} menu closes", True)
+
+    # Products
+    await page.evaluate("document.getElementById('products')?.scrollIntoView({behavior:'instant'})")
+    await wait_for_products(page)
+    await wait_for_scroll_settled(page)
+    await wait_for_animations(page)
+    await ss(page, f"{shot}_products")
+
+    card_tapped = await page.evaluate("""() => {
+        const section = document.getElementById('products');
+        if (!section) return false;
+        const el = section.querySelector('[class*="cursor-pointer"], [role="button"], article');
+        if (el) { el.click(); return true; }
+        return false;
+    }""")
+    await wait_for_animations(page)
+    await ss(page, f"{shot}_product_expanded")
+    record(f"{label}: product modal opens", card_tapped)
+
+    # Cart
+    await page.keyboard.press("Escape")
+    await wait_for_animations(page)
+    cart_opened = await page.evaluate("""() => {
+        const header = document.querySelector('header');
+        if (!header) return false;
+        const buttons = header.querySelectorAll('button');
+        for (const btn of buttons) {
+            const rect = btn.getBoundingClientRect();
+            if (rect.width > 0 && rect.x > 200) { btn.click(); return true; }
+        }
+        return false;
+    }""")
+    await wait_for_animations(page)
+    await ss(page, f"{shot}_cart_drawer")
+    record(f"{label}: cart drawer opens", cart_opened)
+
+
+# Independent scenarios, in report order
+SCENARIOS = {
+    "desktop-home": (scenario_desktop_home, DESKTOP_CONTEXT),
+    "desktop-products": (scenario_desktop_products, DESKTOP_CONTEXT),
+    "desktop-locale-ko": (scenario_desktop_locale_ko, DESKTOP_CONTEXT),
+    "desktop-locale-en": (scenario_desktop_locale_en, DESKTOP_CONTEXT),
+    "desktop-legal": (scenario_desktop_legal, DESKTOP_CONTEXT),
+    "desktop-faq": (scenario_desktop_faq, DESKTOP_CONTEXT),
+    "mobile": (scenario_mobile, MOBILE_CONTEXT),
+    "iphone-12-pro": (partial(scenario_mobile, label="iPhone 12 Pro", shot="iphone"), {"device": "iPhone 12 Pro"}),
+}
+
+async def run_tests(names, concurrency, headless=True):
+    scenarios = {name: SCENARIOS[name] for name in names}
+    outcomes = await run_scenarios(scenarios, concurrency=concurrency, headless=headless, page_timeout_ms=PAGE_TIMEOUT_MS)
+    for name, outcome in outcomes.items():
+        status = "ERROR" if outcome["error"] else "done"
+        print(f"  [{status}] {name} ({outcome['seconds']:.1f}s)")
+
+    # Reuse the sync suite's report (test_report.json, failure summary)
+    parts = [
+        {"shard": name, "results": scenario_results.get(name, []), "error": outcomes[name]["error"]}
+        for name in scenarios
+    ]
+    return report.merge_results(parts)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the comprehensive suite with concurrent async scenarios")
+    parser.add_argument("--concurrency", type=int, default=4, help="Scenarios running at once")
+    parser.add_argument("--scenarios", nargs="+", metavar="NAME", help=f"Subset to run: {', '.join(SCENARIOS)}")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    print(f"Running {len(names)} scenarios, {args.concurrency} at a time")
+    start = time.perf_counter()
+    passed = asyncio.run(run_tests(names, args.concurrency, headless=not args.headed))
+    print(f"\nWall time: {time.perf_counter() - start:.1f}s")
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Parallel Sharded E2E Runner
+
+Runs the Playwright suites' independent scenarios (shards) across a pool of
+worker processes instead of one after another in a single browser:
+- run_comprehensive_test.py    (comprehensive: desktop sections, legal, FAQ, mobile)
+- comprehensive_phase2_test.py (phase2: desktop, mobile)
+- test_product_card_flip.py    (card-flip: desktop, mobile, mobile outside tap)
+
+Each suite module declares SHARDS = {name: (scenario(page), context_options)}
+plus collect_results() / merge_results(parts). Every worker process launches
+one Chromium and gives each shard a fresh browser context (a "device" entry in
+context_options selects a Playwright device descriptor). Shard results are
+merged in SHARDS order and reported by the suite itself, so reports and
+pass/fail semantics match a sequential run; shard output is buffered and
+printed per shard instead of interleaved, each with its e2e_waits summary.
+
+Usage:
+    python3 run_e2e_shards.py                          # all suites, one worker per CPU
+    python3 run_e2e_shards.py comprehensive --workers 4
+    python3 run_e2e_shards.py card-flip --headed
+    python3 run_e2e_shards.py --list
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SUITES = {
+    "comprehensive": "run_comprehensive_test",
+    "phase2": "comprehensive_phase2_test",
+    "card-flip": "test_product_card_flip",
+}
+
+# Per worker process
+_playwright = None
+_browsers = {}
+_headless = True
+
+
+def _close_worker():
+    for browser in _browsers.values():
+        browser.close()
+    if _playwright:
+        _playwright.stop()
+
+
+def _init_worker(headless):
+    global _playwright, _headless
+    from multiprocessing.util import Finalize
+    from playwright.sync_api import sync_playwright
+
+    _headless = headless
+    _playwright = sync_playwright().start()
+    # Pool workers skip atexit handlers; Finalize runs on normal worker exit
+    Finalize(None, _close_worker, exitpriority=10)
+
+
+def _get_browser(launch_options):
+    """One browser per worker and suite LAUNCH_OPTIONS (if a suite declares any)"""
+    key = tuple(sorted(launch_options.items()))
+    if key not in _browsers:
+        _browsers[key] = _playwright.chromium.launch(headless=_headless, **launch_options)
+    return _browsers[key]
+
+
+def run_shard(module_name, shard_name):
+    """
+    Run one shard in a fresh browser context (worker process)
+
+    Returns:
+        dict: shard, results (suite's collect_results()), error, seconds, log
+    """
+    # Reload so module-level results only hold this shard's records
+    if module_name in sys.modules:
+        module = importlib.reload(sys.modules[module_name])
+    else:
+        module = importlib.import_module(module_name)
+    scenario, context_options = module.SHARDS[shard_name]
+
+    options = dict(context_options)
+    device = options.pop("device", None)
+    if device:
+        options = {**_playwright.devices[device], **options}
+
+    import e2e_waits
+    e2e_waits.WAIT_TIMINGS.clear()
+
+    log = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        context = _get_browser(getattr(module, "LAUNCH_OPTIONS", {})).new_context(**options)
+        try:
+            page = context.new_page()
+            if hasattr(module, "PAGE_TIMEOUT_MS"):
+                page.set_default_timeout(module.PAGE_TIMEOUT_MS)
+            scenario(page)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"  [ERROR] {error}")
+        finally:
+            context.close()
+        e2e_waits.print_wait_summary()
+
+    return {
+        "shard": shard_name,
+        "results": module.collect_results(),
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "log": log.getvalue(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run E2E suites as parallel shards")
+    parser.add_argument("suites", nargs="*", help=f"Suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Worker processes")
+    parser.add_argument("--headed", action="store_true", help="Show browser windows")
+    parser.add_argument("--list", action="store_true", help="List shards and exit")
+    args = parser.parse_args()
+
+    suites = args.suites or list(SUITES)
+    unknown = [suite for suite in suites if suite not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+    modules = {suite: importlib.import_module(SUITES[suite]) for suite in suites}
+    tasks = [(suite, shard) for suite in suites for shard in modules[suite].SHARDS]
+
+    if args.list:
+        for suite, shard in tasks:
+            print(f"{suite}/{shard}")
+        return 0
+
+    workers = max(1, min(args.workers, len(tasks)))
+    print(f"Running {len(tasks)} shards from {', '.join(suites)} on {workers} workers")
+
+    parts = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        # Playwright's sync API must not be inherited through fork
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(not args.headed,),
+    ) as pool:
+        futures = {
+            pool.submit(run_shard, SUITES[suite], shard): (suite, shard)
+            for suite, shard in tasks
+        }
+        for future in as_completed(futures):
+            suite, shard = futures[future]
+            try:
+                part = future.result()
+            except Exception as e:
+                # Worker died (e.g. browser failed to launch): report as a crashed shard
+                part = {
+                    "shard": shard,
+                    "results": modules[suite].collect_results(),
+                    "error": f"{type(e).__name__}: {e}",
+                    "seconds": 0.0,
+                    "log": "",
+                }
+            parts[(suite, shard)] = part
+            status = "ERROR" if part["error"] else "done"
+            print(f"  [{status}] {suite}/{shard} ({part['seconds']:.1f}s)")
+    wall = time.perf_counter() - start
+
+    all_passed = True
+    for suite in suites:
+        suite_parts = [parts[(suite, shard)] for shard in modules[suite].SHARDS]
+        print(f"\n{'#' * 60}\n# {suite}\n{'#' * 60}")
+        for part in suite_parts:
+            print(f"\n--- shard {part['shard']} ---")
+            print(part["log"], end="")
+        all_passed = bool(modules[suite].merge_results(suite_parts)) and all_passed
+
+    shard_total = sum(part["seconds"] for part in parts.values())
+    print(f"\n{'=' * 60}")
+    print(f"Wall time: {wall:.1f}s for {shard_total:.1f}s of shard time "
+          f"({shard_total / wall:.1f}x with {workers} workers)")
+    print(f"Overall: {'PASS' if all_passed else 'FAIL'}")
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
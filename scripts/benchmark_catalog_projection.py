@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Catalog Field Projection Benchmark
+
+Compares WooCommerce catalog requests with and without `_fields` projection
+(see PRODUCT_LIST_FIELDS / PRODUCT_DETAIL_FIELDS in lib/woocommerce.ts):
+1. Upstream bytes per catalog fetch (82m/v1/products)
+2. JSON parse time of the upstream payload
+3. /api/products route latency (optional, against a running Next.js server)
+
+Route latency with and without projection is measured by running the script
+once against a server started normally and once against a server started with
+CATALOG_FIELD_PROJECTION=off, passing --route-label to tell the runs apart.
+
+Usage:
+    WC_CONSUMER_KEY=ck_... WC_CONSUMER_SECRET=cs_... \\
+        python3 benchmark_catalog_projection.py --runs 10
+    python3 benchmark_catalog_projection.py --route-url http://localhost:3000 --route-label projected
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+WORDPRESS_URL = os.environ.get("WORDPRESS_URL", "http://182.162.142.102")
+WORDPRESS_HOST = os.environ.get("WORDPRESS_HOST", "82mobile.com")
+WC_CONSUMER_KEY = os.environ.get("WC_CONSUMER_KEY", "")
+WC_CONSUMER_SECRET = os.environ.get("WC_CONSUMER_SECRET", "")
+
+# Keep in sync with lib/woocommerce.ts
+PRODUCT_LIST_FIELDS = [
+    "id", "name", "slug", "price", "regular_price", "categories", "images",
+    "attributes", "variations", "short_description",
+]
+PRODUCT_DETAIL_FIELDS = PRODUCT_LIST_FIELDS + [
+    "description", "type", "sale_price", "on_sale", "stock_status", "stock_quantity",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": round(statistics.median(values), 2),
+        "p95": round(percentile(values, 95), 2),
+        "mean": round(statistics.mean(values), 2),
+    }
+
+
+def fetch_upstream(fields: Optional[List[str]], per_page: int) -> Dict[str, float]:
+    """
+    Fetch one catalog page from the 82m/v1 endpoint.
+
+    Returns:
+        dict: bytes, request time (ms), JSON parse time (ms), product count
+    """
+    params = {
+        "consumer_key": WC_CONSUMER_KEY,
+        "consumer_secret": WC_CONSUMER_SECRET,
+        "page": 1,
+        "per_page": per_page,
+        "status": "publish",
+    }
+    if fields:
+        params["_fields"] = ",".join(fields)
+
+    start = time.perf_counter()
+    response = requests.get(
+        f"{WORDPRESS_URL}/wp-json/82m/v1/products",
+        params=params,
+        headers={"Host": WORDPRESS_HOST},
+        timeout=30,
+    )
+    response.raise_for_status()
+    body = response.content
+    request_ms = (time.perf_counter() - start) * 1000
+
+    parse_start = time.perf_counter()
+    products = json.loads(body)
+    parse_ms = (time.perf_counter() - parse_start) * 1000
+
+    return {
+        "bytes": len(body),
+        "request_ms": request_ms,
+        "parse_ms": parse_ms,
+        "count": len(products),
+    }
+
+
+def benchmark_upstream(runs: int, per_page: int) -> None:
+    variants = {
+        "full": None,
+        "list (catalog)": PRODUCT_LIST_FIELDS,
+        "detail": PRODUCT_DETAIL_FIELDS,
+    }
+
+    print(f"Upstream: {WORDPRESS_URL}/wp-json/82m/v1/products (per_page={per_page}, runs={runs})")
+    print(f"{'variant':<18} {'bytes':>10} {'products':>9} {'request p50/p95 ms':>20} {'parse p50/p95 ms':>18}")
+
+    baseline_bytes = None
+    for name, fields in variants.items():
+        samples = [fetch_upstream(fields, per_page) for _ in range(runs)]
+        size = samples[-1]["bytes"]
+        baseline_bytes = baseline_bytes or size
+        request = summarize([s["request_ms"] for s in samples])
+        parse = summarize([s["parse_ms"] for s in samples])
+        saving = f"({100 - size * 100 / baseline_bytes:.0f}% smaller)" if size != baseline_bytes else ""
+        print(
+            f"{name:<18} {size:>10} {samples[-1]['count']:>9} "
+            f"{request['p50']:>9}/{request['p95']:<10} {parse['p50']:>8}/{parse['p95']:<9} {saving}"
+        )
+
+
+def benchmark_route(base_url: str, label: str, runs: int) -> None:
+    """
+    Measure /api/products latency. The first request warms the catalog cache;
+    an X-Catalog-Cache: MISS sample is reported separately.
+    """
+    latencies = []
+    miss_ms = None
+    for i in range(runs + 1):
+        start = time.perf_counter()
+        response = requests.get(f"{base_url}/api/products", timeout=60)
+        elapsed = (time.perf_counter() - start) * 1000
+        response.raise_for_status()
+        if response.headers.get("X-Catalog-Cache") == "MISS":
+            miss_ms = elapsed
+        elif i > 0:
+            latencies.append(elapsed)
+
+    print(f"\nRoute: {base_url}/api/products [{label}]")
+    if miss_ms is not None:
+        print(f"  cold (cache MISS): {miss_ms:.2f} ms")
+    if latencies:
+        route = summarize(latencies)
+        print(f"  warm: p50={route['p50']} ms p95={route['p95']} ms mean={route['mean']} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark catalog field projection")
+    parser.add_argument("--runs", type=int, default=5, help="Samples per variant")
+    parser.add_argument("--per-page", type=int, default=100, help="Catalog page size")
+    parser.add_argument("--route-url", help="Base URL of a running Next.js server")
+    parser.add_argument("--route-label", default="current", help="Label for the route run")
+    parser.add_argument("--skip-upstream", action="store_true", help="Only benchmark the route")
+    args = parser.parse_args()
+
+    if not args.skip_upstream:
+        if not WC_CONSUMER_KEY or not WC_CONSUMER_SECRET:
+            print("WC_CONSUMER_KEY and WC_CONSUMER_SECRET must be set", file=sys.stderr)
+            return 1
+        benchmark_upstream(args.runs, args.per_page)
+
+    if args.route_url:
+        benchmark_route(args.route_url.rstrip("/"), args.route_label, args.runs)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
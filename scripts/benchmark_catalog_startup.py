@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Catalog Cold-Start Benchmark
+
+Measures how long a freshly started Next.js server takes to answer its first
+/api/products request, with and without the persisted catalog snapshot
+(lib/catalog-snapshot.ts):
+1. snapshot: first request is served from the snapshot (X-Catalog-Cache: SNAPSHOT)
+   while the live catalog refreshes in the background
+2. no snapshot: the server is started with CATALOG_SNAPSHOT=off, so the first
+   request waits for the full multi-page WooCommerce fetch (MISS)
+
+Each run starts `next start` (requires a prior `npm run build`), polls until
+the port accepts connections, then times the first /api/products request and a
+few follow-up requests.
+
+Usage:
+    npm run build
+    python3 scripts/benchmark_catalog_startup.py --runs 5
+    python3 scripts/benchmark_catalog_startup.py --runs 3 --port 3100 --follow-up 5
+"""
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def wait_for_port(port: int, timeout: float) -> float:
+    """Block until the server accepts connections; return seconds waited."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return time.perf_counter() - start
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"server did not listen on port {port} within {timeout}s")
+
+
+def timed_get(url: str) -> Dict[str, object]:
+    start = time.perf_counter()
+    response = requests.get(url, timeout=120)
+    elapsed = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return {
+        "ms": elapsed,
+        "cache": response.headers.get("X-Catalog-Cache", "-"),
+        "age": response.headers.get("X-Catalog-Age", "-"),
+    }
+
+
+def cold_start_run(port: int, snapshot: bool, follow_up: int) -> Dict[str, object]:
+    env = dict(os.environ)
+    env["PORT"] = str(port)
+    if not snapshot:
+        env["CATALOG_SNAPSHOT"] = "off"
+
+    server = subprocess.Popen(
+        ["npx", "next", "start", "-p", str(port)],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        boot_s = wait_for_port(port, timeout=60)
+        url = f"http://127.0.0.1:{port}/api/products"
+        first = timed_get(url)
+        rest = [timed_get(url) for _ in range(follow_up)]
+        return {"boot_ms": boot_s * 1000, "first": first, "rest": rest}
+    finally:
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def report(label: str, runs: List[Dict[str, object]]) -> Optional[float]:
+    if not runs:
+        return None
+    first_ms = [run["first"]["ms"] for run in runs]
+    boot_ms = [run["boot_ms"] for run in runs]
+    statuses = sorted({run["first"]["cache"] for run in runs})
+    rest_ms = [sample["ms"] for run in runs for sample in run["rest"]]
+
+    print(f"\n[{label}] {len(runs)} cold starts")
+    print(f"  server listening:      median {statistics.median(boot_ms):8.1f} ms")
+    print(f"  first /api/products:   median {statistics.median(first_ms):8.1f} ms "
+          f"(min {min(first_ms):.1f}, max {max(first_ms):.1f}) cache={','.join(statuses)}")
+    if rest_ms:
+        print(f"  follow-up requests:    median {statistics.median(rest_ms):8.1f} ms")
+    return statistics.median(first_ms)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark catalog cold start with/without snapshot")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts per variant")
+    parser.add_argument("--port", type=int, default=3100, help="Port for the benchmark server")
+    parser.add_argument("--follow-up", type=int, default=3, help="Requests after the first, per run")
+    args = parser.parse_args()
+
+    if not (ROOT / ".next" / "BUILD_ID").exists():
+        print("No production build found; run `npm run build` first", file=sys.stderr)
+        return 1
+    if not (ROOT / "lib" / "generated" / "catalog-snapshot.json").exists():
+        print("Note: no build snapshot; the snapshot variant relies on a runtime snapshot "
+              "written by an earlier server (CATALOG_SNAPSHOT_DIR)")
+
+    results = {}
+    for label, snapshot in (("snapshot", True), ("no snapshot", False)):
+        runs = [cold_start_run(args.port, snapshot, args.follow_up) for _ in range(args.runs)]
+        results[label] = report(label, runs)
+
+    if results["snapshot"] and results["no snapshot"]:
+        print(f"\nFirst response speedup: {results['no snapshot'] / results['snapshot']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
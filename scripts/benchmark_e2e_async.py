@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+E2E Harness Benchmark: sync vs async
+
+Compares wall time for the full comprehensive suite:
+1. sync: run_comprehensive_test.py (one scenario after another, sync API)
+2. async: run_comprehensive_async.py (scenarios as concurrent contexts of one
+   browser), at each requested concurrency
+
+The async variant runs the same scenarios as the sync suite (the extra
+iPhone 12 Pro scenario is excluded), so both variants do the same work. Each
+run is a separate process, so browser launch and Playwright startup are
+included, as they would be for a developer running the suite. The suite's
+base URL (run_comprehensive_test.BASE_URL) must be serving.
+
+Usage:
+    python3 scripts/benchmark_e2e_async.py --runs 3
+    python3 scripts/benchmark_e2e_async.py --runs 3 --concurrency 2 4 8
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# run_comprehensive_async.SCENARIOS equivalent to the sync suite
+SYNC_EQUIVALENT = [
+    "desktop-home",
+    "desktop-products",
+    "desktop-locale-ko",
+    "desktop-locale-en",
+    "desktop-legal",
+    "desktop-faq",
+    "mobile",
+]
+
+
+def timed_run(command: List[str]) -> Dict[str, object]:
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    summary = next((line for line in result.stdout.splitlines() if line.startswith("RESULTS:")), "RESULTS: ?")
+    return {"s": elapsed, "summary": summary, "returncode": result.returncode}
+
+
+def report(label: str, runs: List[Dict[str, object]]) -> Optional[float]:
+    if not runs:
+        return None
+    seconds = [run["s"] for run in runs]
+    summaries = sorted({run["summary"] for run in runs})
+    print(f"\n[{label}] {len(runs)} runs")
+    print(f"  wall time: median {statistics.median(seconds):6.1f} s "
+          f"(min {min(seconds):.1f}, max {max(seconds):.1f})")
+    print(f"  {' | '.join(summaries)}")
+    return statistics.median(seconds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async E2E suite wall time")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per variant")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4], help="Async concurrency levels")
+    args = parser.parse_args()
+
+    python = sys.executable
+    sync_median = report("sync", [timed_run([python, "run_comprehensive_test.py"]) for _ in range(args.runs)])
+
+    for concurrency in args.concurrency:
+        command = [
+            python, "run_comprehensive_async.py",
+            "--concurrency", str(concurrency),
+            "--scenarios", *SYNC_EQUIVALENT,
+        ]
+        async_median = report(f"async x{concurrency}", [timed_run(command) for _ in range(args.runs)])
+        if sync_median and async_median:
+            print(f"  speedup vs sync: {sync_median / async_median:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
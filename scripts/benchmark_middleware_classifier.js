@@ -0,0 +1,121 @@
+/**
+ * Middleware classifier micro-benchmark
+ *
+ * Measures per-request CPU spent deciding how middleware.ts routes a path:
+ * - before: startsWith('/api/') + protectedPatterns array built per request +
+ *   the /wp-* startsWith chain (the original middleware)
+ * - after:  the single ROUTE_PATTERN pass from lib/middleware-routes.ts
+ *
+ * Both classifiers are checked to agree on every sample path before timing.
+ * With --module-load, the one-off cost of evaluating jose (now loaded only on
+ * the auth path) is reported as well, when node_modules is installed.
+ *
+ * Usage: node scripts/benchmark_middleware_classifier.js [--iterations 2000000] [--module-load]
+ */
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+
+// Representative traffic mix (locale pages dominate)
+const SAMPLE_PATHS = [
+  '/ko', '/en', '/ko/shop', '/en/shop', '/ko/shop/skt-30day-unlimited', '/en/checkout',
+  '/ko/cart', '/api/products', '/api/products/skt-30day-unlimited', '/api/cart',
+  '/api/cart/batch', '/api/orders', '/api/orders/123', '/api/user/profile',
+  '/wp-admin/', '/wp-login.php', '/wp-content/uploads/2026/01/a.jpg', '/wp-json/wc/v3/products',
+];
+
+function loadRoutePattern() {
+  const source = fs.readFileSync(path.join(ROOT, 'lib', 'middleware-routes.ts'), 'utf8');
+  const match = /^const ROUTE_PATTERN = \/(.+)\/;$/m.exec(source);
+  if (!match) throw new Error('ROUTE_PATTERN not found in lib/middleware-routes.ts');
+  return new RegExp(match[1]);
+}
+
+// Original middleware.ts decision logic
+function classifyBefore(pathname) {
+  if (pathname.startsWith('/api/')) {
+    const protectedPatterns = [
+      /^\/api\/orders\/[^/]+/,
+      /^\/api\/user\/.*/,
+    ];
+    const isProtectedRoute = protectedPatterns.some((pattern) => pattern.test(pathname));
+    return isProtectedRoute ? 'protected-api' : 'public-api';
+  }
+  if (
+    pathname.startsWith('/wp-admin') ||
+    pathname.startsWith('/wp-login') ||
+    pathname.startsWith('/wp-includes') ||
+    pathname.startsWith('/wp-content') ||
+    pathname.startsWith('/wp-json')
+  ) {
+    return 'cms-proxy';
+  }
+  return 'locale';
+}
+
+function makeClassifyAfter(routePattern) {
+  return function classifyAfter(pathname) {
+    const match = routePattern.exec(pathname);
+    if (!match) return 'locale';
+    if (match[1]) return 'protected-api';
+    if (match[2]) return 'public-api';
+    return 'cms-proxy';
+  };
+}
+
+function bench(name, classify, iterations) {
+  let sink = 0;
+  // Warm up the JIT
+  for (let i = 0; i < 100000; i++) sink += classify(SAMPLE_PATHS[i % SAMPLE_PATHS.length]).length;
+
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) {
+    sink += classify(SAMPLE_PATHS[i % SAMPLE_PATHS.length]).length;
+  }
+  const elapsedNs = Number(process.hrtime.bigint() - start);
+  const perRequest = elapsedNs / iterations;
+  console.log(`${name.padEnd(8)} ${perRequest.toFixed(1).padStart(8)} ns/request  (${iterations} requests, sink=${sink % 10})`);
+  return perRequest;
+}
+
+function benchModuleLoad(moduleName) {
+  const start = process.hrtime.bigint();
+  try {
+    require(moduleName);
+  } catch {
+    console.log(`${moduleName}: not installed, skipped`);
+    return;
+  }
+  const ms = Number(process.hrtime.bigint() - start) / 1e6;
+  console.log(`${moduleName}: ${ms.toFixed(2)} ms to evaluate (now paid only on the first auth-path request)`);
+}
+
+function main() {
+  const args = process.argv.slice(2);
+  const iterIndex = args.indexOf('--iterations');
+  const iterations = iterIndex >= 0 ? parseInt(args[iterIndex + 1], 10) : 2000000;
+
+  const classifyAfter = makeClassifyAfter(loadRoutePattern());
+
+  for (const pathname of SAMPLE_PATHS) {
+    const before = classifyBefore(pathname);
+    const after = classifyAfter(pathname);
+    if (before !== after) {
+      console.error(`Mismatch for ${pathname}: before=${before} after=${after}`);
+      process.exit(1);
+    }
+  }
+  console.log(`Classifiers agree on ${SAMPLE_PATHS.length} sample paths\n`);
+
+  const before = bench('before', classifyBefore, iterations);
+  const after = bench('after', classifyAfter, iterations);
+  console.log(`\nSpeedup: ${(before / after).toFixed(2)}x`);
+
+  if (args.includes('--module-load')) {
+    console.log('');
+    benchModuleLoad('jose');
+  }
+}
+
+main();
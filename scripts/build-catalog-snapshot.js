@@ -0,0 +1,132 @@
+/**
+ * Build the catalog snapshot
+ *
+ * Fetches the published catalog from WooCommerce (82m/v1/products, all pages)
+ * and writes lib/generated/catalog-snapshot.json. A cold serverless instance
+ * serves this snapshot for its first /api/products requests while the live
+ * catalog refreshes in the background (see lib/catalog-snapshot.ts).
+ *
+ * Runs automatically before `next build` (see package.json). Credentials come
+ * from the environment or .env files, as for the app. If they are missing or
+ * WooCommerce is unreachable, the build continues without a snapshot and cold
+ * instances fetch the catalog as before.
+ *
+ * Usage: node scripts/build-catalog-snapshot.js
+ */
+const fs = require('fs');
+const http = require('http');
+const https = require('https');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+const OUTPUT = path.join(ROOT, 'lib', 'generated', 'catalog-snapshot.json');
+
+// Load .env* the same way `next build` does (ships with Next.js)
+try {
+  require('@next/env').loadEnvConfig(ROOT);
+} catch {
+  // Environment variables only
+}
+
+const WORDPRESS_URL = process.env.WORDPRESS_URL || 'http://182.162.142.102';
+const WORDPRESS_HOST = process.env.WORDPRESS_HOST || '82mobile.com';
+const WC_CONSUMER_KEY = process.env.WC_CONSUMER_KEY || '';
+const WC_CONSUMER_SECRET = process.env.WC_CONSUMER_SECRET || '';
+
+// Keep in sync with lib/catalog-snapshot.ts and lib/woocommerce.ts
+const SNAPSHOT_VERSION = 1;
+const PRODUCT_LIST_FIELDS = [
+  'id', 'name', 'slug', 'price', 'regular_price', 'categories', 'images',
+  'attributes', 'variations', 'short_description',
+];
+const PAGE_SIZE = 100;
+const MAX_PAGES = 50;
+const TIMEOUT_MS = 20000;
+
+function fetchPage(page, fields) {
+  const params = new URLSearchParams({
+    consumer_key: WC_CONSUMER_KEY,
+    consumer_secret: WC_CONSUMER_SECRET,
+    page: String(page),
+    per_page: String(PAGE_SIZE),
+    status: 'publish',
+  });
+  if (fields) params.set('_fields', fields.join(','));
+  const url = new URL(`${WORDPRESS_URL}/wp-json/82m/v1/products?${params}`);
+  const client = url.protocol === 'https:' ? https : http;
+
+  return new Promise((resolve, reject) => {
+    const req = client.get(url, { headers: { Host: WORDPRESS_HOST }, timeout: TIMEOUT_MS }, (res) => {
+      const chunks = [];
+      res.on('data', (chunk) => chunks.push(chunk));
+      res.on('end', () => {
+        if (res.statusCode !== 200) {
+          reject(new Error(`products page ${page}: HTTP ${res.statusCode}`));
+          return;
+        }
+        try {
+          resolve({
+            products: JSON.parse(Buffer.concat(chunks).toString('utf8')),
+            totalPages: parseInt(res.headers['x-wp-totalpages'] || '', 10) || null,
+          });
+        } catch (error) {
+          reject(error);
+        }
+      });
+    });
+    req.on('timeout', () => req.destroy(new Error(`products page ${page}: timed out`)));
+    req.on('error', reject);
+  });
+}
+
+async function fetchCatalog(fields) {
+  const products = [];
+  const seen = new Set();
+  for (let page = 1; page <= MAX_PAGES; page++) {
+    const result = await fetchPage(page, fields);
+    for (const product of result.products) {
+      if (!seen.has(product.id)) {
+        seen.add(product.id);
+        products.push(product);
+      }
+    }
+    const lastPage = result.totalPages !== null
+      ? page >= result.totalPages
+      : result.products.length < PAGE_SIZE;
+    if (lastPage) break;
+  }
+  return products;
+}
+
+async function main() {
+  if (process.env.CATALOG_SNAPSHOT === 'off') {
+    console.log('Catalog snapshot: disabled (CATALOG_SNAPSHOT=off)');
+    return;
+  }
+  if (!WC_CONSUMER_KEY || !WC_CONSUMER_SECRET) {
+    console.warn('Catalog snapshot: skipped (WC_CONSUMER_KEY / WC_CONSUMER_SECRET not set)');
+    return;
+  }
+
+  // Mirror the runtime projection so the snapshot is accepted at startup
+  const fields = process.env.CATALOG_FIELD_PROJECTION === 'off' ? null : PRODUCT_LIST_FIELDS;
+  const start = Date.now();
+  const products = await fetchCatalog(fields);
+  if (products.length === 0) {
+    console.warn('Catalog snapshot: skipped (WooCommerce returned no products)');
+    return;
+  }
+
+  const snapshot = { version: SNAPSHOT_VERSION, generatedAt: Date.now(), fields, products };
+  fs.mkdirSync(path.dirname(OUTPUT), { recursive: true });
+  fs.writeFileSync(OUTPUT, JSON.stringify(snapshot));
+
+  console.log(
+    `Catalog snapshot: ${products.length} products in ${Date.now() - start}ms -> ${path.relative(ROOT, OUTPUT)}`
+  );
+}
+
+main().catch((error) => {
+  // Never fail the build: runtime falls back to fetching the catalog
+  console.warn(`Catalog snapshot: skipped (${error.message})`);
+});
@@ -0,0 +1,59 @@
+/**
+ * Build the product image variant manifest
+ *
+ * Scans public/images/products and writes lib/generated/image-manifest.json,
+ * listing for each image base name the full-size file and every WordPress
+ * size variant (e.g. name-300x300.jpg) that actually exists on disk.
+ * lib/product-images.ts uses it to map WooCommerce image URLs to local files
+ * without guessing variant names that may 404.
+ *
+ * Runs automatically before `next build` and `next dev` (see package.json).
+ *
+ * Usage: node scripts/build-image-manifest.js
+ */
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+const IMAGE_DIR = path.join(ROOT, 'public', 'images', 'products');
+const OUTPUT = path.join(ROOT, 'lib', 'generated', 'image-manifest.json');
+
+const IMAGE_RE = /^(.+?)(?:-(\d+)x(\d+))?\.(jpe?g|png|webp|avif)$/i;
+
+function buildManifest() {
+  const images = {};
+
+  const files = fs.existsSync(IMAGE_DIR) ? fs.readdirSync(IMAGE_DIR).sort() : [];
+  for (const file of files) {
+    const match = IMAGE_RE.exec(file);
+    if (!match) continue;
+
+    const [, base, width, height, ext] = match;
+    const entry = images[base] || (images[base] = { full: [], variants: [] });
+
+    if (width && height) {
+      entry.variants.push({
+        width: parseInt(width, 10),
+        height: parseInt(height, 10),
+        format: ext.toLowerCase(),
+        file,
+      });
+    } else {
+      entry.full.push({ format: ext.toLowerCase(), file });
+    }
+  }
+
+  for (const entry of Object.values(images)) {
+    entry.variants.sort((a, b) => a.width - b.width || a.file.localeCompare(b.file));
+  }
+
+  return { basePath: '/images/products', images };
+}
+
+const manifest = buildManifest();
+fs.mkdirSync(path.dirname(OUTPUT), { recursive: true });
+fs.writeFileSync(OUTPUT, JSON.stringify(manifest, null, 2) + '\n');
+
+console.log(
+  `Image manifest: ${Object.keys(manifest.images).length} images -> ${path.relative(ROOT, OUTPUT)}`
+);
@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 """Final test of production deployment"""
 
-from playwright.sync_api import sync_playwright
+from e2e_browser import browser_page, pause_for_inspection
 
 URL = "https://82mobile-next.vercel.app"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
+with browser_page() as page:
 
     errors = []
     def handle_console(msg):
@@ -65,9 +63,7 @@ with sync_playwright() as p:
     page.screenshot(path='production_homepage.png', full_page=True)
     print(f"\n📸 Screenshot saved: production_homepage.png")
 
-    print(f"\n⏸️  Browser open for 15s inspection...")
-    page.wait_for_timeout(15000)
-    browser.close()
+    pause_for_inspection()
 
 print("\n" + "="*60)
 print("PRODUCTION TEST COMPLETE")
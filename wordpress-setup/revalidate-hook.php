@@ -0,0 +1,56 @@
+<?php
+/**
+ * Plugin Name: 82mobile Next.js Revalidation Hook
+ * Description: Revalidate statically generated product pages on the Next.js frontend when a product is saved
+ * Version: 1.0.0
+ * Author: Whitehat Marketing
+ *
+ * Requires in wp-config.php:
+ *   define('NEXT_REVALIDATE_URL', 'https://82mobile.com/api/revalidate');
+ *   define('NEXT_REVALIDATE_SECRET', '...'); // same value as REVALIDATE_SECRET on Vercel
+ */
+
+// Prevent direct access
+if (!defined('ABSPATH')) {
+    exit;
+}
+
+/**
+ * POST a signed { id, slug } payload to the Next.js revalidation endpoint
+ *
+ * Signature format matches WooCommerce webhooks:
+ * X-WC-Webhook-Signature: base64(HMAC-SHA256(body, secret))
+ */
+function mobile82_request_revalidation($product_id) {
+    if (!defined('NEXT_REVALIDATE_URL') || !defined('NEXT_REVALIDATE_SECRET')) {
+        return;
+    }
+
+    $product = wc_get_product($product_id);
+    if (!$product) {
+        return;
+    }
+
+    $body = wp_json_encode([
+        'id'   => $product->get_id(),
+        'slug' => $product->get_slug(),
+    ]);
+
+    wp_remote_post(NEXT_REVALIDATE_URL, [
+        'headers'  => [
+            'Content-Type'           => 'application/json',
+            'X-WC-Webhook-Signature' => base64_encode(hash_hmac('sha256', $body, NEXT_REVALIDATE_SECRET, true)),
+        ],
+        'body'     => $body,
+        'timeout'  => 5,
+        'blocking' => false, // Don't slow down wp-admin saves
+    ]);
+}
+
+add_action('woocommerce_new_product', 'mobile82_request_revalidation');
+add_action('woocommerce_update_product', 'mobile82_request_revalidation');
+add_action('wp_trash_post', function($post_id) {
+    if (get_post_type($post_id) === 'product') {
+        mobile82_request_revalidation($post_id);
+    }
+});